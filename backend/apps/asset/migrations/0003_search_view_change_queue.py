@@ -0,0 +1,253 @@
+"""
+搜索视图改为触发器队列 + 批量增量维护
+
+0002 创建的 pg_ivm IMMV 在每次 INSERT/UPDATE 时同步更新全部 GIN 索引，写放大严重。
+本迁移删除 IMMV，改为普通表 + 触发器队列驱动的批量增量维护（trigger-batched IVM）：
+- 原表（website / endpoint）上的语句级触发器只把变更行的主键写入变更队列（ΔT）
+- 定时任务调用 *_apply_changes() 批量消费队列：先删除视图中对应 id 的旧行，
+  再从原表重新投影仍存在的行（ΔV），删除通过"原表中已不存在"自然传播
+- 视图上的 GIN 索引维护从写入热路径移到后台批量刷新，代价是数据有秒级延迟
+  （上限为定时任务的刷新间隔）
+
+说明：
+- 视图表、变更队列、触发器和维护函数在同一个事务中创建（本迁移 atomic），
+  任一步失败整体回滚，不会留下半成品结构；全量投影前先对原表加 SHARE ROW EXCLUSIVE 锁，
+  保证投影快照与触发器生效之间没有漏掉的写入
+- 索引在 0004 中用 CREATE INDEX CONCURRENTLY 创建（需要非事务迁移）
+- pg_ivm 扩展保留，以兼容已有部署的安装检查
+- 数组字段（tech, matched_gf_patterns 等）不在视图中，搜索时通过 JOIN 原表获取：
+  精确匹配用 `t.tech @> ARRAY[...]`（命中原表 GIN(tech) 索引）；
+  tech 模糊匹配用视图中的 tech_concat 文本列（trigram 索引），不再 unnest + ILIKE
+- response_body / response_headers 原文不进入视图（避免重复存储最大的 TOAST 列），
+  视图只投影其 tsvector 列，搜索使用 `*_tsv @@ websearch_to_tsquery('simple', ...)`，
+  原文通过 JOIN 原表获取
+- title / url 额外投影 tsvector 列，作为长查询 ILIKE 之前的预过滤
+"""
+
+from django.db import migrations
+
+
+# 视图中投影的字段（两张原表结构一致）
+# response_body / response_headers 不投影（占行体积的绝大部分），只保留其 tsvector 用于搜索，
+# 原文按 id JOIN 原表获取
+SEARCH_COLUMNS = (
+    'id',
+    'url',
+    'host',
+    'title',
+    'status_code',
+    'content_type',
+    'content_length',
+    'webserver',
+    'location',
+    'vhost',
+    'created_at',
+    'target_id',
+)
+
+# 长文本 tsvector 函数：tsvector 上限是 1MB（按字节），left() 只能按字符截断，多字节内容仍可能超限；
+# 超限报错会让批量刷新整批回滚且该行一直留在队首，因此：
+# - 不超过 256KB 的文本直接计算（strip 后的 tsvector 不会超过输入字节数的 2.5 倍）
+# - 更长的文本截断后在异常块中计算，超限时退回前 64K 字符（最多 256KB），异常块只在长文本上产生子事务
+SEARCH_TSVECTOR_FUNCTION = 'search_text_tsvector'
+SEARCH_TSVECTOR_MAX_BYTES = 262144
+
+# 视图中的派生字段（字段名, 表达式）
+# tsvector 只在批量刷新时计算，不影响原表写入；strip() 去掉位置信息以缩小体积
+# 空内容转为 NULL，配合部分索引不进入 GIN 索引
+SEARCH_DERIVED_COLUMNS = (
+    ('response_body_tsv', f"{SEARCH_TSVECTOR_FUNCTION}(s.response_body)"),
+    ('response_headers_tsv', f"{SEARCH_TSVECTOR_FUNCTION}(s.response_headers)"),
+    # title / url 按非字母数字切词后的 tsvector，供长查询的单词预过滤
+    ('title_tsv',
+     "NULLIF(to_tsvector('simple', regexp_replace(s.title, '[^[:alnum:]]+', ' ', 'g')), ''::tsvector)"),
+    ('url_tsv',
+     "NULLIF(to_tsvector('simple', regexp_replace(s.url, '[^[:alnum:]]+', ' ', 'g')), ''::tsvector)"),
+    # tech 数组拼接为文本（换行分隔，避免跨元素误匹配），供 trigram 模糊搜索
+    ('tech_concat', "array_to_string(s.tech, E'\\n')"),
+)
+
+# 视图的全部字段（用于批量刷新时的 INSERT 列表）
+SEARCH_VIEW_COLUMNS = SEARCH_COLUMNS + tuple(name for name, _ in SEARCH_DERIVED_COLUMNS)
+
+
+def _create_tsvector_function_sql() -> str:
+    """创建长文本 tsvector 函数（超出 tsvector 上限时截断重算，不抛错）"""
+    return f"""
+        CREATE OR REPLACE FUNCTION {SEARCH_TSVECTOR_FUNCTION}(doc text) RETURNS tsvector
+        LANGUAGE plpgsql IMMUTABLE STRICT PARALLEL SAFE AS $fn$
+        BEGIN
+            IF octet_length(doc) <= {SEARCH_TSVECTOR_MAX_BYTES} THEN
+                RETURN NULLIF(strip(to_tsvector('simple', doc)), ''::tsvector);
+            END IF;
+            BEGIN
+                RETURN NULLIF(strip(to_tsvector('simple', left(doc, 1048576))), ''::tsvector);
+            EXCEPTION WHEN program_limit_exceeded THEN
+                RETURN NULLIF(strip(to_tsvector('simple', left(doc, {SEARCH_TSVECTOR_MAX_BYTES} / 4))), ''::tsvector);
+            END;
+        END
+        $fn$;
+    """
+
+
+def _select_sql(table: str) -> str:
+    """从原表投影搜索字段的 SELECT 语句"""
+    columns = ',\n                '.join(
+        [f"s.{col}" for col in SEARCH_COLUMNS]
+        + [f"{expr} AS {name}" for name, expr in SEARCH_DERIVED_COLUMNS]
+    )
+    return f"""
+            SELECT
+                {columns}
+            FROM {table} s
+    """
+
+
+def _create_search_view_sql(view: str, table: str) -> str:
+    """删除 IMMV，创建搜索视图表、变更队列、入队触发器和批量维护函数"""
+    queue = f"{table}_search_changes"
+    columns = ', '.join(SEARCH_VIEW_COLUMNS)
+    return f"""
+        -- 阻塞原表写入直到事务提交：全量投影与触发器创建之间的写入不会丢失（仍可读）
+        LOCK TABLE {table} IN SHARE ROW EXCLUSIVE MODE;
+
+        -- 删除 0002 创建的 IMMV（pg_ivm 随 IMMV 一并删除其在原表上的维护触发器）
+        DROP TABLE IF EXISTS {view};
+
+        -- 搜索视图（普通表，初始数据从原表全量投影）
+        CREATE TABLE {view} AS
+        {_select_sql(table)};
+
+        -- 变更队列：只记录主键和操作类型
+        CREATE TABLE IF NOT EXISTS {queue} (
+            id bigint NOT NULL,
+            op char(1) NOT NULL,
+            ts timestamptz NOT NULL DEFAULT now()
+        );
+        CREATE INDEX IF NOT EXISTS {queue}_ts_idx ON {queue} (ts);
+
+        -- 入队函数：语句级触发器 + 过渡表，一条语句只产生一次批量 INSERT
+        CREATE OR REPLACE FUNCTION {queue}_enqueue() RETURNS trigger
+        LANGUAGE plpgsql AS $fn$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                INSERT INTO {queue} (id, op) SELECT id, 'D' FROM old_rows;
+            ELSE
+                INSERT INTO {queue} (id, op) SELECT id, left(TG_OP, 1) FROM new_rows;
+            END IF;
+            RETURN NULL;
+        END
+        $fn$;
+
+        DROP TRIGGER IF EXISTS {queue}_ins ON {table};
+        CREATE TRIGGER {queue}_ins AFTER INSERT ON {table}
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {queue}_enqueue();
+
+        DROP TRIGGER IF EXISTS {queue}_upd ON {table};
+        CREATE TRIGGER {queue}_upd AFTER UPDATE ON {table}
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {queue}_enqueue();
+
+        DROP TRIGGER IF EXISTS {queue}_del ON {table};
+        CREATE TRIGGER {queue}_del AFTER DELETE ON {table}
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {queue}_enqueue();
+
+        -- 批量维护函数：消费一批队列，返回处理的去重 id 数量
+        CREATE OR REPLACE FUNCTION {view}_apply_changes(batch_limit integer DEFAULT 50000)
+        RETURNS integer
+        LANGUAGE plpgsql AS $fn$
+        DECLARE
+            changed bigint[];
+        BEGIN
+            WITH batch AS (
+                DELETE FROM {queue}
+                WHERE ctid = ANY (ARRAY(
+                    SELECT ctid FROM {queue}
+                    ORDER BY ts
+                    LIMIT batch_limit
+                    FOR UPDATE SKIP LOCKED
+                ))
+                RETURNING id
+            )
+            SELECT array_agg(DISTINCT id) INTO changed FROM batch;
+
+            IF changed IS NULL THEN
+                RETURN 0;
+            END IF;
+
+            -- ΔV：先删旧行，再投影原表中仍存在的行（已删除的行自然消失）
+            DELETE FROM {view} WHERE id = ANY (changed);
+            INSERT INTO {view} ({columns})
+            {_select_sql(table)}
+            WHERE s.id = ANY (changed);
+
+            RETURN cardinality(changed);
+        END
+        $fn$;
+    """
+
+
+def _restore_immv_sql(view: str, table: str) -> str:
+    """回滚：删除队列、触发器、函数和视图表，恢复 0002 的 IMMV 及其索引"""
+    queue = f"{table}_search_changes"
+    return f"""
+        DROP TRIGGER IF EXISTS {queue}_ins ON {table};
+        DROP TRIGGER IF EXISTS {queue}_upd ON {table};
+        DROP TRIGGER IF EXISTS {queue}_del ON {table};
+        DROP FUNCTION IF EXISTS {queue}_enqueue();
+        DROP FUNCTION IF EXISTS {view}_apply_changes(integer);
+        DROP TABLE IF EXISTS {queue};
+        DROP TABLE IF EXISTS {view};
+
+        SELECT pgivm.create_immv('{view}', $$
+            SELECT
+                s.id, s.url, s.host, s.title, s.status_code,
+                s.response_headers, s.response_body, s.content_type, s.content_length,
+                s.webserver, s.location, s.vhost, s.created_at, s.target_id
+            FROM {table} s
+        $$);
+
+        CREATE UNIQUE INDEX IF NOT EXISTS {view}_id_idx ON {view} (id);
+        CREATE INDEX IF NOT EXISTS {view}_host_trgm_idx ON {view} USING gin (host gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS {view}_title_trgm_idx ON {view} USING gin (title gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS {view}_url_trgm_idx ON {view} USING gin (url gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS {view}_headers_trgm_idx ON {view} USING gin (response_headers gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS {view}_body_trgm_idx ON {view} USING gin (response_body gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS {view}_status_idx ON {view} (status_code);
+        CREATE INDEX IF NOT EXISTS {view}_created_idx ON {view} (created_at DESC);
+    """
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asset', '0002_create_search_materialized_view'),
+    ]
+
+    operations = [
+        # 1. 长文本 tsvector 函数（两个视图共用）
+        migrations.RunSQL(
+            sql=_create_tsvector_function_sql(),
+            reverse_sql=f"DROP FUNCTION IF EXISTS {SEARCH_TSVECTOR_FUNCTION}(text);"
+        ),
+
+        # ==================== Website 搜索视图 ====================
+
+        # 2. asset_search_view 改为普通表 + 变更队列、触发器和批量维护函数
+        # ⚠️ 注意：不包含 w.tech 数组字段，通过 search_service.py 中 JOIN website 表获取
+        migrations.RunSQL(
+            sql=_create_search_view_sql('asset_search_view', 'website'),
+            reverse_sql=_restore_immv_sql('asset_search_view', 'website')
+        ),
+
+        # ==================== Endpoint 搜索视图 ====================
+
+        # 3. endpoint_search_view 改为普通表 + 变更队列、触发器和批量维护函数
+        # ⚠️ 注意：不包含 e.tech 和 e.matched_gf_patterns 数组字段，通过 JOIN endpoint 表获取
+        migrations.RunSQL(
+            sql=_create_search_view_sql('endpoint_search_view', 'endpoint'),
+            reverse_sql=_restore_immv_sql('endpoint_search_view', 'endpoint')
+        ),
+    ]
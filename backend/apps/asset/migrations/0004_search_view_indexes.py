@@ -0,0 +1,78 @@
+"""
+创建搜索视图索引
+
+0003 把搜索视图改为普通表后，索引在这里用 CREATE INDEX CONCURRENTLY 逐条创建，
+构建期间不阻塞读写。CONCURRENTLY 不能在事务块中执行，因此本迁移只包含索引，
+单独设置 atomic = False；建表、队列和触发器留在 0003 的事务中。
+
+说明：
+- 视图只由批量刷新写入，GIN 索引关闭 fastupdate，避免 pending list 集中合并带来的抖动
+- response_body / response_headers 不再建 trigram 索引（体积可达表的 1.5~2 倍），
+  只对其 tsvector 列建 GIN 索引
+- tsvector 索引是部分索引（WHERE *_tsv IS NOT NULL），空响应不占索引空间；
+  查询必须带上相同的 IS NOT NULL 条件，否则规划器不会选择部分索引
+"""
+
+from django.db import migrations
+
+
+# 搜索视图索引（索引名后缀, 是否唯一, 索引定义）
+SEARCH_INDEXES = (
+    # 唯一索引
+    ('id_idx', True, "(id)"),
+    # host 模糊搜索索引
+    ('host_trgm_idx', False, "USING gin (host gin_trgm_ops) WITH (fastupdate = off)"),
+    # title 模糊搜索索引
+    ('title_trgm_idx', False, "USING gin (title gin_trgm_ops) WITH (fastupdate = off)"),
+    # url 模糊搜索索引
+    ('url_trgm_idx', False, "USING gin (url gin_trgm_ops) WITH (fastupdate = off)"),
+    # title / url 单词预过滤索引（部分索引，跳过空内容）
+    ('title_tsv_idx', False,
+     "USING gin (title_tsv) WITH (fastupdate = off) WHERE title_tsv IS NOT NULL"),
+    ('url_tsv_idx', False,
+     "USING gin (url_tsv) WITH (fastupdate = off) WHERE url_tsv IS NOT NULL"),
+    # tech 模糊搜索索引
+    ('tech_trgm_idx', False, "USING gin (tech_concat gin_trgm_ops) WITH (fastupdate = off)"),
+    # response_headers 全文搜索索引（部分索引，跳过空内容）
+    ('headers_tsv_idx', False,
+     "USING gin (response_headers_tsv) WITH (fastupdate = off) WHERE response_headers_tsv IS NOT NULL"),
+    # response_body 全文搜索索引（部分索引，跳过空内容）
+    ('body_tsv_idx', False,
+     "USING gin (response_body_tsv) WITH (fastupdate = off) WHERE response_body_tsv IS NOT NULL"),
+    # status_code 索引
+    ('status_idx', False, "(status_code)"),
+    # created_at 排序索引
+    ('created_idx', False, "(created_at DESC)"),
+)
+
+
+def _index_operations(view: str) -> list:
+    """为搜索视图生成索引操作（每个索引单独一条 RunSQL）"""
+    return [
+        migrations.RunSQL(
+            sql=(
+                f"CREATE {'UNIQUE ' if unique else ''}INDEX CONCURRENTLY IF NOT EXISTS "
+                f"{view}_{suffix} ON {view} {definition};"
+            ),
+            reverse_sql=f"DROP INDEX CONCURRENTLY IF EXISTS {view}_{suffix};"
+        )
+        for suffix, unique, definition in SEARCH_INDEXES
+    ]
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY 要求非事务执行
+    atomic = False
+
+    dependencies = [
+        ('asset', '0003_search_view_change_queue'),
+    ]
+
+    operations = [
+        # 1. asset_search_view 索引
+        *_index_operations('asset_search_view'),
+
+        # 2. endpoint_search_view 索引
+        *_index_operations('endpoint_search_view'),
+    ]
@@ -2,7 +2,7 @@
 资产搜索服务
 
 提供资产搜索的核心业务逻辑：
-- 从物化视图查询数据
+- 从搜索视图查询数据（触发器队列批量维护，见 asset 0003 迁移）
 - 支持表达式语法解析
 - 支持 =（模糊）、==（精确）、!=（不等于）操作符
 - 支持 && (AND) 和 || (OR) 逻辑组合
@@ -31,6 +31,32 @@ FIELD_MAPPING = {
 # 数组类型字段
 ARRAY_FIELDS = {'tech'}
 
+# 长查询在 ILIKE 之前加 tsvector 单词预过滤的字段（数据库字段名 -> 视图中的 tsvector 字段名）
+# 匹配结果仍以 ILIKE 子串匹配为准；预过滤只使用查询中两侧都有分隔符的完整单词（精确词）
+# 和前侧有分隔符的末尾单词（前缀词），保证不会漏掉 ILIKE 能匹配的行（"dmin" 仍能匹配 "admin"）
+# 短查询和非 ASCII 查询（中文等，simple 配置不分词）只走 trigram ILIKE
+WORD_SEARCH_FIELDS = {
+    'title': 'title_tsv',
+    'url': 'url_tsv',
+}
+WORD_SEARCH_MIN_LENGTH = 4
+WORD_PATTERN = re.compile(r'[A-Za-z0-9]+')
+
+# 只存在于原表的字段（视图中只有其 tsvector，原文从原表 t 获取）
+TABLE_ONLY_FIELDS = {'response_body', 'response_headers'}
+
+# 数组字段在视图中的拼接文本列（模糊匹配走 trigram 索引）
+ARRAY_CONCAT_FIELDS = {
+    'tech': 'tech_concat',
+}
+
+# 全文搜索字段（数据库字段名 -> 视图中的 tsvector 字段名）
+# 长文本不建 trigram 索引，模糊匹配走 tsvector GIN 部分索引（WHERE *_tsv IS NOT NULL）
+TSVECTOR_FIELDS = {
+    'response_body': 'response_body_tsv',
+    'response_headers': 'response_headers_tsv',
+}
+
 # 资产类型到视图名的映射
 VIEW_MAPPING = {
     'website': 'asset_search_view',
@@ -38,7 +64,7 @@ VIEW_MAPPING = {
 }
 
 # 资产类型到原表名的映射（用于 JOIN 获取数组字段）
-# ⚠️ 重要：pg_ivm 不支持 ArrayField，所有数组字段必须从原表 JOIN 获取
+# ⚠️ 重要：搜索视图不包含 ArrayField，所有数组字段必须从原表 JOIN 获取
 TABLE_MAPPING = {
     'website': 'website',
     'endpoint': 'endpoint',
@@ -47,8 +73,11 @@ TABLE_MAPPING = {
 # 有效的资产类型
 VALID_ASSET_TYPES = {'website', 'endpoint'}
 
+# 每次消费搜索视图变更队列的最大条数
+SEARCH_VIEW_APPLY_BATCH = 50000
+
 # Website 查询字段（v=视图，t=原表）
-# ⚠️ 注意：t.tech 从原表获取，因为 pg_ivm 不支持 ArrayField
+# ⚠️ 注意：t.tech 从原表获取，搜索视图不包含 ArrayField
 WEBSITE_SELECT_FIELDS = """
     v.id,
     v.url,
@@ -56,8 +85,8 @@ WEBSITE_SELECT_FIELDS = """
     v.title,
     t.tech,  -- ArrayField，从 website 表 JOIN 获取
     v.status_code,
-    v.response_headers,
-    v.response_body,
+    t.response_headers,  -- 视图不存原文，从原表 JOIN 获取
+    t.response_body,  -- 视图不存原文，从原表 JOIN 获取
     v.content_type,
     v.content_length,
     v.webserver,
@@ -68,7 +97,7 @@ WEBSITE_SELECT_FIELDS = """
 """
 
 # Endpoint 查询字段
-# ⚠️ 注意：t.tech 和 t.matched_gf_patterns 从原表获取，因为 pg_ivm 不支持 ArrayField
+# ⚠️ 注意：t.tech 和 t.matched_gf_patterns 从原表获取，搜索视图不包含 ArrayField
 ENDPOINT_SELECT_FIELDS = """
     v.id,
     v.url,
@@ -76,8 +105,8 @@ ENDPOINT_SELECT_FIELDS = """
     v.title,
     t.tech,  -- ArrayField，从 endpoint 表 JOIN 获取
     v.status_code,
-    v.response_headers,
-    v.response_body,
+    t.response_headers,  -- 视图不存原文，从原表 JOIN 获取
+    t.response_body,  -- 视图不存原文，从原表 JOIN 获取
     v.content_type,
     v.content_length,
     v.webserver,
@@ -94,7 +123,7 @@ class SearchQueryParser:
     搜索查询解析器
     
     支持语法：
-    - field="value"     模糊匹配（ILIKE %value%）
+    - field="value"     模糊匹配（ILIKE %value%；body/header 为全文搜索）
     - field=="value"    精确匹配
     - field!="value"    不等于
     - &&                AND 连接
@@ -282,23 +311,63 @@ class SearchQueryParser:
     def _build_like_condition(cls, field: str, value: str, is_array: bool) -> Tuple[str, List[Any]]:
         """构建模糊匹配条件"""
         if is_array:
-            # 数组字段：检查数组中是否有元素包含该值（从原表 t 获取）
+            # 数组字段：在视图的拼接文本列上模糊匹配（命中 trigram 索引）
+            if field in ARRAY_CONCAT_FIELDS:
+                return f"v.{ARRAY_CONCAT_FIELDS[field]} ILIKE %s", [f"%{value}%"]
+            # 没有拼接列的数组字段：检查数组中是否有元素包含该值（从原表 t 获取）
             return f"EXISTS (SELECT 1 FROM unnest(t.{field}) AS elem WHERE elem ILIKE %s)", [f"%{value}%"]
+        elif field in TSVECTOR_FIELDS:
+            # 长文本字段：tsvector 全文搜索，带上部分索引的谓词以命中 GIN 索引
+            tsv_field = TSVECTOR_FIELDS[field]
+            return (
+                f"(v.{tsv_field} IS NOT NULL AND v.{tsv_field} @@ websearch_to_tsquery('simple', %s))",
+                [value]
+            )
         elif field == 'status_code':
             # 状态码是整数，模糊匹配转为精确匹配
             try:
                 return f"v.{field} = %s", [int(value)]
             except ValueError:
                 return f"v.{field}::text ILIKE %s", [f"%{value}%"]
-        else:
-            return f"v.{field} ILIKE %s", [f"%{value}%"]
+        
+        if field in WORD_SEARCH_FIELDS and len(value) >= WORD_SEARCH_MIN_LENGTH and value.isascii():
+            tsquery = cls._build_word_prefilter(value)
+            if tsquery:
+                # 长查询：tsvector GIN 部分索引缩小候选集，ILIKE 保证子串匹配语义不变
+                tsv_field = WORD_SEARCH_FIELDS[field]
+                return (
+                    f"(v.{tsv_field} IS NOT NULL AND v.{tsv_field} @@ to_tsquery('simple', %s)"
+                    f" AND v.{field} ILIKE %s)",
+                    [tsquery, f"%{value}%"]
+                )
+        return f"v.{field} ILIKE %s", [f"%{value}%"]
+    
+    @staticmethod
+    def _build_word_prefilter(value: str) -> Optional[str]:
+        """
+        构建子串匹配的 tsquery 预过滤条件
+        
+        子串两端的单词可能只是原文单词的一部分，只有能确定边界的单词才能用于预过滤：
+        - 两侧都有分隔符：原文中一定是完整单词，精确匹配
+        - 只有前侧有分隔符：原文中一定以它开头，前缀匹配
+        
+        Returns:
+            tsquery 字符串；没有可用单词时返回 None
+        """
+        terms = []
+        for match in WORD_PATTERN.finditer(value):
+            if match.start() == 0:
+                continue
+            word = match.group().lower()
+            terms.append(word if match.end() < len(value) else f"{word}:*")
+        return ' & '.join(terms) or None
     
     @classmethod
     def _build_exact_condition(cls, field: str, value: str, is_array: bool) -> Tuple[str, List[Any]]:
         """构建精确匹配条件"""
         if is_array:
-            # 数组字段：检查数组中是否包含该精确值（从原表 t 获取）
-            return f"%s = ANY(t.{field})", [value]
+            # 数组字段：数组包含运算符 @>，可命中原表 GIN(tech) 索引（= ANY 不能用索引）
+            return f"t.{field} @> ARRAY[%s]::varchar[]", [value]
         elif field == 'status_code':
             # 状态码是整数
             try:
@@ -306,21 +375,27 @@ class SearchQueryParser:
             except ValueError:
                 return f"v.{field}::text = %s", [value]
         else:
-            return f"v.{field} = %s", [value]
+            return f"{cls._column(field)} = %s", [value]
     
     @classmethod
     def _build_not_equal_condition(cls, field: str, value: str, is_array: bool) -> Tuple[str, List[Any]]:
         """构建不等于条件"""
         if is_array:
             # 数组字段：检查数组中不包含该值（从原表 t 获取）
-            return f"NOT (%s = ANY(t.{field}))", [value]
+            return f"NOT (t.{field} @> ARRAY[%s]::varchar[])", [value]
         elif field == 'status_code':
             try:
                 return f"(v.{field} IS NULL OR v.{field} != %s)", [int(value)]
             except ValueError:
                 return f"(v.{field} IS NULL OR v.{field}::text != %s)", [value]
         else:
-            return f"(v.{field} IS NULL OR v.{field} != %s)", [value]
+            column = cls._column(field)
+            return f"({column} IS NULL OR {column} != %s)", [value]
+
+    @staticmethod
+    def _column(field: str) -> str:
+        """字段的 SQL 列引用（视图 v 或原表 t）"""
+        return f"t.{field}" if field in TABLE_ONLY_FIELDS else f"v.{field}"
 
 
 AssetType = Literal['website', 'endpoint']
@@ -475,3 +550,30 @@ class AssetSearchService:
         except Exception as e:
             logger.error(f"流式搜索查询失败: {e}, SQL: {sql}, params: {params}")
             raise
+
+    def apply_pending_changes(self, batch_limit: int = SEARCH_VIEW_APPLY_BATCH) -> int:
+        """
+        批量消费搜索视图变更队列（由定时任务调用）
+        
+        每个视图循环调用 {view}_apply_changes()，直到队列为空。
+        
+        Args:
+            batch_limit: 每批消费的队列条数
+        
+        Returns:
+            int: 本次刷新的记录数
+        """
+        total = 0
+        try:
+            with connection.cursor() as cursor:
+                for view_name in VIEW_MAPPING.values():
+                    while True:
+                        cursor.execute(f"SELECT {view_name}_apply_changes(%s)", [batch_limit])
+                        applied = cursor.fetchone()[0]
+                        if not applied:
+                            break
+                        total += applied
+            return total
+        except Exception as e:
+            logger.error(f"搜索视图增量刷新失败: {e}")
+            raise
@@ -0,0 +1,43 @@
+"""
+自定义 DRF 渲染器
+
+CamelCaseORJSONRenderer：snake_case → camelCase 转换 + orjson 编码
+- 替代 djangorestframework_camel_case 的 CamelCaseJSONRenderer（其 RENDERER_CLASS 配置只允许白名单类）
+- orjson 在 C 层直接输出 UTF-8 bytes，列表/导入结果等大响应的编码开销显著降低
+- orjson 不支持的类型（Decimal、惰性翻译字符串、QuerySet 等）回退到 DRF 的 JSONEncoder.default
+"""
+import orjson
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import camelize
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# orjson 选项：datetime 的 UTC 时区输出为 Z（与 DRF 一致），允许非字符串 key（与 json 模块一致）
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+_fallback_encoder = JSONEncoder()
+
+
+class CamelCaseORJSONRenderer(JSONRenderer):
+    """camelCase 转换 + orjson 编码的 JSON 渲染器"""
+
+    json_underscoreize = api_settings.JSON_UNDERSCOREIZE
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        option = ORJSON_OPTIONS
+        if self.get_indent(accepted_media_type, renderer_context):
+            option |= orjson.OPT_INDENT_2
+
+        ret = orjson.dumps(
+            camelize(data, **self.json_underscoreize),
+            default=_fallback_encoder.default,
+            option=option,
+        )
+        # 与 DRF 一致：转义 U+2028/U+2029，保证输出是合法的 JavaScript 子集
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
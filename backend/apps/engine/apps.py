@@ -9,13 +9,20 @@ class EngineConfig(AppConfig):
     
     def ready(self):
         """应用就绪时启动定时调度器"""
-        # 只在主进程中启动调度器（避免 autoreload 重复启动）
-        # 检查是否在 runserver 的 autoreload 子进程中
-        if os.environ.get('RUN_MAIN') == 'true' or not self._is_runserver():
+        # 只在服务进程中启动调度器，manage.py 一次性命令（migrate、init_* 等）不启动：
+        # - ASGI 入口（config/asgi.py）设置 XINGRIN_START_SCHEDULER=1
+        # - runserver 只在 autoreload 子进程中启动（避免重复启动）
+        if self._is_server_process():
             # 只在 Server 容器中启动调度器（Worker 容器不需要）
             if not os.environ.get('SERVER_URL'):  # Worker 容器有 SERVER_URL
                 self._start_scheduler()
     
+    def _is_server_process(self):
+        """检查当前进程是否为 Web 服务进程"""
+        if os.environ.get('XINGRIN_START_SCHEDULER') == '1':
+            return True
+        return self._is_runserver() and os.environ.get('RUN_MAIN') == 'true'
+    
     def _is_runserver(self):
         """检查是否通过 runserver 启动"""
         import sys
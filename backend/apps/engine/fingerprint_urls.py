@@ -0,0 +1,31 @@
+"""指纹管理路由
+
+单独的 URLconf，由 apps.engine.urls 以字符串形式 include，
+指纹 ViewSet / Service / Serializer（含 PyYAML、ijson 等依赖）只在首次解析 URL 时导入
+"""
+
+from django.urls import path, include
+from rest_framework.routers import SimpleRouter
+
+from .views.fingerprints import (
+    EholeFingerprintViewSet,
+    GobyFingerprintViewSet,
+    WappalyzerFingerprintViewSet,
+    FingersFingerprintViewSet,
+    FingerPrintHubFingerprintViewSet,
+    ARLFingerprintViewSet,
+)
+
+
+# 创建路由器（SimpleRouter：不生成额外的 api-root 视图）
+router = SimpleRouter()
+router.register(r"ehole", EholeFingerprintViewSet, basename="ehole-fingerprint")
+router.register(r"goby", GobyFingerprintViewSet, basename="goby-fingerprint")
+router.register(r"wappalyzer", WappalyzerFingerprintViewSet, basename="wappalyzer-fingerprint")
+router.register(r"fingers", FingersFingerprintViewSet, basename="fingers-fingerprint")
+router.register(r"fingerprinthub", FingerPrintHubFingerprintViewSet, basename="fingerprinthub-fingerprint")
+router.register(r"arl", ARLFingerprintViewSet, basename="arl-fingerprint")
+
+urlpatterns = [
+    path("", include(router.urls)),
+]
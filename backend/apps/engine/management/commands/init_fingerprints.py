@@ -8,15 +8,28 @@
 - ARL 指纹: ARL.yaml -> 导入到数据库
 
 可重复执行：如果数据库已有数据则跳过，只在空库时导入。
+
+导入使用 PostgreSQL COPY（Service.bulk_copy_fingerprints），失败时回退到逐批 bulk_create。
+
+JSON 解析：小文件用 orjson 一次性解析（更快），超过阈值的大文件用 ijson 流式解析，
+边解析边分批入库，内存占用与文件大小无关。
+
+各类型指纹写入不同的表，互不依赖，使用多进程并行导入，总耗时约为最慢的单个类型。
 """
 
-import json
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import ijson
+import orjson
 import yaml
+from yaml import CSafeLoader  # 强制使用 libyaml C 加载器，缺失时导入即失败，避免静默回退到纯 Python
 from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connections, transaction
 
 from apps.engine.models import (
     EholeFingerprint,
@@ -38,6 +51,9 @@ from apps.engine.services.fingerprints import (
 
 logger = logging.getLogger(__name__)
 
+# 超过该大小的 JSON 文件使用 ijson 流式解析，否则用 orjson 一次性解析
+JSON_STREAM_THRESHOLD = 16 * 1024 * 1024
+
 
 # 内置指纹配置
 DEFAULT_FINGERPRINTS = [
@@ -92,114 +108,158 @@ DEFAULT_FINGERPRINTS = [
 ]
 
 
+def _init_fingerprint_type(item, fingerprints_dir):
+    """
+    导入单个类型的内置指纹（在子进程中执行）
+    
+    Returns:
+        tuple: (结果, 输出样式, 消息)，结果为 initialized / skipped / failed
+    """
+    fp_type = item["type"]
+    model = item["model"]
+    service_class = item["service"]
+    data_key = item["data_key"]
+    file_format = item.get("file_format", "json")
+
+    # 检查数据库是否已有数据（EXISTS 只取一行，无需 COUNT 全表）
+    if model.objects.exists():
+        return "skipped", "SUCCESS", f"[{fp_type}] 数据库已有数据，跳过初始化"
+
+    # 查找源文件
+    src_path = Path(fingerprints_dir) / item["filename"]
+    if not src_path.exists():
+        return "failed", "WARNING", f"[{fp_type}] 未找到内置指纹文件: {src_path}，跳过"
+
+    # 流式解析并分批导入（支持 JSON 和 YAML），失败时整体回滚
+    try:
+        service = service_class()
+        with transaction.atomic():
+            try:
+                # 优先 COPY 导入，失败时回滚到保存点并回退到 Service 逐批导入
+                with transaction.atomic():
+                    result = service.bulk_copy_fingerprints(
+                        _extract_fingerprints(src_path, data_key, file_format)
+                    )
+            except DatabaseError as exc:
+                logger.warning("[%s] COPY 导入失败，回退到逐批导入: %s", fp_type, exc)
+                result = service.batch_create_fingerprints(
+                    _extract_fingerprints(src_path, data_key, file_format)
+                )
+    except (ijson.JSONError, orjson.JSONDecodeError, yaml.YAMLError, OSError) as exc:
+        return "failed", "ERROR", f"[{fp_type}] 读取指纹文件失败: {exc}"
+    except Exception as exc:
+        return "failed", "ERROR", f"[{fp_type}] 导入失败: {exc}"
+    finally:
+        connections.close_all()
+
+    created = result.get("created", 0)
+    failed_count = result.get("failed", 0)
+    if not created and not failed_count:
+        return "failed", "WARNING", f"[{fp_type}] 指纹文件中没有有效数据，跳过"
+
+    return "initialized", "SUCCESS", f"[{fp_type}] 导入成功: 创建 {created} 条，失败 {failed_count} 条"
+
+
+def _extract_fingerprints(src_path, data_key, file_format):
+    """
+    根据不同格式逐条产出指纹数据（生成器）
+    
+    - YAML（ARL）：CSafeLoader 整体解析
+    - JSON 小文件：orjson 一次性解析
+    - JSON 大文件：ijson 流式解析
+    """
+    if file_format == "yaml":
+        with open(src_path, "r", encoding="utf-8") as f:
+            yield from _iter_entries(yaml.load(f, Loader=CSafeLoader), data_key)
+        return
+
+    if src_path.stat().st_size <= JSON_STREAM_THRESHOLD:
+        yield from _iter_entries(orjson.loads(src_path.read_bytes()), data_key)
+        return
+
+    if data_key == "apps":
+        # Wappalyzer 对象格式，兼容 apps / technologies 两种 key
+        for key in ("apps", "technologies"):
+            found = False
+            with open(src_path, "rb") as f:
+                for name, data in ijson.kvitems(f, key, use_float=True):
+                    found = True
+                    yield _named_entry(name, data)
+            if found:
+                return
+        return
+
+    # 数组格式：直接使用整个 JSON 或从指定 key 获取
+    prefix = "item" if data_key is None else f"{data_key}.item"
+    with open(src_path, "rb") as f:
+        yield from ijson.items(f, prefix, use_float=True)
+
+
+def _iter_entries(json_data, data_key):
+    """
+    从已解析的数据中逐条产出指纹，兼容数组和对象两种格式
+    
+    支持的格式：
+    - 数组格式: [...] 或 {"key": [...]}
+    - 对象格式: {...} 或 {"key": {...}} -> 转换为 {"name": k, ...v}
+    """
+    # 获取目标数据
+    if data_key is None:
+        # 直接使用整个 JSON
+        target = json_data
+    elif data_key == "apps":
+        # 支持多个可能的 key（如 apps/technologies）
+        target = json_data.get("apps") or json_data.get("technologies") or {}
+    else:
+        target = json_data.get(data_key, [])
+
+    # 根据数据类型处理
+    if isinstance(target, list):
+        yield from target
+    elif isinstance(target, dict):
+        for name, data in target.items():
+            yield _named_entry(name, data)
+
+
+def _named_entry(name, data):
+    """对象格式条目转为 {"name": k, ...v}，原地补上 name，不复制 dict（data 为刚解析出的独占对象）
+
+    与 {"name": k, **v} 语义一致：条目自带 name 字段时保留条目内的值
+    """
+    if isinstance(data, dict):
+        data.setdefault("name", name)
+        return data
+    return {"name": name}
+
+
 class Command(BaseCommand):
     help = "初始化内置指纹库"
 
     def handle(self, *args, **options):
         project_base = Path(settings.BASE_DIR).parent  # /app/backend -> /app
-        fingerprints_dir = project_base / "backend" / "fingerprints"
-
-        initialized = 0
-        skipped = 0
-        failed = 0
-
-        for item in DEFAULT_FINGERPRINTS:
-            fp_type = item["type"]
-            filename = item["filename"]
-            model = item["model"]
-            service_class = item["service"]
-            data_key = item["data_key"]
-            file_format = item.get("file_format", "json")
-
-            # 检查数据库是否已有数据
-            existing_count = model.objects.count()
-            if existing_count > 0:
-                self.stdout.write(self.style.SUCCESS(
-                    f"[{fp_type}] 数据库已有 {existing_count} 条记录，跳过初始化"
-                ))
-                skipped += 1
-                continue
-
-            # 查找源文件
-            src_path = fingerprints_dir / filename
-            if not src_path.exists():
-                self.stdout.write(self.style.WARNING(
-                    f"[{fp_type}] 未找到内置指纹文件: {src_path}，跳过"
-                ))
-                failed += 1
-                continue
-
-            # 读取并解析文件（支持 JSON 和 YAML）
-            try:
-                with open(src_path, "r", encoding="utf-8") as f:
-                    if file_format == "yaml":
-                        file_data = yaml.safe_load(f)
-                    else:
-                        file_data = json.load(f)
-            except (json.JSONDecodeError, yaml.YAMLError, OSError) as exc:
-                self.stdout.write(self.style.ERROR(
-                    f"[{fp_type}] 读取指纹文件失败: {exc}"
-                ))
-                failed += 1
-                continue
-
-            # 提取指纹数据（根据不同格式处理）
-            fingerprints = self._extract_fingerprints(file_data, data_key, fp_type)
-            if not fingerprints:
-                self.stdout.write(self.style.WARNING(
-                    f"[{fp_type}] 指纹文件中没有有效数据，跳过"
-                ))
-                failed += 1
-                continue
-
-            # 使用 Service 批量导入
-            try:
-                service = service_class()
-                result = service.batch_create_fingerprints(fingerprints)
-                created = result.get("created", 0)
-                failed_count = result.get("failed", 0)
-
-                self.stdout.write(self.style.SUCCESS(
-                    f"[{fp_type}] 导入成功: 创建 {created} 条，失败 {failed_count} 条"
-                ))
-                initialized += 1
-            except Exception as exc:
-                self.stdout.write(self.style.ERROR(
-                    f"[{fp_type}] 导入失败: {exc}"
-                ))
-                failed += 1
-                continue
+        fingerprints_dir = str(project_base / "backend" / "fingerprints")
+
+        counts = {"initialized": 0, "skipped": 0, "failed": 0}
+
+        # fork 前关闭父进程的数据库连接，子进程各自建立连接
+        # 使用 fork 启动方式：子进程继承已完成的 django.setup()
+        connections.close_all()
+        max_workers = min(len(DEFAULT_FINGERPRINTS), os.cpu_count() or 1)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("fork"),
+        ) as executor:
+            futures = [
+                executor.submit(_init_fingerprint_type, item, fingerprints_dir)
+                for item in DEFAULT_FINGERPRINTS
+            ]
+            # 按配置顺序输出结果
+            for future in futures:
+                outcome, level, message = future.result()
+                counts[outcome] += 1
+                self.stdout.write(getattr(self.style, level)(message))
 
         self.stdout.write(self.style.SUCCESS(
-            f"指纹初始化完成: 成功 {initialized}, 已存在跳过 {skipped}, 失败 {failed}"
+            f"指纹初始化完成: 成功 {counts['initialized']}, "
+            f"已存在跳过 {counts['skipped']}, 失败 {counts['failed']}"
         ))
-
-    def _extract_fingerprints(self, json_data, data_key, fp_type):
-        """
-        根据不同格式提取指纹数据，兼容数组和对象两种格式
-        
-        支持的格式：
-        - 数组格式: [...] 或 {"key": [...]}
-        - 对象格式: {...} 或 {"key": {...}} -> 转换为 [{"name": k, ...v}]
-        """
-        # 获取目标数据
-        if data_key is None:
-            # 直接使用整个 JSON
-            target = json_data
-        else:
-            # 从指定 key 获取，支持多个可能的 key（如 apps/technologies）
-            if data_key == "apps":
-                target = json_data.get("apps") or json_data.get("technologies") or {}
-            else:
-                target = json_data.get(data_key, [])
-        
-        # 根据数据类型处理
-        if isinstance(target, list):
-            # 已经是数组格式，直接返回
-            return target
-        elif isinstance(target, dict):
-            # 对象格式，转换为数组 [{"name": key, ...value}]
-            return [{"name": name, **data} if isinstance(data, dict) else {"name": name}
-                    for name, data in target.items()]
-        
-        return []
@@ -89,7 +89,15 @@ def _register_scheduled_jobs(scheduler: BackgroundScheduler):
     )
     logger.info("  - 已注册: 扫描结果清理（每天 03:00）")
     
-    # 注意：搜索物化视图刷新已迁移到 pg_ivm 增量维护，无需定时任务
+    # 4. 搜索视图增量刷新（消费触发器写入的变更队列）
+    scheduler.add_job(
+        _trigger_search_view_refresh,
+        trigger=IntervalTrigger(seconds=10),
+        id='search_view_refresh',
+        name='搜索视图增量刷新',
+        replace_existing=True,
+    )
+    logger.info("  - 已注册: 搜索视图增量刷新（每10秒）")
 
 
 def _trigger_scheduled_scans():
@@ -121,6 +129,20 @@ def _trigger_statistics_refresh():
         logger.error(f"资产统计刷新失败: {e}", exc_info=True)
 
 
+def _trigger_search_view_refresh():
+    """触发搜索视图增量刷新"""
+    try:
+        from apps.asset.services.search_service import AssetSearchService
+        
+        applied = AssetSearchService().apply_pending_changes()
+        
+        if applied > 0:
+            logger.debug(f"搜索视图增量刷新: {applied} 条记录")
+        
+    except Exception as e:
+        logger.error(f"搜索视图增量刷新失败: {e}", exc_info=True)
+
+
 def _trigger_cleanup():
     """触发扫描结果清理（分发到各 Worker）"""
     try:
@@ -4,6 +4,8 @@ from rest_framework import serializers
 
 from apps.engine.models import ARLFingerprint
 
+from .validators import validate_non_blank
+
 
 class ARLFingerprintSerializer(serializers.ModelSerializer):
     """ARL 指纹序列化器
@@ -20,12 +22,8 @@ class ARLFingerprintSerializer(serializers.ModelSerializer):
     
     def validate_name(self, value):
         """校验 name 字段"""
-        if not value or not value.strip():
-            raise serializers.ValidationError("name 字段不能为空")
-        return value.strip()
+        return validate_non_blank(value, 'name')
     
     def validate_rule(self, value):
         """校验 rule 字段"""
-        if not value or not value.strip():
-            raise serializers.ValidationError("rule 字段不能为空")
-        return value.strip()
+        return validate_non_blank(value, 'rule')
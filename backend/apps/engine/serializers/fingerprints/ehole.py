@@ -4,6 +4,8 @@ from rest_framework import serializers
 
 from apps.engine.models import EholeFingerprint
 
+from .validators import validate_non_blank
+
 
 class EholeFingerprintSerializer(serializers.ModelSerializer):
     """EHole 指纹序列化器"""
@@ -16,9 +18,7 @@ class EholeFingerprintSerializer(serializers.ModelSerializer):
     
     def validate_cms(self, value):
         """校验 cms 字段"""
-        if not value or not value.strip():
-            raise serializers.ValidationError("cms 字段不能为空")
-        return value.strip()
+        return validate_non_blank(value, 'cms')
     
     def validate_keyword(self, value):
         """校验 keyword 字段"""
@@ -4,6 +4,8 @@ from rest_framework import serializers
 
 from apps.engine.models import FingerPrintHubFingerprint
 
+from .validators import validate_non_blank
+
 
 class FingerPrintHubFingerprintSerializer(serializers.ModelSerializer):
     """FingerPrintHub 指纹序列化器
@@ -27,15 +29,11 @@ class FingerPrintHubFingerprintSerializer(serializers.ModelSerializer):
     
     def validate_fp_id(self, value):
         """校验 fp_id 字段"""
-        if not value or not value.strip():
-            raise serializers.ValidationError("fp_id 字段不能为空")
-        return value.strip()
+        return validate_non_blank(value, 'fp_id')
     
     def validate_name(self, value):
         """校验 name 字段"""
-        if not value or not value.strip():
-            raise serializers.ValidationError("name 字段不能为空")
-        return value.strip()
+        return validate_non_blank(value, 'name')
     
     def validate_http(self, value):
         """校验 http 字段"""
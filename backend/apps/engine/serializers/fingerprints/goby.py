@@ -4,6 +4,8 @@ from rest_framework import serializers
 
 from apps.engine.models import GobyFingerprint
 
+from .validators import validate_non_blank
+
 
 class GobyFingerprintSerializer(serializers.ModelSerializer):
     """Goby 指纹序列化器"""
@@ -15,9 +17,7 @@ class GobyFingerprintSerializer(serializers.ModelSerializer):
     
     def validate_name(self, value):
         """校验 name 字段"""
-        if not value or not value.strip():
-            raise serializers.ValidationError("name 字段不能为空")
-        return value.strip()
+        return validate_non_blank(value, 'name')
     
     def validate_rule(self, value):
         """校验 rule 字段"""
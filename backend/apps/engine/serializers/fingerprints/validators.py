@@ -0,0 +1,23 @@
+"""指纹 Serializer 公共校验函数"""
+
+from rest_framework import serializers
+
+
+def validate_non_blank(value, field: str) -> str:
+    """
+    校验字符串字段非空，返回去除首尾空白后的值（只 strip 一次）
+    
+    Args:
+        value: 字段值
+        field: 字段名（用于错误信息）
+        
+    Returns:
+        str: strip 后的值
+        
+    Raises:
+        serializers.ValidationError: 值为空或只包含空白
+    """
+    stripped = value.strip() if value else ''
+    if not stripped:
+        raise serializers.ValidationError(f"{field} 字段不能为空")
+    return stripped
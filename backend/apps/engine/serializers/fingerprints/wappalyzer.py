@@ -4,6 +4,8 @@ from rest_framework import serializers
 
 from apps.engine.models import WappalyzerFingerprint
 
+from .validators import validate_non_blank
+
 
 class WappalyzerFingerprintSerializer(serializers.ModelSerializer):
     """Wappalyzer 指纹序列化器"""
@@ -19,6 +21,4 @@ class WappalyzerFingerprintSerializer(serializers.ModelSerializer):
     
     def validate_name(self, value):
         """校验 name 字段"""
-        if not value or not value.strip():
-            raise serializers.ValidationError("name 字段不能为空")
-        return value.strip()
+        return validate_non_blank(value, 'name')
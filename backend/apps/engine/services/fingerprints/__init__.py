@@ -3,7 +3,7 @@
 导出所有指纹相关的 Service 类
 """
 
-from .base import BaseFingerprintService
+from .base import BaseFingerprintService, get_fingerprint_versions
 from .ehole import EholeFingerprintService
 from .goby import GobyFingerprintService
 from .wappalyzer import WappalyzerFingerprintService
@@ -19,4 +19,5 @@ __all__ = [
     "FingersFingerprintService",
     "FingerPrintHubFingerprintService",
     "ARLFingerprintService",
+    "get_fingerprint_versions",
 ]
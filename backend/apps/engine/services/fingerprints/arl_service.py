@@ -5,18 +5,33 @@
 """
 
 import logging
+from itertools import islice
+from typing import Iterator
+
 import yaml
 
 from apps.engine.models import ARLFingerprint
-from .base import BaseFingerprintService
+from .base import BaseFingerprintService, is_non_blank, to_stripped_str
 
 logger = logging.getLogger(__name__)
 
+# 优先使用 libyaml C 实现（PyYAML 官方 wheel 自带），不可用时回退到纯 Python 实现
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+def _dump_yaml_batch(batch: list) -> str:
+    """把一批指纹 dump 为 YAML 块序列（C Dumper 一次生成整批文本）"""
+    return yaml.dump(
+        batch, Dumper=YAML_DUMPER, allow_unicode=True, default_flow_style=False, sort_keys=False
+    )
+
 
 class ARLFingerprintService(BaseFingerprintService):
     """ARL 指纹管理服务（继承基类，实现 ARL 特定逻辑）"""
     
     model = ARLFingerprint
+    EXPORT_FIELDS = ('name', 'rule')
     
     def validate_fingerprint(self, item: dict) -> bool:
         """
@@ -32,9 +47,8 @@ class ARLFingerprintService(BaseFingerprintService):
         Returns:
             bool: 是否有效
         """
-        name = item.get('name', '')
-        rule = item.get('rule', '')
-        return bool(name and str(name).strip()) and bool(rule and str(rule).strip())
+        get = item.get
+        return is_non_blank(get('name')) and is_non_blank(get('rule'))
     
     def to_model_data(self, item: dict) -> dict:
         """
@@ -47,8 +61,8 @@ class ARLFingerprintService(BaseFingerprintService):
             dict: Model 字段数据
         """
         return {
-            'name': str(item.get('name', '')).strip(),
-            'rule': str(item.get('rule', '')).strip(),
+            'name': to_stripped_str(item.get('name')),
+            'rule': to_stripped_str(item.get('rule')),
         }
     
     def get_export_data(self) -> list:
@@ -62,18 +76,37 @@ class ARLFingerprintService(BaseFingerprintService):
                 ...
             ]
         """
-        fingerprints = self.model.objects.all()
-        return [
-            {
-                'name': fp.name,
-                'rule': fp.rule,
-            }
-            for fp in fingerprints
-        ]
+        return [row for batch in self._iter_export_batches() for row in batch]
+    
+    def _iter_export_batches(self) -> Iterator[list]:
+        """按批读取导出数据"""
+        rows = self.iter_export_rows()
+        while True:
+            batch = list(islice(rows, self.EXPORT_CHUNK_SIZE))
+            if not batch:
+                return
+            yield batch
+    
+    def iter_export_yaml(self) -> Iterator[str]:
+        """
+        流式生成 YAML 导出内容
+        
+        每批单独 dump 为块序列（"- name: ..."），拼接后仍是同一个 YAML 数组，
+        内存占用与总行数无关
+        
+        Yields:
+            str: YAML 文本片段
+        """
+        empty = True
+        for batch in self._iter_export_batches():
+            empty = False
+            yield _dump_yaml_batch(batch)
+        if empty:
+            yield '[]\n'
     
     def export_to_yaml(self, output_path: str) -> int:
         """
-        导出所有指纹到 YAML 文件
+        导出所有指纹到 YAML 文件（流式写入）
         
         Args:
             output_path: 输出文件路径
@@ -81,10 +114,13 @@ class ARLFingerprintService(BaseFingerprintService):
         Returns:
             int: 导出的指纹数量
         """
-        data = self.get_export_data()
-        with open(output_path, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
-        count = len(data)
+        count = 0
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            for batch in self._iter_export_batches():
+                f.write(_dump_yaml_batch(batch).encode())
+                count += len(batch)
+            if not count:
+                f.write(b'[]\n')
         logger.info("导出 ARL 指纹文件: %s, 数量: %d", output_path, count)
         return count
     
@@ -102,7 +138,7 @@ class ARLFingerprintService(BaseFingerprintService):
             ValueError: 当 YAML 格式无效时
         """
         try:
-            data = yaml.safe_load(yaml_content)
+            data = yaml.load(yaml_content, Loader=YAML_LOADER)
             if not isinstance(data, list):
                 raise ValueError("ARL YAML 文件必须是数组格式")
             return data
@@ -3,18 +3,104 @@
 提供通用的批量操作和缓存逻辑，供 EHole/Goby/Wappalyzer 等子类继承
 """
 
+import csv
+import io
 import json
 import logging
-from typing import Any
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+import orjson
+from django.db import connection, models, transaction
+from django.db.models import Count, Max
 
 logger = logging.getLogger(__name__)
 
 
+def is_non_blank(value: Any) -> bool:
+    """值非空且去除首尾空白后非空（字符串直接 strip，不再经过 str() 转换）"""
+    if type(value) is str:
+        return bool(value.strip())
+    return bool(value) and bool(str(value).strip())
+
+
+def to_stripped_str(value: Any) -> str:
+    """转为去除首尾空白的字符串（字符串直接 strip，None 视为空字符串，其他类型才调用 str()）"""
+    if type(value) is str:
+        return value.strip()
+    if value is None:
+        return ''
+    return str(value).strip()
+
+
+def write_json_array(f, items: Iterable, batch_size: int = 1000) -> int:
+    """
+    把条目流式写成 JSON 数组（二进制文件），返回条目数
+    
+    每批条目逐个 orjson 序列化后 b','.join 一次写入，内存中只保留一批
+    """
+    iterator = iter(items)
+    count = 0
+    f.write(b'[')
+    while batch := list(islice(iterator, batch_size)):
+        if count:
+            f.write(b',')
+        f.write(b','.join(map(orjson.dumps, batch)))
+        count += len(batch)
+    f.write(b']')
+    return count
+
+
+def write_json_object_items(f, pairs: Iterable[tuple], batch_size: int = 1000) -> int:
+    """把 (key, value) 对流式写成 JSON 对象（二进制文件），返回键数"""
+    dumps = orjson.dumps
+    iterator = iter(pairs)
+    count = 0
+    f.write(b'{')
+    while batch := list(islice(iterator, batch_size)):
+        if count:
+            f.write(b',')
+        f.write(b','.join(dumps(key) + b':' + dumps(value) for key, value in batch))
+        count += len(batch)
+    f.write(b'}')
+    return count
+
+
+def format_fingerprint_version(count: int, latest) -> str:
+    """由记录数和最新创建时间生成版本标识，格式 {count}_{latest_timestamp}"""
+    latest_ts = int(latest.timestamp()) if latest else 0
+    return f"{count}_{latest_ts}"
+
+
+def get_fingerprint_versions(service_classes: list) -> list[str]:
+    """
+    一次数据库往返获取多个指纹库的版本标识
+
+    各指纹表的 COUNT/MAX(created_at) 用 UNION ALL 合并为一条 SQL，
+    结果与逐个调用 get_fingerprint_version 一致，顺序与 service_classes 相同
+    """
+    qn = connection.ops.quote_name
+    sql = " UNION ALL ".join(
+        f"SELECT {i}, COUNT(*), MAX({qn(cls.model._meta.get_field('created_at').column)}) "
+        f"FROM {qn(cls.model._meta.db_table)}"
+        for i, cls in enumerate(service_classes)
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql)
+        rows = cursor.fetchall()
+    versions = {i: format_fingerprint_version(count, latest) for i, count, latest in rows}
+    return [versions[i] for i in range(len(service_classes))]
+
+
 class BaseFingerprintService:
     """指纹管理基类 Service，提供通用的批量操作和缓存逻辑"""
     
     model = None  # 子类必须指定
     BATCH_SIZE = 1000  # 每批处理数量
+    COPY_BATCH_SIZE = 5000  # COPY 导入每批行数
+    EXPORT_CHUNK_SIZE = 5000  # 导出时服务端游标每批读取行数（psycopg2 命名游标，每批一次 FETCH）
+    EXPORT_FIELDS = ()  # 导出需要的字段，子类指定（只 SELECT 这些列）
+    EXPORT_JSON_BATCH = 1000  # 流式写 JSON 时每批序列化的条目数
     
     def validate_fingerprint(self, item: dict) -> bool:
         """
@@ -38,17 +124,20 @@ class BaseFingerprintService:
         Returns:
             tuple: (valid_items, invalid_items)
         """
+        # 热循环内只做局部变量查找，避免每条数据重复解析 self 属性和绑定方法
         valid, invalid = [], []
+        validate = self.validate_fingerprint
+        add_valid, add_invalid = valid.append, invalid.append
         for item in raw_data:
-            if self.validate_fingerprint(item):
-                valid.append(item)
+            if validate(item):
+                add_valid(item)
             else:
-                invalid.append(item)
+                add_invalid(item)
         return valid, invalid
     
     def to_model_data(self, item: dict) -> dict:
         """
-        转换为 Model 字段，子类必须实现
+        转换为 Model 字段，子类必须实现（须包含除主键和 created_at 外的全部字段）
         
         Args:
             item: 原始指纹数据
@@ -71,35 +160,149 @@ class BaseFingerprintService:
         if not fingerprints:
             return 0
         
-        objects = [self.model(**self.to_model_data(item)) for item in fingerprints]
-        created = self.model.objects.bulk_create(objects, ignore_conflicts=True)
+        # 按字段定义顺序位置传参：Model.__init__ 走 zip(args, fields) 快路径，
+        # 不再对每个字段做 kwargs.pop；主键传 None，末尾的 created_at 由 auto_now_add 填充
+        model, convert = self.model, self.to_model_data
+        names = [f.attname for f in self._data_fields()]
+        objects = [model(None, *[data[name] for name in names]) for data in map(convert, fingerprints)]
+        created = self.model.objects.bulk_create(
+            objects, batch_size=self.BATCH_SIZE, ignore_conflicts=True
+        )
         return len(created)
     
-    def batch_create_fingerprints(self, raw_data: list) -> dict:
+    @classmethod
+    def _data_fields(cls) -> tuple:
+        """
+        to_model_data 对应的 Model 字段（主键之后、末尾自动时间字段之前，按定义顺序）
+        
+        bulk_create 位置传参和 COPY 导入共用，按服务类缓存，不再每次调用都遍历 _meta
+        """
+        fields = cls.__dict__.get('_data_fields_cache')
+        if fields is None:
+            fields = list(cls.model._meta.concrete_fields[1:])
+            while fields and (getattr(fields[-1], 'auto_now_add', False) or getattr(fields[-1], 'auto_now', False)):
+                fields.pop()
+            fields = tuple(fields)
+            cls._data_fields_cache = fields
+        return fields
+    
+    def batch_create_fingerprints(self, raw_data: Iterable[dict]) -> dict:
         """
         完整流程：分批校验 + 批量创建
         
         Args:
-            raw_data: 原始指纹数据列表
+            raw_data: 原始指纹数据（列表或迭代器，迭代器按批消费，内存占用为 O(BATCH_SIZE)）
             
         Returns:
             dict: {'created': int, 'failed': int}
         """
         total_created = 0
         total_failed = 0
+        total = 0
         
-        for i in range(0, len(raw_data), self.BATCH_SIZE):
-            batch = raw_data[i:i + self.BATCH_SIZE]
-            valid, invalid = self.validate_fingerprints(batch)
-            total_created += self.bulk_create(valid)
-            total_failed += len(invalid)
+        iterator = iter(raw_data)
+        # 所有批次在同一事务内提交：一次 COMMIT，且导入要么全部成功要么全部回滚
+        with transaction.atomic():
+            while True:
+                batch = list(islice(iterator, self.BATCH_SIZE))
+                if not batch:
+                    break
+                total += len(batch)
+                valid, invalid = self.validate_fingerprints(batch)
+                total_created += self.bulk_create(valid)
+                total_failed += len(invalid)
         
         logger.info(
             "批量创建指纹完成: created=%d, failed=%d, total=%d",
-            total_created, total_failed, len(raw_data)
+            total_created, total_failed, total
         )
         return {'created': total_created, 'failed': total_failed}
     
+    def bulk_copy_fingerprints(self, raw_data: Iterable[dict]) -> dict:
+        """
+        使用 PostgreSQL COPY 批量导入（空库初始化等大批量场景）
+        
+        流程：校验 + to_model_data → 分批 CSV COPY 到临时表 → INSERT ... SELECT ON CONFLICT DO NOTHING
+        跳过 ORM 对象构建，冲突语义与 bulk_create(ignore_conflicts=True) 一致。
+        INSERT 按唯一键排序写入，唯一索引 btree 近似顺序追加，减少页分裂和 WAL。
+        必须在事务中调用（临时表 ON COMMIT DROP）。
+        
+        Args:
+            raw_data: 原始指纹数据（列表或迭代器）
+            
+        Returns:
+            dict: {'created': int, 'failed': int}
+        """
+        meta = self.model._meta
+        quote = connection.ops.quote_name
+        table = quote(meta.db_table)
+        stage = quote(f"{meta.db_table}_copy_stage")
+        copy_fields = self._data_fields()
+        columns = ', '.join(quote(f.column) for f in copy_fields)
+        created_at = quote(meta.get_field('created_at').column)
+        order_by = ', '.join(quote(col) for col in self._unique_key_columns())
+        order_clause = f" ORDER BY {order_by}" if order_by else ""
+        
+        total = 0
+        total_failed = 0
+        iterator = iter(raw_data)
+        # 字段名与 JSON 标记只算一次，逐行转换时不再做 isinstance 判断
+        field_specs = [(f.name, isinstance(f, models.JSONField)) for f in copy_fields]
+        convert = self.to_model_data
+        
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMP TABLE {stage} ON COMMIT DROP AS "
+                f"SELECT {columns} FROM {table} WITH NO DATA"
+            )
+            while True:
+                batch = list(islice(iterator, self.COPY_BATCH_SIZE))
+                if not batch:
+                    break
+                total += len(batch)
+                valid, invalid = self.validate_fingerprints(batch)
+                total_failed += len(invalid)
+                
+                buffer = io.StringIO()
+                writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+                for item in valid:
+                    data = convert(item)
+                    writer.writerow([
+                        json.dumps(data[name], ensure_ascii=False) if is_json else data[name]
+                        for name, is_json in field_specs
+                    ])
+                buffer.seek(0)
+                # CursorWrapper 不转换 copy_expert 的异常，这里手动转换为 django.db.DatabaseError，
+                # 调用方才能按 DatabaseError 捕获并回退到逐批导入
+                with connection.wrap_database_errors:
+                    cursor.copy_expert(
+                        f"COPY {stage} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer
+                    )
+            
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}, {created_at}) "
+                f"SELECT {columns}, now() FROM {stage}{order_clause} ON CONFLICT DO NOTHING"
+            )
+            total_created = cursor.rowcount
+            cursor.execute(f"DROP TABLE {stage}")
+        
+        logger.info(
+            "COPY 导入指纹完成: created=%d, failed=%d, total=%d",
+            total_created, total_failed, total
+        )
+        return {'created': total_created, 'failed': total_failed}
+    
+    def _unique_key_columns(self) -> list[str]:
+        """Model 的唯一键列（unique 字段或第一个 UniqueConstraint），用于排序写入"""
+        meta = self.model._meta
+        for f in meta.concrete_fields:
+            if f.unique and not f.primary_key:
+                return [f.column]
+        for constraint in meta.constraints:
+            if isinstance(constraint, models.UniqueConstraint) and constraint.fields:
+                return [meta.get_field(name).column for name in constraint.fields]
+        return []
+    
     def get_export_data(self) -> dict:
         """
         获取导出数据，子类必须实现
@@ -109,6 +312,33 @@ class BaseFingerprintService:
         """
         raise NotImplementedError("子类必须实现 get_export_data 方法")
     
+    def iter_export_items(self) -> Iterator:
+        """
+        逐条产出导出条目，子类必须实现
+        
+        数组格式的指纹库产出条目 dict；对象格式（如 Wappalyzer）产出 (key, value)
+        """
+        raise NotImplementedError("子类必须实现 iter_export_items 方法")
+    
+    def write_export_json(self, f) -> int:
+        """
+        把导出数据流式写入已打开的二进制文件（默认 JSON 数组格式），返回指纹数量
+        
+        不构造完整的导出数据，峰值内存与指纹总量无关；外层包装格式不同的子类覆盖此方法
+        """
+        return write_json_array(f, self.iter_export_items(), self.EXPORT_JSON_BATCH)
+    
+    def iter_export_rows(self):
+        """
+        流式读取导出字段（values() 跳过 Model 实例化，iterator() 使用服务端游标）
+        
+        Returns:
+            Iterator[dict]: 只包含 EXPORT_FIELDS 的行字典
+        """
+        return self.model.objects.values(*self.EXPORT_FIELDS).iterator(
+            chunk_size=self.EXPORT_CHUNK_SIZE
+        )
+    
     def export_to_file(self, output_path: str) -> int:
         """
         导出所有指纹到 JSON 文件
@@ -119,10 +349,8 @@ class BaseFingerprintService:
         Returns:
             int: 导出的指纹数量
         """
-        data = self.get_export_data()
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False)
-        count = len(data.get('fingerprint', []))
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            count = self.write_export_json(f)
         logger.info("导出指纹文件: %s, 数量: %d", output_path, count)
         return count
     
@@ -138,7 +366,5 @@ class BaseFingerprintService:
         - 删除记录 → count 变化
         - 清空全部 → count 变为 0
         """
-        count = self.model.objects.count()
-        latest = self.model.objects.order_by('-created_at').first()
-        latest_ts = int(latest.created_at.timestamp()) if latest else 0
-        return f"{count}_{latest_ts}"
+        stats = self.model.objects.aggregate(count=Count('pk'), latest=Max('created_at'))
+        return format_fingerprint_version(stats['count'], stats['latest'])
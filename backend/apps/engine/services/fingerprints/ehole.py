@@ -3,14 +3,17 @@
 实现 EHole 格式指纹的校验、转换和导出逻辑
 """
 
+import orjson
+
 from apps.engine.models import EholeFingerprint
-from .base import BaseFingerprintService
+from .base import BaseFingerprintService, is_non_blank, to_stripped_str, write_json_array
 
 
 class EholeFingerprintService(BaseFingerprintService):
     """EHole 指纹管理服务（继承基类，实现 EHole 特定逻辑）"""
     
     model = EholeFingerprint
+    EXPORT_FIELDS = ('cms', 'method', 'location', 'keyword', 'is_important', 'type')
     
     def validate_fingerprint(self, item: dict) -> bool:
         """
@@ -26,9 +29,7 @@ class EholeFingerprintService(BaseFingerprintService):
         Returns:
             bool: 是否有效
         """
-        cms = item.get('cms', '')
-        keyword = item.get('keyword')
-        return bool(cms and str(cms).strip()) and isinstance(keyword, list)
+        return isinstance(item.get('keyword'), list) and is_non_blank(item.get('cms'))
     
     def to_model_data(self, item: dict) -> dict:
         """
@@ -44,7 +45,7 @@ class EholeFingerprintService(BaseFingerprintService):
             dict: Model 字段数据
         """
         return {
-            'cms': str(item.get('cms', '')).strip(),
+            'cms': to_stripped_str(item.get('cms')),
             'method': item.get('method', 'keyword'),
             'location': item.get('location', 'body'),
             'keyword': item.get('keyword', []),
@@ -67,18 +68,28 @@ class EholeFingerprintService(BaseFingerprintService):
                 "version": "1000_1703836800"
             }
         """
-        fingerprints = self.model.objects.all()
-        data = []
-        for fp in fingerprints:
-            data.append({
-                'cms': fp.cms,
-                'method': fp.method,
-                'location': fp.location,
-                'keyword': fp.keyword,
-                'isImportant': fp.is_important,  # 转回 JSON 格式
-                'type': fp.type,
-            })
         return {
-            'fingerprint': data,
+            'fingerprint': list(self.iter_export_items()),
             'version': self.get_fingerprint_version(),
         }
+    
+    def iter_export_items(self):
+        """逐条产出 EHole 格式的指纹"""
+        return (
+            {
+                'cms': row['cms'],
+                'method': row['method'],
+                'location': row['location'],
+                'keyword': row['keyword'],
+                'isImportant': row['is_important'],  # 转回 JSON 格式
+                'type': row['type'],
+            }
+            for row in self.iter_export_rows()
+        )
+    
+    def write_export_json(self, f) -> int:
+        """流式写入 EHole 格式：{"fingerprint": [...], "version": "..."}"""
+        f.write(b'{"fingerprint":')
+        count = write_json_array(f, self.iter_export_items(), self.EXPORT_JSON_BATCH)
+        f.write(b',"version":' + orjson.dumps(self.get_fingerprint_version()) + b'}')
+        return count
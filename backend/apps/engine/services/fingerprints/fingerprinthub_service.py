@@ -3,14 +3,20 @@
 实现 FingerPrintHub 格式指纹的校验、转换和导出逻辑
 """
 
+from itertools import chain
+
 from apps.engine.models import FingerPrintHubFingerprint
-from .base import BaseFingerprintService
+from .base import BaseFingerprintService, is_non_blank, to_stripped_str
 
 
 class FingerPrintHubFingerprintService(BaseFingerprintService):
     """FingerPrintHub 指纹管理服务（继承基类，实现 FingerPrintHub 特定逻辑）"""
     
     model = FingerPrintHubFingerprint
+    EXPORT_FIELDS = (
+        'fp_id', 'name', 'author', 'tags', 'severity', 'metadata', 'http',
+        'source_file',  # 须放最后：无来源文件的查询用 EXPORT_FIELDS[:-1]
+    )
     
     def validate_fingerprint(self, item: dict) -> bool:
         """
@@ -27,18 +33,14 @@ class FingerPrintHubFingerprintService(BaseFingerprintService):
         Returns:
             bool: 是否有效
         """
-        fp_id = item.get('id', '')
-        info = item.get('info', {})
-        http = item.get('http')
-        
-        if not fp_id or not str(fp_id).strip():
-            return False
-        if not isinstance(info, dict) or not info.get('name'):
-            return False
-        if not isinstance(http, list):
-            return False
-        
-        return True
+        get = item.get
+        info = get('info')
+        return (
+            isinstance(get('http'), list)
+            and isinstance(info, dict)
+            and bool(info.get('name'))
+            and is_non_blank(get('id'))
+        )
     
     def to_model_data(self, item: dict) -> dict:
         """
@@ -60,10 +62,10 @@ class FingerPrintHubFingerprintService(BaseFingerprintService):
         Returns:
             dict: Model 字段数据
         """
-        info = item.get('info', {})
+        info = item.get('info') or {}
         return {
-            'fp_id': str(item.get('id', '')).strip(),
-            'name': str(info.get('name', '')).strip(),
+            'fp_id': to_stripped_str(item.get('id')),
+            'name': to_stripped_str(info.get('name')),
             'author': info.get('author', ''),
             'tags': info.get('tags', ''),
             'severity': info.get('severity', 'info'),
@@ -89,22 +91,44 @@ class FingerPrintHubFingerprintService(BaseFingerprintService):
                 ...
             ]
         """
-        fingerprints = self.model.objects.all()
-        data = []
-        for fp in fingerprints:
-            item = {
-                'id': fp.fp_id,
+        return list(self.iter_export_items())
+    
+    def iter_export_items(self):
+        """逐条产出 FingerPrintHub 格式的指纹"""
+        # 按 source_file 是否为空拆成两个查询，各自一个无分支的推导式
+        # ⚠️ 导出顺序：有来源文件的指纹在前，无来源文件的在后；
+        # 组内显式按 created_at 倒序（与模型默认排序一致），id 保证同一时间戳下顺序稳定
+        queryset = self.model.objects.order_by('-created_at', 'id')
+        with_source = queryset.exclude(source_file='').values(*self.EXPORT_FIELDS)
+        without_source = queryset.filter(source_file='').values(*self.EXPORT_FIELDS[:-1])
+        chunk_size = self.EXPORT_CHUNK_SIZE
+        with_source_items = (
+            {
+                'id': row['fp_id'],
+                'info': {
+                    'name': row['name'],
+                    'author': row['author'],
+                    'tags': row['tags'],
+                    'severity': row['severity'],
+                    'metadata': row['metadata'],
+                },
+                'http': row['http'],
+                '_source_file': row['source_file'],
+            }
+            for row in with_source.iterator(chunk_size=chunk_size)
+        )
+        without_source_items = (
+            {
+                'id': row['fp_id'],
                 'info': {
-                    'name': fp.name,
-                    'author': fp.author,
-                    'tags': fp.tags,
-                    'severity': fp.severity,
-                    'metadata': fp.metadata,
+                    'name': row['name'],
+                    'author': row['author'],
+                    'tags': row['tags'],
+                    'severity': row['severity'],
+                    'metadata': row['metadata'],
                 },
-                'http': fp.http,
+                'http': row['http'],
             }
-            # 只有当 source_file 非空时才添加该字段
-            if fp.source_file:
-                item['_source_file'] = fp.source_file
-            data.append(item)
-        return data
+            for row in without_source.iterator(chunk_size=chunk_size)
+        )
+        return chain(with_source_items, without_source_items)
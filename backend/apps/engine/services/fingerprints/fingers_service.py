@@ -4,13 +4,14 @@
 """
 
 from apps.engine.models import FingersFingerprint
-from .base import BaseFingerprintService
+from .base import BaseFingerprintService, is_non_blank, to_stripped_str
 
 
 class FingersFingerprintService(BaseFingerprintService):
     """Fingers 指纹管理服务（继承基类，实现 Fingers 特定逻辑）"""
     
     model = FingersFingerprint
+    EXPORT_FIELDS = ('name', 'link', 'rule', 'tag', 'focus', 'default_port')
     
     def validate_fingerprint(self, item: dict) -> bool:
         """
@@ -26,9 +27,7 @@ class FingersFingerprintService(BaseFingerprintService):
         Returns:
             bool: 是否有效
         """
-        name = item.get('name', '')
-        rule = item.get('rule')
-        return bool(name and str(name).strip()) and isinstance(rule, list)
+        return isinstance(item.get('rule'), list) and is_non_blank(item.get('name'))
     
     def to_model_data(self, item: dict) -> dict:
         """
@@ -44,7 +43,7 @@ class FingersFingerprintService(BaseFingerprintService):
             dict: Model 字段数据
         """
         return {
-            'name': str(item.get('name', '')).strip(),
+            'name': to_stripped_str(item.get('name')),
             'link': item.get('link', ''),
             'rule': item.get('rule', []),
             'tag': item.get('tag', []),
@@ -64,20 +63,21 @@ class FingersFingerprintService(BaseFingerprintService):
                 ...
             ]
         """
-        fingerprints = self.model.objects.all()
-        data = []
-        for fp in fingerprints:
+        return list(self.iter_export_items())
+    
+    def iter_export_items(self):
+        """逐条产出 Fingers 格式的指纹"""
+        for row in self.iter_export_rows():
             item = {
-                'name': fp.name,
-                'link': fp.link,
-                'rule': fp.rule,
-                'tag': fp.tag,
+                'name': row['name'],
+                'link': row['link'],
+                'rule': row['rule'],
+                'tag': row['tag'],
             }
             # 只有当 focus 为 True 时才添加该字段（保持与原始格式一致）
-            if fp.focus:
-                item['focus'] = fp.focus
+            if row['focus']:
+                item['focus'] = row['focus']
             # 只有当 default_port 非空时才添加该字段
-            if fp.default_port:
-                item['default_port'] = fp.default_port
-            data.append(item)
-        return data
+            if row['default_port']:
+                item['default_port'] = row['default_port']
+            yield item
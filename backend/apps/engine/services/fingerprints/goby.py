@@ -4,13 +4,14 @@
 """
 
 from apps.engine.models import GobyFingerprint
-from .base import BaseFingerprintService
+from .base import BaseFingerprintService, is_non_blank, to_stripped_str
 
 
 class GobyFingerprintService(BaseFingerprintService):
     """Goby 指纹管理服务（继承基类，实现 Goby 特定逻辑）"""
     
     model = GobyFingerprint
+    EXPORT_FIELDS = ('name', 'logic', 'rule')
     
     def validate_fingerprint(self, item: dict) -> bool:
         """
@@ -27,10 +28,8 @@ class GobyFingerprintService(BaseFingerprintService):
         Returns:
             bool: 是否有效
         """
-        name = item.get('name', '')
-        logic = item.get('logic', '')
-        rule = item.get('rule')
-        return bool(name and str(name).strip()) and bool(logic) and isinstance(rule, list)
+        get = item.get
+        return isinstance(get('rule'), list) and bool(get('logic')) and is_non_blank(get('name'))
     
     def to_model_data(self, item: dict) -> dict:
         """
@@ -43,7 +42,7 @@ class GobyFingerprintService(BaseFingerprintService):
             dict: Model 字段数据
         """
         return {
-            'name': str(item.get('name', '')).strip(),
+            'name': to_stripped_str(item.get('name')),
             'logic': item.get('logic', ''),
             'rule': item.get('rule', []),
         }
@@ -59,12 +58,8 @@ class GobyFingerprintService(BaseFingerprintService):
                 ...
             ]
         """
-        fingerprints = self.model.objects.all()
-        return [
-            {
-                'name': fp.name,
-                'logic': fp.logic,
-                'rule': fp.rule,
-            }
-            for fp in fingerprints
-        ]
+        return list(self.iter_export_items())
+    
+    def iter_export_items(self):
+        """逐条产出 Goby 格式的指纹（values() 的字段顺序即导出的键顺序，直接使用行字典）"""
+        return self.iter_export_rows()
@@ -4,13 +4,31 @@
 """
 
 from apps.engine.models import WappalyzerFingerprint
-from .base import BaseFingerprintService
+from .base import BaseFingerprintService, is_non_blank, to_stripped_str, write_json_object_items
+
+# 导出字段映射（Model 字段 -> JSON 键），值为空时不输出该键
+EXPORT_FIELD_MAP = (
+    ('cats', 'cats'),
+    ('cookies', 'cookies'),
+    ('headers', 'headers'),
+    ('script_src', 'scriptSrc'),  # Model: script_src -> JSON: scriptSrc
+    ('js', 'js'),
+    ('implies', 'implies'),
+    ('meta', 'meta'),
+    ('html', 'html'),
+    ('description', 'description'),
+    ('website', 'website'),
+    ('cpe', 'cpe'),
+)
+# JSON 键顺序与 EXPORT_FIELDS 中 name 之后的字段一一对应
+EXPORT_KEYS = tuple(key for _, key in EXPORT_FIELD_MAP)
 
 
 class WappalyzerFingerprintService(BaseFingerprintService):
     """Wappalyzer 指纹管理服务（继承基类，实现 Wappalyzer 特定逻辑）"""
     
     model = WappalyzerFingerprint
+    EXPORT_FIELDS = ('name', *(field for field, _ in EXPORT_FIELD_MAP))
     
     def validate_fingerprint(self, item: dict) -> bool:
         """
@@ -25,8 +43,7 @@ class WappalyzerFingerprintService(BaseFingerprintService):
         Returns:
             bool: 是否有效
         """
-        name = item.get('name', '')
-        return bool(name and str(name).strip())
+        return is_non_blank(item.get('name'))
     
     def to_model_data(self, item: dict) -> dict:
         """
@@ -42,7 +59,7 @@ class WappalyzerFingerprintService(BaseFingerprintService):
             dict: Model 字段数据
         """
         return {
-            'name': str(item.get('name', '')).strip(),
+            'name': to_stripped_str(item.get('name')),
             'cats': item.get('cats', []),
             'cookies': item.get('cookies', {}),
             'headers': item.get('headers', {}),
@@ -69,31 +86,22 @@ class WappalyzerFingerprintService(BaseFingerprintService):
                 }
             }
         """
-        fingerprints = self.model.objects.all()
-        apps = {}
-        for fp in fingerprints:
-            app_data = {}
-            if fp.cats:
-                app_data['cats'] = fp.cats
-            if fp.cookies:
-                app_data['cookies'] = fp.cookies
-            if fp.headers:
-                app_data['headers'] = fp.headers
-            if fp.script_src:
-                app_data['scriptSrc'] = fp.script_src  # Model: script_src -> JSON: scriptSrc
-            if fp.js:
-                app_data['js'] = fp.js
-            if fp.implies:
-                app_data['implies'] = fp.implies
-            if fp.meta:
-                app_data['meta'] = fp.meta
-            if fp.html:
-                app_data['html'] = fp.html
-            if fp.description:
-                app_data['description'] = fp.description
-            if fp.website:
-                app_data['website'] = fp.website
-            if fp.cpe:
-                app_data['cpe'] = fp.cpe
-            apps[fp.name] = app_data
-        return {'apps': apps}
+        return {'apps': dict(self.iter_export_items())}
+    
+    def iter_export_items(self):
+        """逐条产出 (name, app) 对"""
+        # values_list 取元组行，与 EXPORT_KEYS 按位置 zip，一个推导式完成空值过滤
+        rows = self.model.objects.values_list(*self.EXPORT_FIELDS).iterator(
+            chunk_size=self.EXPORT_CHUNK_SIZE
+        )
+        return (
+            (name, {key: value for key, value in zip(EXPORT_KEYS, values) if value})
+            for name, *values in rows
+        )
+    
+    def write_export_json(self, f) -> int:
+        """流式写入 Wappalyzer 格式：{"apps": {...}}"""
+        f.write(b'{"apps":')
+        count = write_json_object_items(f, self.iter_export_items(), self.EXPORT_JSON_BATCH)
+        f.write(b'}')
+        return count
@@ -7,14 +7,6 @@ from .views import (
     WordlistViewSet,
     NucleiTemplateRepoViewSet,
 )
-from .views.fingerprints import (
-    EholeFingerprintViewSet,
-    GobyFingerprintViewSet,
-    WappalyzerFingerprintViewSet,
-    FingersFingerprintViewSet,
-    FingerPrintHubFingerprintViewSet,
-    ARLFingerprintViewSet,
-)
 
 
 # 创建路由器
@@ -23,15 +15,10 @@ router.register(r"engines", ScanEngineViewSet, basename="engine")
 router.register(r"workers", WorkerNodeViewSet, basename="worker")
 router.register(r"wordlists", WordlistViewSet, basename="wordlist")
 router.register(r"nuclei/repos", NucleiTemplateRepoViewSet, basename="nuclei-repos")
-# 指纹管理
-router.register(r"fingerprints/ehole", EholeFingerprintViewSet, basename="ehole-fingerprint")
-router.register(r"fingerprints/goby", GobyFingerprintViewSet, basename="goby-fingerprint")
-router.register(r"fingerprints/wappalyzer", WappalyzerFingerprintViewSet, basename="wappalyzer-fingerprint")
-router.register(r"fingerprints/fingers", FingersFingerprintViewSet, basename="fingers-fingerprint")
-router.register(r"fingerprints/fingerprinthub", FingerPrintHubFingerprintViewSet, basename="fingerprinthub-fingerprint")
-router.register(r"fingerprints/arl", ARLFingerprintViewSet, basename="arl-fingerprint")
 
 urlpatterns = [
+    # 指纹管理（独立 URLconf，按字符串 include）
+    path("fingerprints/", include("apps.engine.fingerprint_urls")),
     path("", include(router.urls)),
 ]
 
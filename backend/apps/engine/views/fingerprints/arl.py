@@ -1,7 +1,9 @@
 """ARL 指纹管理 ViewSet"""
 
 import yaml
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.gzip import gzip_page
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
 
@@ -10,6 +12,7 @@ from apps.common.response_helpers import success_response
 from apps.engine.models import ARLFingerprint
 from apps.engine.serializers.fingerprints import ARLFingerprintSerializer
 from apps.engine.services.fingerprints import ARLFingerprintService
+from apps.engine.services.fingerprints.arl_service import YAML_LOADER
 
 from .base import BaseFingerprintViewSet
 
@@ -54,16 +57,8 @@ class ARLFingerprintViewSet(BaseFingerprintViewSet):
         'rule': 'rule',
     }
     
-    def parse_import_data(self, json_data) -> list:
-        """
-        解析 ARL 格式的导入数据（JSON 格式）
-        
-        输入格式：[{...}, {...}] 数组格式
-        返回：指纹列表
-        """
-        if isinstance(json_data, list):
-            return json_data
-        return []
+    # 导入文件流式解析（顶层数组）
+    IMPORT_ITEMS_PREFIX = 'item'
     
     def get_export_filename(self) -> str:
         """导出文件名"""
@@ -85,17 +80,14 @@ class ARLFingerprintViewSet(BaseFingerprintViewSet):
             raise ValidationError('缺少文件')
         
         filename = file.name.lower()
-        content = file.read().decode('utf-8')
+        if not (filename.endswith('.yaml') or filename.endswith('.yml')):
+            # JSON 格式：流式解析，边解析边入库
+            return success_response(data=self.import_json_stream(file, self.IMPORT_ITEMS_PREFIX))
         
+        # 直接把文件对象交给 libyaml（自行识别编码并按块读取），不再 read + decode 出整份副本
         try:
-            if filename.endswith('.yaml') or filename.endswith('.yml'):
-                # YAML 格式
-                fingerprints = yaml.safe_load(content)
-            else:
-                # JSON 格式
-                import json
-                fingerprints = json.loads(content)
-        except (yaml.YAMLError, json.JSONDecodeError) as e:
+            fingerprints = yaml.load(file, Loader=YAML_LOADER)
+        except yaml.YAMLError as e:
             raise ValidationError(f'无效的文件格式: {e}')
         
         if not isinstance(fingerprints, list):
@@ -108,15 +100,17 @@ class ARLFingerprintViewSet(BaseFingerprintViewSet):
         return success_response(data=result)
     
     @action(detail=False, methods=['get'])
+    @method_decorator(gzip_page)
     def export(self, request):
         """
         导出指纹（YAML 格式）
         GET /api/engine/fingerprints/arl/export/
         
-        返回：YAML 文件下载
+        返回：YAML 文件下载（流式响应，逐批输出；客户端支持时按块 gzip 压缩）
         """
-        data = self.get_service().get_export_data()
-        content = yaml.dump(data, allow_unicode=True, default_flow_style=False, sort_keys=False)
-        response = HttpResponse(content, content_type='application/x-yaml')
+        response = StreamingHttpResponse(
+            self.get_service().iter_export_yaml(),
+            content_type='application/x-yaml'
+        )
         response['Content-Disposition'] = f'attachment; filename="{self.get_export_filename()}"'
         return response
@@ -6,7 +6,11 @@
 import json
 import logging
 
+import ijson
+import orjson
 from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.gzip import gzip_page
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -46,7 +50,7 @@ class BaseFingerprintViewSet(viewsets.ModelViewSet):
     
     子类必须实现：
     - service_class      Service 类
-    - parse_import_data  解析导入数据格式
+    - parse_import_data  解析导入数据格式（仅未设置 IMPORT_ITEMS_PREFIX 时需要）
     - get_export_filename 导出文件名
     """
     
@@ -63,6 +67,10 @@ class BaseFingerprintViewSet(viewsets.ModelViewSet):
     # JSON 数组字段列表（使用 __contains 查询），子类可覆盖
     JSON_ARRAY_FIELDS = []
     
+    # 文件导入的 ijson 流式解析前缀（如顶层数组为 'item'），子类可覆盖
+    # 为 None 时整体解析后交给 parse_import_data
+    IMPORT_ITEMS_PREFIX = None
+    
     def get_queryset(self):
         """支持智能过滤语法"""
         queryset = super().get_queryset()
@@ -84,7 +92,7 @@ class BaseFingerprintViewSet(viewsets.ModelViewSet):
     
     def parse_import_data(self, json_data: dict) -> list:
         """
-        解析导入数据，子类必须实现
+        解析导入数据，未设置 IMPORT_ITEMS_PREFIX 的子类必须实现
         
         Args:
             json_data: 解析后的 JSON 数据
@@ -147,6 +155,10 @@ class BaseFingerprintViewSet(viewsets.ModelViewSet):
         if not file:
             raise ValidationError('缺少文件')
         
+        if self.IMPORT_ITEMS_PREFIX:
+            result = self.import_json_stream(file, self.IMPORT_ITEMS_PREFIX)
+            return success_response(data=result, status_code=status.HTTP_201_CREATED)
+        
         try:
             json_data = json.load(file)
         except json.JSONDecodeError as e:
@@ -159,6 +171,30 @@ class BaseFingerprintViewSet(viewsets.ModelViewSet):
         result = self.get_service().batch_create_fingerprints(fingerprints)
         return success_response(data=result, status_code=status.HTTP_201_CREATED)
     
+    def import_json_stream(self, file, prefix: str) -> dict:
+        """
+        流式解析 JSON 文件并分批导入
+        
+        边解析边入库，内存占用为 O(BATCH_SIZE) 而不是整个文件的对象树；
+        batch_create_fingerprints 在单个事务中执行，文件中途格式错误时整体回滚。
+        
+        Args:
+            file: 上传的文件对象
+            prefix: ijson 前缀（如 'item'、'fingerprint.item'）
+            
+        Returns:
+            dict: {'created': int, 'failed': int}
+        """
+        items = ijson.items(file, prefix, use_float=True)
+        try:
+            result = self.get_service().batch_create_fingerprints(items)
+        except ijson.JSONError as e:
+            raise ValidationError(f'无效的 JSON 格式: {e}')
+        
+        if not result['created'] and not result['failed']:
+            raise ValidationError('文件中没有有效的指纹数据')
+        return result
+    
     @action(detail=False, methods=['post'], url_path='bulk-delete')
     def bulk_delete(self, request):
         """
@@ -189,15 +225,19 @@ class BaseFingerprintViewSet(viewsets.ModelViewSet):
         return success_response(data={'deleted': deleted_count})
     
     @action(detail=False, methods=['get'])
+    @method_decorator(gzip_page)
     def export(self, request):
         """
         导出指纹（前端下载）
         GET /api/engine/fingerprints/{type}/export/
         
-        返回：JSON 文件下载
+        返回：JSON 文件下载（客户端支持时 gzip 压缩）
+        
+        直接序列化 Service 返回的普通 dict/list（不经过 DRF Serializer），
+        orjson 输出 UTF-8 bytes，格式与 json.dumps(ensure_ascii=False, indent=2) 一致
         """
         data = self.get_service().get_export_data()
-        content = json.dumps(data, ensure_ascii=False, indent=2)
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
         response = HttpResponse(content, content_type='application/json')
         response['Content-Disposition'] = f'attachment; filename="{self.get_export_filename()}"'
         return response
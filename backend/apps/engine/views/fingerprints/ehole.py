@@ -53,14 +53,8 @@ class EholeFingerprintViewSet(BaseFingerprintViewSet):
         'isImportant': 'is_important',
     }
     
-    def parse_import_data(self, json_data: dict) -> list:
-        """
-        解析 EHole JSON 格式的导入数据
-        
-        输入格式：{"fingerprint": [...]}
-        返回：指纹列表
-        """
-        return json_data.get('fingerprint', [])
+    # 导入文件流式解析（fingerprint 数组）
+    IMPORT_ITEMS_PREFIX = 'fingerprint.item'
     
     def get_export_filename(self) -> str:
         """导出文件名"""
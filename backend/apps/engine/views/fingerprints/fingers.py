@@ -50,20 +50,12 @@ class FingersFingerprintViewSet(BaseFingerprintViewSet):
         'focus': 'focus',
     }
     
+    # 导入文件流式解析（顶层数组）
+    IMPORT_ITEMS_PREFIX = 'item'
+    
     # JSON 数组字段（使用 __contains 查询）
     JSON_ARRAY_FIELDS = ['tag', 'rule', 'default_port']
     
-    def parse_import_data(self, json_data) -> list:
-        """
-        解析 Fingers JSON 格式的导入数据
-        
-        输入格式：[{...}, {...}] 数组格式
-        返回：指纹列表
-        """
-        if isinstance(json_data, list):
-            return json_data
-        return []
-    
     def get_export_filename(self) -> str:
         """导出文件名"""
         return 'fingers_http.json'
@@ -47,18 +47,8 @@ class GobyFingerprintViewSet(BaseFingerprintViewSet):
         'logic': 'logic',
     }
     
-    def parse_import_data(self, json_data) -> list:
-        """
-        解析 Goby JSON 格式的导入数据
-        
-        Goby 格式是数组格式：[{...}, {...}, ...]
-        
-        输入格式：[{"name": "...", "logic": "...", "rule": [...]}, ...]
-        返回：指纹列表
-        """
-        if isinstance(json_data, list):
-            return json_data
-        return []
+    # 导入文件流式解析（顶层数组）
+    IMPORT_ITEMS_PREFIX = 'item'
     
     def get_export_filename(self) -> str:
         """导出文件名"""
@@ -66,8 +66,9 @@ class WappalyzerFingerprintViewSet(BaseFingerprintViewSet):
         apps = json_data.get('apps', {})
         fingerprints = []
         for name, data in apps.items():
-            item = {'name': name, **data}
-            fingerprints.append(item)
+            # 原地补上 name，避免为每个 app 复制一份 dict；与 {'name': name, **data} 一致，自带 name 时保留原值
+            data.setdefault('name', name)
+            fingerprints.append(data)
         return fingerprints
     
     def get_export_filename(self) -> str:
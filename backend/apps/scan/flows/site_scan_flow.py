@@ -107,6 +107,7 @@ def _export_site_urls(target_id: int, site_scan_dir: Path, target_name: str = No
     logger.info("Step 1: 导出站点URL列表")
     
     urls_file = str(site_scan_dir / 'site_urls.txt')
+    # 只传 target_id：Target 类型仅在导出为空、需要默认值回退时才由 generate_default_urls 查询
     export_result = export_site_urls_task(
         target_id=target_id,
         output_file=urls_file,
@@ -9,15 +9,143 @@
 
 import ipaddress
 import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from itertools import chain, islice
 from pathlib import Path
 from typing import Dict, Any, Optional, Iterator
 
 from django.db.models import QuerySet
 
+from apps.common.prefect_django_setup import setup_django_for_prefect
+
 from .blacklist_service import BlacklistService
 
 logger = logging.getLogger(__name__)
 
+# 默认 URL 的协议前缀（按输出顺序：先 http 后 https）
+DEFAULT_URL_PREFIXES = ("http://", "https://")
+
+# 0-255 的十进制字符串表（及带 "." 后缀的版本），用于拼接 IPv4 地址
+_OCTETS = tuple(str(i) for i in range(256))
+_OCTETS_DOT = tuple(octet + "." for octet in _OCTETS)
+
+
+@cache
+def _get_target_service():
+    """TargetService 单例（无状态，只持有 Repository；延迟导入避免循环依赖）"""
+    from apps.targets.services import TargetService
+    return TargetService()
+
+
+def _ipv4_host_range(network) -> tuple[int, int]:
+    """IPv4 网段内主机的整数地址区间 [start, end]，与 network.hosts() 语义一致"""
+    start = int(network.network_address)
+    end = int(network.broadcast_address)
+    # /31、/32 没有网络地址和广播地址之分，全部视为主机
+    if network.prefixlen < 31:
+        start += 1
+        end -= 1
+    return start, end
+
+
+def _iter_ipv4_strings(start: int, end: int) -> Iterator[str]:
+    """
+    迭代整数区间 [start, end] 内的 IPv4 点分十进制字符串
+    
+    按 /24 分段：每段前三个八位组只查表拼一次前缀，末位八位组直接取预生成的字符串表，
+    不做逐地址的整数格式化。
+    """
+    for high in range(start >> 8, (end >> 8) + 1):
+        prefix = _OCTETS_DOT[high >> 16] + _OCTETS_DOT[(high >> 8) & 255] + _OCTETS_DOT[high & 255]
+        first = start & 255 if high == start >> 8 else 0
+        last = end & 255 if high == end >> 8 else 255
+        yield from map(prefix.__add__, _OCTETS[first:last + 1])
+
+
+def _iter_host_strings(network) -> Iterator[str]:
+    """
+    按 network.hosts() 的语义迭代网段内的主机 IP 字符串
+    
+    IPv4 直接对整数地址做位运算拼点分十进制，避免逐个构造 IPv4Address 对象再 str()；
+    IPv6 仍走 hosts()。
+    """
+    if network.version != 4:
+        return map(str, network.hosts())
+    return _iter_ipv4_strings(*_ipv4_host_range(network))
+
+
+def _write_host_urls(
+    f,
+    hosts: Iterator[str],
+    should_write,
+    chunk_size: int,
+    log_progress: bool = True
+) -> int:
+    """
+    把主机 IP 展开为 http(s) URL 写入二进制文件，返回写入的 URL 数
+    
+    按块批量生成：每块一个推导式 + 一次 write，避免逐个 URL 调用 f.write；
+    log_progress=False 时不输出进度日志（多进程分片时由父进程汇总输出）
+    """
+    total_urls = 0
+    while True:
+        chunk = list(islice(hosts, chunk_size))
+        if not chunk:
+            break
+        urls = [
+            url
+            for ip in chunk
+            for prefix in DEFAULT_URL_PREFIXES
+            if should_write(url := prefix + ip)
+        ]
+        TargetExportService.write_lines(f, urls)
+        prev_total, total_urls = total_urls, total_urls + len(urls)
+        if log_progress and total_urls // 10000 > prev_total // 10000:
+            logger.info("已生成 %d 个 URL...", total_urls)
+    return total_urls
+
+
+def _write_cidr_shard(
+    start: int,
+    end: int,
+    shard_path: str,
+    blacklist_service: Optional[BlacklistService],
+    chunk_size: int,
+    buffer_size: int
+) -> int:
+    """
+    多进程 worker：把整数区间 [start, end] 内 IPv4 主机的 URL 写入分片文件
+    
+    不输出逐块进度日志（多个 worker 的进度交错没有意义），由父进程在分片完成后汇总输出
+    """
+    should_write = blacklist_service.filter_url if blacklist_service else (lambda url: True)
+    with open(shard_path, 'wb', buffering=buffer_size) as f:
+        return _write_host_urls(
+            f, _iter_ipv4_strings(start, end), should_write, chunk_size, log_progress=False
+        )
+
+
+def _append_file(f, path: str) -> None:
+    """把分片文件内容追加到已打开的二进制文件 f（优先 os.sendfile 内核态拷贝）"""
+    with open(path, 'rb') as src:
+        if not hasattr(os, 'sendfile'):
+            shutil.copyfileobj(src, f, TargetExportService.WRITE_BUFFER_SIZE)
+            return
+        f.flush()
+        out_fd, in_fd = f.fileno(), src.fileno()
+        offset, remaining = 0, os.fstat(in_fd).st_size
+        while remaining > 0:
+            sent = os.sendfile(out_fd, in_fd, offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+
 
 class TargetExportService:
     """
@@ -33,6 +161,15 @@ class TargetExportService:
         result = export_service.export_urls(target_id, output_path, queryset)
     """
     
+    # CIDR 展开时每块处理的主机数：一块约 1.5 MiB（> WRITE_BUFFER_SIZE），
+    # BufferedWriter 会把超过缓冲区的数据直接交给底层 write()，不再经缓冲区二次拷贝
+    CIDR_CHUNK_SIZE = 1 << 15
+    CIDR_PARALLEL_THRESHOLD = 1 << 16  # 超过该地址数的 IPv4 网段使用多进程并行展开
+    CIDR_MAX_WORKERS = 8
+    WRITE_BUFFER_SIZE = 1 << 20  # 导出文件写缓冲（1 MiB），二进制模式写入预编码的 UTF-8 bytes
+    WRITE_BATCH_LINES = 4096  # 流式导出时攒够多少行合并写入一次
+    MIN_WRITE_BUFFER_SIZE = 64 << 10  # 小网段的最小写缓冲（64 KiB）
+    
     def __init__(self, blacklist_service: Optional[BlacklistService] = None):
         """
         初始化导出服务
@@ -48,7 +185,9 @@ class TargetExportService:
         output_path: str,
         queryset: QuerySet,
         url_field: str = 'url',
-        batch_size: int = 1000
+        batch_size: int = 1000,
+        target_name: Optional[str] = None,
+        target_type: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         统一 URL 导出函数
@@ -63,6 +202,8 @@ class TargetExportService:
             queryset: 数据源 queryset（由 Task 层构建，应为 values_list flat=True）
             url_field: URL 字段名（用于黑名单过滤）
             batch_size: 批次大小
+            target_name: 目标名称（可选，与 target_type 同时提供时默认值回退不再查库）
+            target_type: 目标类型（可选）
             
         Returns:
             dict: {
@@ -85,26 +226,37 @@ class TargetExportService:
             # 这里假设 Task 层传入的是 values_list，需要在 Task 层处理过滤
             pass
         
+        # 先取第一条：数据源为空时直接走默认值生成，不再先创建一个空文件
+        url_iterator = self.peek(queryset.iterator(chunk_size=batch_size))
+        
         total_count = 0
-        try:
-            with open(output_file, 'w', encoding='utf-8', buffering=8192) as f:
-                for url in queryset.iterator(chunk_size=batch_size):
-                    if url:
-                        # Python 层面黑名单过滤
-                        if self.blacklist_service and not self.blacklist_service.filter_url(url):
-                            continue
-                        f.write(f"{url}\n")
-                        total_count += 1
-                        
-                        if total_count % 10000 == 0:
-                            logger.info("已导出 %d 个 URL...", total_count)
-        except IOError as e:
-            logger.error("文件写入失败: %s - %s", output_path, e)
-            raise
+        if url_iterator is not None:
+            buf = []
+            try:
+                with open(output_file, 'wb', buffering=self.WRITE_BUFFER_SIZE) as f:
+                    for url in url_iterator:
+                        if url:
+                            # Python 层面黑名单过滤
+                            if self.blacklist_service and not self.blacklist_service.filter_url(url):
+                                continue
+                            buf.append(url)
+                            total_count += 1
+                            if len(buf) >= self.WRITE_BATCH_LINES:
+                                self.write_lines(f, buf)
+                                buf.clear()
+                            
+                            if total_count % 10000 == 0:
+                                logger.info("已导出 %d 个 URL...", total_count)
+                    self.write_lines(f, buf)
+            except IOError as e:
+                logger.error("文件写入失败: %s - %s", output_path, e)
+                raise
         
         # 默认值回退模式
         if total_count == 0:
-            total_count = self._generate_default_urls(target_id, output_file)
+            total_count = self.generate_default_urls(
+                target_id, output_file, target_name=target_name, target_type=target_type
+            )
         
         logger.info("✓ URL 导出完成 - 数量: %d, 文件: %s", total_count, output_path)
         
@@ -114,13 +266,15 @@ class TargetExportService:
             'total_count': total_count
         }
 
-    def _generate_default_urls(
+    def generate_default_urls(
         self,
         target_id: int,
-        output_path: Path
+        output_path: Path,
+        target_name: Optional[str] = None,
+        target_type: Optional[str] = None
     ) -> int:
         """
-        默认值生成器（内部函数）
+        默认值生成器（所有默认 URL 回退的唯一实现，export_urls 与各导出 Task 共用）
         
         根据 Target 类型生成默认 URL：
         - DOMAIN: http(s)://domain
@@ -131,79 +285,136 @@ class TargetExportService:
         Args:
             target_id: 目标 ID
             output_path: 输出文件路径
+            target_name: 目标名称（可选）
+            target_type: 目标类型（可选）；与 target_name 同时提供时跳过 Target 查询
             
         Returns:
             int: 写入的 URL 总数
         """
-        from apps.targets.services import TargetService
         from apps.targets.models import Target
         
-        target_service = TargetService()
-        target = target_service.get_target(target_id)
-        
-        if not target:
-            logger.warning("Target ID %d 不存在，无法生成默认 URL", target_id)
-            return 0
-        
-        target_name = target.name
-        target_type = target.type
+        if not (target_name and target_type):
+            target = _get_target_service().get_target(target_id)
+            
+            if not target:
+                logger.warning("Target ID %d 不存在，无法生成默认 URL", target_id)
+                # 仍创建空文件，下游工具读取输出文件时不会 FileNotFoundError
+                Path(output_path).write_bytes(b"")
+                return 0
+            
+            target_name = target.name
+            target_type = target.type
         
         logger.info("懒加载模式：Target 类型=%s, 名称=%s", target_type, target_name)
         
-        total_urls = 0
-        
-        with open(output_path, 'w', encoding='utf-8', buffering=8192) as f:
-            if target_type == Target.TargetType.DOMAIN:
-                urls = [f"http://{target_name}", f"https://{target_name}"]
-                for url in urls:
-                    if self._should_write_url(url):
-                        f.write(f"{url}\n")
-                        total_urls += 1
-                        
-            elif target_type == Target.TargetType.IP:
-                urls = [f"http://{target_name}", f"https://{target_name}"]
-                for url in urls:
-                    if self._should_write_url(url):
-                        f.write(f"{url}\n")
-                        total_urls += 1
-                        
-            elif target_type == Target.TargetType.CIDR:
-                try:
-                    network = ipaddress.ip_network(target_name, strict=False)
-                    
-                    for ip in network.hosts():
-                        urls = [f"http://{ip}", f"https://{ip}"]
-                        for url in urls:
-                            if self._should_write_url(url):
-                                f.write(f"{url}\n")
-                                total_urls += 1
-                        
-                        if total_urls % 10000 == 0:
-                            logger.info("已生成 %d 个 URL...", total_urls)
-                    
-                    # /32 或 /128 特殊处理
-                    if total_urls == 0:
-                        ip = str(network.network_address)
-                        urls = [f"http://{ip}", f"https://{ip}"]
-                        for url in urls:
-                            if self._should_write_url(url):
-                                f.write(f"{url}\n")
-                                total_urls += 1
-                                
-                except ValueError as e:
-                    logger.error("CIDR 解析失败: %s - %s", target_name, e)
-                    raise ValueError(f"无效的 CIDR: {target_name}") from e
-                    
+        should_write = self._should_write_url
+        
+        if target_type == Target.TargetType.CIDR:
+            try:
+                network = ipaddress.ip_network(target_name, strict=False)
+            except ValueError as e:
+                logger.error("CIDR 解析失败: %s - %s", target_name, e)
+                raise ValueError(f"无效的 CIDR: {target_name}") from e
+            
+            # CIDR 可能展开出大量 URL，流式写入
+            with open(output_path, 'wb', buffering=self._cidr_buffer_size(network, 64)) as f:
+                if network.version == 4 and network.num_addresses > self.CIDR_PARALLEL_THRESHOLD:
+                    total_urls = self._write_cidr_parallel(f, network, output_path)
+                else:
+                    total_urls = _write_host_urls(
+                        f, _iter_host_strings(network), should_write, self.CIDR_CHUNK_SIZE
+                    )
+                
+                # /32 或 /128 特殊处理
+                if total_urls == 0:
+                    ip = str(network.network_address)
+                    urls = [url for prefix in DEFAULT_URL_PREFIXES if should_write(url := prefix + ip)]
+                    self.write_lines(f, urls)
+                    total_urls = len(urls)
+        else:
+            # DOMAIN/IP/URL 最多两行：内存中拼好后一次写入，不必分配大写缓冲
+            if target_type in (Target.TargetType.DOMAIN, Target.TargetType.IP):
+                urls = [url for prefix in DEFAULT_URL_PREFIXES if should_write(url := prefix + target_name)]
             elif target_type == Target.TargetType.URL:
-                if self._should_write_url(target_name):
-                    f.write(f"{target_name}\n")
-                    total_urls = 1
+                urls = [target_name] if should_write(target_name) else []
             else:
                 logger.warning("不支持的 Target 类型: %s", target_type)
+                urls = []
+            Path(output_path).write_bytes(("\n".join(urls) + "\n").encode() if urls else b"")
+            total_urls = len(urls)
         
         logger.info("✓ 懒加载生成默认 URL - 数量: %d", total_urls)
         return total_urls
     
+    def _cidr_buffer_size(self, network, bytes_per_host: int) -> int:
+        """
+        按网段预计输出量选择写缓冲大小
+        
+        小网段不必分配 1 MiB 缓冲；上限保持 WRITE_BUFFER_SIZE，
+        保证 CIDR_CHUNK_SIZE 的整块写入仍大于缓冲区、可以直接落到底层 write()。
+        """
+        expected = network.num_addresses * bytes_per_host
+        return min(self.WRITE_BUFFER_SIZE, max(self.MIN_WRITE_BUFFER_SIZE, expected))
+    
+    def _write_cidr_parallel(self, f, network, output_path: Path) -> int:
+        """
+        大网段多进程展开：主机区间均分给 worker 各写一个分片，完成后按顺序拼接到 f
+        
+        分片放在输出文件同目录的临时目录中（同一文件系统，便于 sendfile），结束后自动清理。
+        """
+        start, end = _ipv4_host_range(network)
+        workers = min(os.cpu_count() or 1, self.CIDR_MAX_WORKERS)
+        step = -(-(end - start + 1) // workers)
+        ranges = [(lo, min(lo + step - 1, end)) for lo in range(start, end + 1, step)]
+        
+        logger.info("CIDR %s 较大，使用 %d 个进程并行生成 URL", network, len(ranges))
+        
+        with tempfile.TemporaryDirectory(dir=Path(output_path).parent) as tmp_dir:
+            shard_paths = [os.path.join(tmp_dir, f"shard_{i}") for i in range(len(ranges))]
+            # 使用 spawn：调用方是多线程的 Prefect worker，fork 可能复制其他线程持有的锁
+            # （数据库驱动、内存分配器、import 锁等）导致子进程死锁；
+            # 子进程导入 apps.scan.services 包依赖 Django，启动时先初始化 Django 环境
+            with ProcessPoolExecutor(
+                max_workers=len(ranges),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=setup_django_for_prefect,
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _write_cidr_shard, lo, hi, shard_path, self.blacklist_service,
+                        self.CIDR_CHUNK_SIZE, self.WRITE_BUFFER_SIZE
+                    )
+                    for (lo, hi), shard_path in zip(ranges, shard_paths)
+                ]
+                total_urls = sum(future.result() for future in futures)
+            
+            for shard_path in shard_paths:
+                _append_file(f, shard_path)
+        
+        logger.info("已生成 %d 个 URL（%d 个分片）", total_urls, len(ranges))
+        return total_urls
+    
+    @staticmethod
+    def peek(iterable) -> Optional[Iterator]:
+        """
+        预取第一个元素判断是否为空
+        
+        Returns:
+            为空返回 None，否则返回与原序列等价的迭代器（已取出的首元素会被拼回）
+        """
+        iterator = iter(iterable)
+        try:
+            first = next(iterator)
+        except StopIteration:
+            return None
+        return chain((first,), iterator)
+    
+    @staticmethod
+    def write_lines(f, lines: list) -> None:
+        """将多行合并编码后一次写入二进制文件（空列表不写）"""
+        if lines:
+            f.write(("\n".join(lines) + "\n").encode())
+    
     def _should_write_url(self, url: str) -> bool:
         """检查 URL 是否应该写入（通过黑名单过滤）"""
         if self.blacklist_service:
@@ -237,7 +448,6 @@ class TargetExportService:
                 'target_type': str
             }
         """
-        from apps.targets.services import TargetService
         from apps.targets.models import Target
         from apps.asset.services.asset.subdomain_service import SubdomainService
         
@@ -245,8 +455,7 @@ class TargetExportService:
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
         # 获取 Target 信息
-        target_service = TargetService()
-        target = target_service.get_target(target_id)
+        target = _get_target_service().get_target(target_id)
         
         if not target:
             raise ValueError(f"Target ID {target_id} 不存在")
@@ -305,10 +514,10 @@ class TargetExportService:
         )
         
         total_count = 0
-        with open(output_path, 'w', encoding='utf-8', buffering=8192) as f:
+        with open(output_path, 'wb', buffering=self.WRITE_BUFFER_SIZE) as f:
             for domain_name in domain_iterator:
                 if self._should_write_target(domain_name):
-                    f.write(f"{domain_name}\n")
+                    f.write(domain_name.encode() + b"\n")
                     total_count += 1
                     
                     if total_count % 10000 == 0:
@@ -337,11 +546,10 @@ class TargetExportService:
         network = ipaddress.ip_network(target_name, strict=False)
         total_count = 0
         
-        with open(output_path, 'w', encoding='utf-8', buffering=8192) as f:
-            for ip in network.hosts():
-                ip_str = str(ip)
+        with open(output_path, 'wb', buffering=self._cidr_buffer_size(network, 16)) as f:
+            for ip_str in _iter_host_strings(network):
                 if self._should_write_target(ip_str):
-                    f.write(f"{ip_str}\n")
+                    f.write(ip_str.encode() + b"\n")
                     total_count += 1
                     
                     if total_count % 10000 == 0:
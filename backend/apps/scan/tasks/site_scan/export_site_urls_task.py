@@ -10,6 +10,8 @@
 - 其他端口：生成 HTTP 和 HTTPS 两个URL（带端口号）
 """
 import logging
+from functools import cache
+from itertools import islice
 from pathlib import Path
 from prefect import task
 
@@ -19,27 +21,41 @@ from apps.scan.services import TargetExportService, BlacklistService
 logger = logging.getLogger(__name__)
 
 
-def _generate_urls_from_port(host: str, port: int) -> list[str]:
+@cache
+def _get_host_port_mapping_service() -> HostPortMappingService:
+    """HostPortMappingService 单例（无状态，只持有 Repository；首次使用时构造）"""
+    return HostPortMappingService()
+
+
+# 端口 -> URL 模板缓存（80/443 预置，其他端口首次出现时生成），热循环里只做一次 dict 查找
+_PORT_URL_TEMPLATES: dict[int, tuple[str, ...]] = {
+    80: ("http://%s",),
+    443: ("https://%s",),
+}
+
+
+def _get_port_templates(port: int) -> tuple[str, ...]:
     """
-    根据端口生成 URL 列表
+    根据端口获取 URL 模板（带缓存）
     
     - 80 端口：只生成 HTTP URL（省略端口号）
     - 443 端口：只生成 HTTPS URL（省略端口号）
     - 其他端口：生成 HTTP 和 HTTPS 两个URL（带端口号）
     """
-    if port == 80:
-        return [f"http://{host}"]
-    elif port == 443:
-        return [f"https://{host}"]
-    else:
-        return [f"http://{host}:{port}", f"https://{host}:{port}"]
+    templates = _PORT_URL_TEMPLATES.get(port)
+    if templates is None:
+        templates = (f"http://%s:{port}", f"https://%s:{port}")
+        _PORT_URL_TEMPLATES[port] = templates
+    return templates
 
 
 @task(name="export_site_urls")
 def export_site_urls_task(
     target_id: int,
     output_file: str,
-    batch_size: int = 1000
+    batch_size: int = 1000,
+    target_name: str = None,
+    target_type: str = None
 ) -> dict:
     """
     导出目标下的所有站点URL到文件（基于 HostPortMapping 表）
@@ -61,6 +77,8 @@ def export_site_urls_task(
         target_id: 目标ID
         output_file: 输出文件路径（绝对路径）
         batch_size: 每次处理的批次大小
+        target_name: 目标名称（可选，与 target_type 同时提供时默认值回退不再查询 Target）
+        target_type: 目标类型（可选）
         
     Returns:
         dict: {
@@ -84,29 +102,36 @@ def export_site_urls_task(
     blacklist_service = BlacklistService()
     
     # 直接查询 HostPortMapping 表，按 host 排序
-    service = HostPortMappingService()
-    associations = service.iter_host_port_by_target(
+    associations = _get_host_port_mapping_service().iter_host_port_by_target(
         target_id=target_id,
         batch_size=batch_size,
     )
     
+    # 先取第一条：没有关联数据时直接走默认值生成，不再先创建一个空文件
+    associations = TargetExportService.peek(associations)
+    
     total_urls = 0
     association_count = 0
     
-    # 流式写入文件（特殊端口逻辑）
-    with open(output_path, 'w', encoding='utf-8', buffering=8192) as f:
-        for assoc in associations:
-            association_count += 1
-            host = assoc['host']
-            port = assoc['port']
-            
-            # 根据端口号生成URL
-            for url in _generate_urls_from_port(host, port):
-                if blacklist_service.filter_url(url):
-                    f.write(f"{url}\n")
-                    total_urls += 1
-            
-            if association_count % 1000 == 0:
+    if associations is not None:
+        filter_url = blacklist_service.filter_url
+        
+        # 流式写入文件（特殊端口逻辑）：按 batch_size 分块，每块一个推导式生成 URL + 一次写入
+        with open(output_path, 'wb', buffering=TargetExportService.WRITE_BUFFER_SIZE) as f:
+            while True:
+                chunk = list(islice(associations, batch_size))
+                if not chunk:
+                    break
+                urls = [
+                    url
+                    for assoc in chunk
+                    for template in _get_port_templates(assoc['port'])
+                    if filter_url(url := template % assoc['host'])
+                ]
+                TargetExportService.write_lines(f, urls)
+                association_count += len(chunk)
+                total_urls += len(urls)
+                
                 logger.info("已处理 %d 条关联，生成 %d 个URL...", association_count, total_urls)
     
     logger.info(
@@ -117,7 +142,9 @@ def export_site_urls_task(
     # 默认值回退模式：使用 TargetExportService
     if total_urls == 0:
         export_service = TargetExportService(blacklist_service=blacklist_service)
-        total_urls = export_service._generate_default_urls(target_id, output_path)
+        total_urls = export_service.generate_default_urls(
+            target_id, output_path, target_name=target_name, target_type=target_type
+        )
     
     return {
         'success': True,
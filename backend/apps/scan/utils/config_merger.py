@@ -4,10 +4,13 @@
 提供多引擎 YAML 配置的冲突检测和合并功能。
 """
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import yaml
 
+# 优先使用 libyaml 的 C 实现，不可用时回退纯 Python 实现
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class ConfigConflictError(Exception):
     """配置冲突异常
@@ -25,6 +28,66 @@ class ConfigConflictError(Exception):
         super().__init__(f"扫描类型冲突: {msg}")
 
 
+def _top_level_keys(config_yaml: str) -> Optional[List]:
+    """
+    提取 YAML 文档的顶层键
+    
+    基于 yaml.parse 事件流，只记录顶层映射的键，不构造值的对象树。
+    遇到合并键（<<）、别名键、复杂键等需要完整构造才能确定键集合的情况时，回退到完整加载。
+    
+    返回:
+        顶层键列表（去重，保持出现顺序）；文档不是映射时返回 None
+    
+    异常:
+        yaml.YAMLError: YAML 无效或包含多个文档
+    """
+    keys = {}
+    depth = 0
+    node_count = 0  # 顶层映射内已完成的节点数，偶数位置是键
+    is_mapping = False
+    documents = 0
+    
+    for event in yaml.parse(config_yaml, Loader=YAML_LOADER):
+        if isinstance(event, yaml.DocumentStartEvent):
+            documents += 1
+            if documents > 1:
+                raise yaml.YAMLError("expected a single document in the stream")
+        elif isinstance(event, yaml.CollectionStartEvent):
+            if depth == 0:
+                is_mapping = isinstance(event, yaml.MappingStartEvent)
+                if not is_mapping:
+                    return None
+            elif depth == 1 and node_count % 2 == 0:
+                # 复杂键（映射/序列作为键）
+                return _load_top_level_keys(config_yaml)
+            depth += 1
+        elif isinstance(event, yaml.CollectionEndEvent):
+            depth -= 1
+            if depth == 1:
+                node_count += 1
+        elif isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)):
+            if depth == 0:
+                return None
+            if depth == 1:
+                if node_count % 2 == 0:
+                    if isinstance(event, yaml.AliasEvent) or (
+                        event.value == '<<' and event.implicit[0]
+                    ):
+                        return _load_top_level_keys(config_yaml)
+                    keys[event.value] = None
+                node_count += 1
+    
+    return list(keys) if is_mapping else None
+
+
+def _load_top_level_keys(config_yaml: str) -> Optional[List]:
+    """完整加载 YAML 后取顶层键（_top_level_keys 的回退路径）"""
+    parsed = yaml.load(config_yaml, Loader=YAML_LOADER)
+    if not isinstance(parsed, dict):
+        return None
+    return list(parsed.keys())
+
+
 def merge_engine_configs(engines: List[Tuple[str, str]]) -> str:
     """
     合并多个引擎的 YAML 配置。
@@ -53,20 +116,23 @@ def merge_engine_configs(engines: List[Tuple[str, str]]) -> str:
             continue
             
         try:
-            parsed = yaml.safe_load(config_yaml)
+            top_keys = _top_level_keys(config_yaml)
         except yaml.YAMLError:
             # 无效 YAML 跳过
             continue
             
-        if not isinstance(parsed, dict):
+        if top_keys is None:
             continue
             
-        # 检查顶层键冲突
-        for key in parsed.keys():
-            if key in key_to_engine:
-                conflicts.append((key, key_to_engine[key], engine_name))
-            else:
-                key_to_engine[key] = engine_name
+        # 检查顶层键冲突：与已登记键做集合交集（C 层实现），只有存在冲突时才逐键整理
+        duplicated = key_to_engine.keys() & top_keys
+        if duplicated:
+            conflicts.extend(
+                (key, key_to_engine[key], engine_name)
+                for key in top_keys if key in duplicated
+            )
+        # 登记新键，已登记的键保留最先定义它的引擎
+        key_to_engine = {**dict.fromkeys(top_keys, engine_name), **key_to_engine}
     
     if conflicts:
         raise ConfigConflictError(conflicts)
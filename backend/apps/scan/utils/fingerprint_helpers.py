@@ -2,383 +2,404 @@
 
 提供 Worker 侧的指纹文件缓存和版本校验功能，用于：
 - 指纹识别扫描 (fingerprint_detect_flow)
+
+各指纹库的缓存流程完全一致，只有 Service、缓存文件名和序列化格式不同，
+统一由 FINGERPRINT_LIBS 描述，_ensure_local 实现。
 """
 
-import json
+import fcntl
+import importlib
 import logging
+import mmap
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Optional
 
+import orjson
+import yaml
 from django.conf import settings
+from django.db import connection
 
 logger = logging.getLogger(__name__)
 
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@dataclass(frozen=True)
+class FingerprintLibSpec:
+    """指纹库缓存描述"""
+    label: str          # 日志中显示的名称
+    service_name: str   # apps.engine.services.fingerprints 中的 Service 类名
+    filename: str       # 缓存文件名（不支持 xattr 时版本文件为同名 .version）
+    serializer: str     # 'json': Service.write_export_json 流式写 JSON；'yaml': Service.export_to_yaml
 
-# 指纹库映射：lib_name → ensure_func_name
-FINGERPRINT_LIB_MAP = {
-    'ehole': 'ensure_ehole_fingerprint_local',
-    'goby': 'ensure_goby_fingerprint_local',
-    'wappalyzer': 'ensure_wappalyzer_fingerprint_local',
-    'fingers': 'ensure_fingers_fingerprint_local',
-    'fingerprinthub': 'ensure_fingerprinthub_fingerprint_local',
-    'arl': 'ensure_arl_fingerprint_local',
+
+FINGERPRINT_LIBS = {
+    'ehole': FingerprintLibSpec('EHole', 'EholeFingerprintService', 'ehole.json', 'json'),
+    'goby': FingerprintLibSpec('Goby', 'GobyFingerprintService', 'goby.json', 'json'),
+    'wappalyzer': FingerprintLibSpec('Wappalyzer', 'WappalyzerFingerprintService', 'wappalyzer.json', 'json'),
+    'fingers': FingerprintLibSpec('Fingers', 'FingersFingerprintService', 'fingers.json', 'json'),
+    'fingerprinthub': FingerprintLibSpec(
+        'FingerPrintHub', 'FingerPrintHubFingerprintService', 'fingerprinthub.json', 'json'
+    ),
+    'arl': FingerprintLibSpec('ARL', 'ARLFingerprintService', 'arl.yaml', 'yaml'),
 }
 
+# 进程内路径缓存：缓存文件名 → (version, path, 校验时间)
+# TTL 内直接返回路径，不再查询版本、不再读取版本文件
+_PATH_CACHE: dict[str, tuple[str, str, float]] = {}
+_PATH_CACHE_TTL = 30  # 秒
+_PATH_CACHE_LOCK = threading.Lock()
+
+# 版本号以扩展属性形式记录在缓存文件本身上；文件系统不支持 xattr 时回退到同名 .version 文件
+_VERSION_XATTR = 'user.xingrin.version'
 
-def ensure_ehole_fingerprint_local() -> str:
+# get_fingerprint_paths 并发准备指纹库的最大线程数
+_PATHS_MAX_WORKERS = 8
+
+# 已告警过的不支持的指纹库名称：配置错误时每个名称每个进程只告警一次
+_UNSUPPORTED_WARNED: set[str] = set()
+
+
+def _read_cached_version(cache_file: str, version_file: str, label: str) -> Optional[str]:
     """
-    确保本地存在最新的 EHole 指纹文件（带缓存）
-    
-    流程：
-    1. 获取当前指纹库版本
-    2. 检查缓存文件是否存在且版本匹配
-    3. 版本不匹配则重新导出
-    
+    读取缓存文件对应的版本号
+
+    优先一次 getxattr：缓存文件不存在时直接 ENOENT，不需要额外的 exists 检查；
+    属性不存在（旧版本写入的缓存）或文件系统不支持 xattr 时回退读取 .version 文件。
+
     Returns:
-        str: 本地指纹文件路径
-    
-    使用场景：
-        Worker 执行扫描任务前调用，获取最新指纹文件路径
+        版本号；缓存文件不存在或无法确定版本时返回 None
     """
-    from apps.engine.services.fingerprints import EholeFingerprintService
-    
-    service = EholeFingerprintService()
-    current_version = service.get_fingerprint_version()
-    
-    # 缓存目录和文件
-    base_dir = getattr(settings, 'FINGERPRINTS_BASE_PATH', '/opt/xingrin/fingerprints')
-    os.makedirs(base_dir, exist_ok=True)
-    cache_file = os.path.join(base_dir, 'ehole.json')
-    version_file = os.path.join(base_dir, 'ehole.version')
-    
-    # 检查缓存版本
-    cached_version = None
-    if os.path.exists(version_file):
-        try:
-            with open(version_file, 'r') as f:
-                cached_version = f.read().strip()
-        except OSError as e:
-            logger.warning("读取版本文件失败: %s", e)
-    
-    # 版本匹配，直接返回缓存
-    if cached_version == current_version and os.path.exists(cache_file):
-        logger.info("EHole 指纹文件缓存有效（版本匹配）: %s", cache_file)
-        return cache_file
-    
-    # 版本不匹配，重新导出
-    logger.info(
-        "EHole 指纹文件需要更新: cached=%s, current=%s",
-        cached_version, current_version
-    )
-    count = service.export_to_file(cache_file)
-    
-    # 写入版本文件
     try:
-        with open(version_file, 'w') as f:
-            f.write(current_version)
+        return os.getxattr(cache_file, _VERSION_XATTR).decode()
+    except FileNotFoundError:
+        return None
+    except AttributeError:
+        # 非 Linux 平台没有 os.getxattr，需要单独确认缓存文件存在
+        if not os.path.exists(cache_file):
+            return None
+    except OSError:
+        pass
+
+    try:
+        with open(version_file, 'r') as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
     except OSError as e:
-        logger.warning("写入版本文件失败: %s", e)
-    
-    logger.info("EHole 指纹文件已更新: %s", cache_file)
-    return cache_file
+        logger.warning("读取 %s 版本文件失败: %s", label, e)
+        return None
+
+
+def _set_version_xattr(path: str, version: str) -> bool:
+    """把版本号写入文件的扩展属性，文件系统或平台不支持时返回 False"""
+    try:
+        os.setxattr(path, _VERSION_XATTR, version.encode())
+        return True
+    except (AttributeError, OSError):
+        return False
 
 
-def ensure_goby_fingerprint_local() -> str:
+def _write_version_file(version_file: str, version: str, label: str) -> None:
+    """写 .version 文件（临时文件 + os.replace）"""
+    tmp_path = f"{version_file}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write(version)
+        os.replace(tmp_path, version_file)
+    except OSError as e:
+        logger.warning("写入 %s 版本文件失败: %s", label, e)
+        with suppress(OSError):
+            os.unlink(tmp_path)
+
+
+def _export_atomic(spec: FingerprintLibSpec, service, cache_file: str, version_file: str, version: str) -> None:
     """
-    确保本地存在最新的 Goby 指纹文件（带缓存）
-    
+    导出指纹到临时文件，打上版本后 os.replace 原子替换缓存文件
+
+    - 临时文件名带 pid，多个进程同时导出互不覆盖
+    - 不做 fsync：缓存随时可以重新导出，rename 已保证读取方不会看到半截文件
+    - 版本 xattr 在替换前写到临时文件上，内容和版本一起生效
+    """
+    tmp_path = f"{cache_file}.tmp.{os.getpid()}"
+    try:
+        if spec.serializer == 'yaml':
+            service.export_to_yaml(tmp_path)
+        else:
+            with open(tmp_path, 'wb', buffering=1 << 20) as f:
+                service.write_export_json(f)
+        has_xattr = _set_version_xattr(tmp_path, version)
+        os.replace(tmp_path, cache_file)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+    if not has_xattr:
+        _write_version_file(version_file, version, spec.label)
+
+
+@lru_cache(maxsize=None)
+def _ensure_base_dir(base_dir: str) -> str:
+    """创建指纹缓存目录，每个目录每个进程只 makedirs 一次"""
+    os.makedirs(base_dir, exist_ok=True)
+    return base_dir
+
+
+@lru_cache(maxsize=None)
+def _cache_paths(base_dir: str, filename: str) -> tuple[str, str, str]:
+    """缓存文件、版本文件、锁文件路径（按目录和文件名缓存，只拼接一次）"""
+    stem = os.path.join(base_dir, os.path.splitext(filename)[0])
+    return os.path.join(base_dir, filename), stem + '.version', stem + '.lock'
+
+
+def _remember_path(spec: FingerprintLibSpec, version: str, path: str) -> None:
+    """记录已校验的指纹文件路径到进程内缓存"""
+    with _PATH_CACHE_LOCK:
+        _PATH_CACHE[spec.filename] = (version, path, time.monotonic())
+
+
+def _get_service(spec: FingerprintLibSpec):
+    """延迟导入并实例化指纹 Service（避免模块导入时加载 engine app）"""
+    module = importlib.import_module('apps.engine.services.fingerprints')
+    return getattr(module, spec.service_name)()
+
+
+def _path_cache_fresh(spec: FingerprintLibSpec) -> bool:
+    """进程内路径缓存是否仍在 TTL 内"""
+    cached = _PATH_CACHE.get(spec.filename)
+    return cached is not None and time.monotonic() - cached[2] < _PATH_CACHE_TTL
+
+
+def _fetch_versions(lib_names: list) -> dict:
+    """一次数据库往返获取多个指纹库的当前版本：{lib_name: version}"""
+    module = importlib.import_module('apps.engine.services.fingerprints')
+    service_classes = [getattr(module, FINGERPRINT_LIBS[name].service_name) for name in lib_names]
+    return dict(zip(lib_names, module.get_fingerprint_versions(service_classes)))
+
+
+def _ensure_local(spec: FingerprintLibSpec, current_version: Optional[str] = None) -> str:
+    """
+    确保本地存在最新的指纹文件（带缓存）
+
+    流程：
+    1. 获取当前指纹库版本（调用方已批量查询时直接使用传入的 current_version）
+    2. 检查缓存文件是否存在且版本匹配
+    3. 版本不匹配则重新导出
+
     Returns:
         str: 本地指纹文件路径
     """
-    from apps.engine.services.fingerprints import GobyFingerprintService
-    
-    service = GobyFingerprintService()
-    current_version = service.get_fingerprint_version()
-    
-    # 缓存目录和文件
-    base_dir = getattr(settings, 'FINGERPRINTS_BASE_PATH', '/opt/xingrin/fingerprints')
-    os.makedirs(base_dir, exist_ok=True)
-    cache_file = os.path.join(base_dir, 'goby.json')
-    version_file = os.path.join(base_dir, 'goby.version')
-    
-    # 检查缓存版本
-    cached_version = None
-    if os.path.exists(version_file):
-        try:
-            with open(version_file, 'r') as f:
-                cached_version = f.read().strip()
-        except OSError as e:
-            logger.warning("读取 Goby 版本文件失败: %s", e)
-    
+    cached = _PATH_CACHE.get(spec.filename)
+    if cached and time.monotonic() - cached[2] < _PATH_CACHE_TTL:
+        return cached[1]
+
+    service = _get_service(spec)
+    if current_version is None:
+        current_version = service.get_fingerprint_version()
+
+    # 版本与进程内缓存一致：只确认文件仍在，跳过版本文件读取
+    if cached and cached[0] == current_version and os.path.exists(cached[1]):
+        _remember_path(spec, current_version, cached[1])
+        return cached[1]
+
+    # 缓存目录和文件（按当前配置值缓存 makedirs，测试中修改 settings 也能生效）
+    base_dir = _ensure_base_dir(getattr(settings, 'FINGERPRINTS_BASE_PATH', '/opt/xingrin/fingerprints'))
+    cache_file, version_file, lock_file = _cache_paths(base_dir, spec.filename)
+
+    # 检查缓存版本（缓存文件不存在时为 None）
+    cached_version = _read_cached_version(cache_file, version_file, spec.label)
+
     # 版本匹配，直接返回缓存
-    if cached_version == current_version and os.path.exists(cache_file):
-        logger.info("Goby 指纹文件缓存有效（版本匹配）: %s", cache_file)
+    if cached_version == current_version:
+        logger.debug("%s 指纹文件缓存有效（版本匹配）: %s", spec.label, cache_file)
+        _remember_path(spec, current_version, cache_file)
         return cache_file
-    
-    # 版本不匹配，重新导出
-    logger.info(
-        "Goby 指纹文件需要更新: cached=%s, current=%s",
-        cached_version, current_version
-    )
-    # Goby 导出格式是数组，直接写入
-    data = service.get_export_data()
-    with open(cache_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False)
-    
-    # 写入版本文件
-    try:
-        with open(version_file, 'w') as f:
-            f.write(current_version)
-    except OSError as e:
-        logger.warning("写入 Goby 版本文件失败: %s", e)
-    
-    logger.info("Goby 指纹文件已更新: %s", cache_file)
+
+    # 版本不匹配，加文件锁后重新导出：多个 Worker 进程同时启动时只有一个执行导出，
+    # 其余进程等锁释放后重新检查版本，直接复用结果
+    with open(lock_file, 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+
+        cached_version = _read_cached_version(cache_file, version_file, spec.label)
+        if cached_version == current_version:
+            logger.info("%s 指纹文件已由其他进程更新: %s", spec.label, cache_file)
+            _remember_path(spec, current_version, cache_file)
+            return cache_file
+
+        logger.info(
+            "%s 指纹文件需要更新: cached=%s, current=%s",
+            spec.label, cached_version, current_version
+        )
+        _export_atomic(spec, service, cache_file, version_file, current_version)
+
+    logger.info("%s 指纹文件已更新: %s", spec.label, cache_file)
+    _remember_path(spec, current_version, cache_file)
     return cache_file
 
 
-def ensure_wappalyzer_fingerprint_local() -> str:
+def ensure_ehole_fingerprint_local(current_version: Optional[str] = None) -> str:
     """
-    确保本地存在最新的 Wappalyzer 指纹文件（带缓存）
-    
+    确保本地存在最新的 EHole 指纹文件（带缓存）
+
+    Args:
+        current_version: 已批量查询到的当前版本，None 时由 Service 查询
+
     Returns:
         str: 本地指纹文件路径
+
+    使用场景：
+        Worker 执行扫描任务前调用，获取最新指纹文件路径
     """
-    from apps.engine.services.fingerprints import WappalyzerFingerprintService
-    
-    service = WappalyzerFingerprintService()
-    current_version = service.get_fingerprint_version()
-    
-    # 缓存目录和文件
-    base_dir = getattr(settings, 'FINGERPRINTS_BASE_PATH', '/opt/xingrin/fingerprints')
-    os.makedirs(base_dir, exist_ok=True)
-    cache_file = os.path.join(base_dir, 'wappalyzer.json')
-    version_file = os.path.join(base_dir, 'wappalyzer.version')
-    
-    # 检查缓存版本
-    cached_version = None
-    if os.path.exists(version_file):
-        try:
-            with open(version_file, 'r') as f:
-                cached_version = f.read().strip()
-        except OSError as e:
-            logger.warning("读取 Wappalyzer 版本文件失败: %s", e)
-    
-    # 版本匹配，直接返回缓存
-    if cached_version == current_version and os.path.exists(cache_file):
-        logger.info("Wappalyzer 指纹文件缓存有效（版本匹配）: %s", cache_file)
-        return cache_file
-    
-    # 版本不匹配，重新导出
-    logger.info(
-        "Wappalyzer 指纹文件需要更新: cached=%s, current=%s",
-        cached_version, current_version
-    )
-    # Wappalyzer 导出格式是 {"apps": {...}}
-    data = service.get_export_data()
-    with open(cache_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False)
-    
-    # 写入版本文件
+    return _ensure_local(FINGERPRINT_LIBS['ehole'], current_version)
+
+
+def ensure_goby_fingerprint_local(current_version: Optional[str] = None) -> str:
+    """确保本地存在最新的 Goby 指纹文件（带缓存），返回本地文件路径"""
+    return _ensure_local(FINGERPRINT_LIBS['goby'], current_version)
+
+
+def ensure_wappalyzer_fingerprint_local(current_version: Optional[str] = None) -> str:
+    """确保本地存在最新的 Wappalyzer 指纹文件（带缓存），返回本地文件路径"""
+    return _ensure_local(FINGERPRINT_LIBS['wappalyzer'], current_version)
+
+
+def ensure_fingers_fingerprint_local(current_version: Optional[str] = None) -> str:
+    """确保本地存在最新的 Fingers 指纹文件（带缓存），返回本地文件路径"""
+    return _ensure_local(FINGERPRINT_LIBS['fingers'], current_version)
+
+
+def ensure_fingerprinthub_fingerprint_local(current_version: Optional[str] = None) -> str:
+    """确保本地存在最新的 FingerPrintHub 指纹文件（带缓存），返回本地文件路径"""
+    return _ensure_local(FINGERPRINT_LIBS['fingerprinthub'], current_version)
+
+
+def ensure_arl_fingerprint_local(current_version: Optional[str] = None) -> str:
+    """确保本地存在最新的 ARL 指纹文件（带缓存），返回本地文件路径（YAML 格式）"""
+    return _ensure_local(FINGERPRINT_LIBS['arl'], current_version)
+
+
+# 指纹库映射：lib_name → ensure 函数
+FINGERPRINT_LIB_MAP: dict[str, Callable[..., str]] = {
+    'ehole': ensure_ehole_fingerprint_local,
+    'goby': ensure_goby_fingerprint_local,
+    'wappalyzer': ensure_wappalyzer_fingerprint_local,
+    'fingers': ensure_fingers_fingerprint_local,
+    'fingerprinthub': ensure_fingerprinthub_fingerprint_local,
+    'arl': ensure_arl_fingerprint_local,
+}
+
+
+def _try_ensure(lib_name: str, ensure: Callable[..., str], current_version: Optional[str] = None) -> Optional[str]:
+    """准备单个指纹库，失败时记录日志并返回 None"""
     try:
-        with open(version_file, 'w') as f:
-            f.write(current_version)
-    except OSError as e:
-        logger.warning("写入 Wappalyzer 版本文件失败: %s", e)
-    
-    logger.info("Wappalyzer 指纹文件已更新: %s", cache_file)
-    return cache_file
+        return ensure(current_version)
+    except Exception as e:
+        logger.error("获取指纹库 %s 路径失败: %s", lib_name, e)
+        return None
+
+
+def _try_ensure_in_thread(
+    lib_name: str, ensure: Callable[..., str], current_version: Optional[str] = None
+) -> Optional[str]:
+    """线程池中执行 _try_ensure，结束时关闭本线程的数据库连接"""
+    try:
+        return _try_ensure(lib_name, ensure, current_version)
+    finally:
+        connection.close()
 
 
 def get_fingerprint_paths(lib_names: list) -> dict:
     """
     获取多个指纹库的本地路径
-    
+
+    路径缓存过期的指纹库先用一条 SQL 批量查询版本，再用线程池并发校验/导出，
+    冷缓存时总耗时由各库耗时之和降为最慢的一个。
+
     Args:
         lib_names: 指纹库名称列表，如 ['ehole', 'goby']
-        
+
     Returns:
         dict: {lib_name: local_path}，如 {'ehole': '/opt/xingrin/fingerprints/ehole.json'}
-        
+
     示例：
         paths = get_fingerprint_paths(['ehole'])
         # {'ehole': '/opt/xingrin/fingerprints/ehole.json'}
     """
-    paths = {}
+    ensurers = {}
     for lib_name in lib_names:
-        if lib_name not in FINGERPRINT_LIB_MAP:
-            logger.warning("不支持的指纹库: %s，跳过", lib_name)
+        ensure = FINGERPRINT_LIB_MAP.get(lib_name)
+        if ensure is None:
+            if lib_name not in _UNSUPPORTED_WARNED:
+                _UNSUPPORTED_WARNED.add(lib_name)
+                logger.warning("不支持的指纹库: %s，跳过", lib_name)
             continue
-        
-        ensure_func_name = FINGERPRINT_LIB_MAP[lib_name]
-        # 获取当前模块中的函数
-        ensure_func = globals().get(ensure_func_name)
-        if ensure_func is None:
-            logger.warning("指纹库 %s 的导出函数 %s 未实现，跳过", lib_name, ensure_func_name)
-            continue
-        
+        ensurers[lib_name] = ensure
+
+    # 只为路径缓存过期的指纹库批量查询版本；失败时退回各库单独查询
+    versions = {}
+    stale = [name for name in ensurers if not _path_cache_fresh(FINGERPRINT_LIBS[name])]
+    if len(stale) > 1:
         try:
-            paths[lib_name] = ensure_func()
+            versions = _fetch_versions(stale)
         except Exception as e:
-            logger.error("获取指纹库 %s 路径失败: %s", lib_name, e)
-            continue
-    
-    return paths
+            logger.warning("批量查询指纹库版本失败，改为逐个查询: %s", e)
 
+    current_versions = [versions.get(name) for name in ensurers]
+    if len(ensurers) <= 1:
+        results = list(map(_try_ensure, ensurers.keys(), ensurers.values(), current_versions))
+    else:
+        # 每个线程使用独立的数据库连接，由 _try_ensure_in_thread 负责关闭
+        with ThreadPoolExecutor(max_workers=min(_PATHS_MAX_WORKERS, len(ensurers))) as executor:
+            results = list(executor.map(
+                _try_ensure_in_thread, ensurers.keys(), ensurers.values(), current_versions
+            ))
 
-def ensure_fingers_fingerprint_local() -> str:
-    """
-    确保本地存在最新的 Fingers 指纹文件（带缓存）
-    
-    Returns:
-        str: 本地指纹文件路径
-    """
-    from apps.engine.services.fingerprints import FingersFingerprintService
-    
-    service = FingersFingerprintService()
-    current_version = service.get_fingerprint_version()
-    
-    # 缓存目录和文件
-    base_dir = getattr(settings, 'FINGERPRINTS_BASE_PATH', '/opt/xingrin/fingerprints')
-    os.makedirs(base_dir, exist_ok=True)
-    cache_file = os.path.join(base_dir, 'fingers.json')
-    version_file = os.path.join(base_dir, 'fingers.version')
-    
-    # 检查缓存版本
-    cached_version = None
-    if os.path.exists(version_file):
-        try:
-            with open(version_file, 'r') as f:
-                cached_version = f.read().strip()
-        except OSError as e:
-            logger.warning("读取 Fingers 版本文件失败: %s", e)
-    
-    # 版本匹配，直接返回缓存
-    if cached_version == current_version and os.path.exists(cache_file):
-        logger.info("Fingers 指纹文件缓存有效（版本匹配）: %s", cache_file)
-        return cache_file
-    
-    # 版本不匹配，重新导出
-    logger.info(
-        "Fingers 指纹文件需要更新: cached=%s, current=%s",
-        cached_version, current_version
-    )
-    data = service.get_export_data()
-    with open(cache_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False)
-    
-    # 写入版本文件
-    try:
-        with open(version_file, 'w') as f:
-            f.write(current_version)
-    except OSError as e:
-        logger.warning("写入 Fingers 版本文件失败: %s", e)
-    
-    logger.info("Fingers 指纹文件已更新: %s", cache_file)
-    return cache_file
+    return {
+        lib_name: path
+        for lib_name, path in zip(ensurers, results)
+        if path is not None
+    }
 
 
-def ensure_fingerprinthub_fingerprint_local() -> str:
-    """
-    确保本地存在最新的 FingerPrintHub 指纹文件（带缓存）
-    
-    Returns:
-        str: 本地指纹文件路径
+
+def load_fingerprint(lib_name: str) -> Any:
     """
-    from apps.engine.services.fingerprints import FingerPrintHubFingerprintService
-    
-    service = FingerPrintHubFingerprintService()
-    current_version = service.get_fingerprint_version()
-    
-    # 缓存目录和文件
-    base_dir = getattr(settings, 'FINGERPRINTS_BASE_PATH', '/opt/xingrin/fingerprints')
-    os.makedirs(base_dir, exist_ok=True)
-    cache_file = os.path.join(base_dir, 'fingerprinthub.json')
-    version_file = os.path.join(base_dir, 'fingerprinthub.version')
-    
-    # 检查缓存版本
-    cached_version = None
-    if os.path.exists(version_file):
-        try:
-            with open(version_file, 'r') as f:
-                cached_version = f.read().strip()
-        except OSError as e:
-            logger.warning("读取 FingerPrintHub 版本文件失败: %s", e)
-    
-    # 版本匹配，直接返回缓存
-    if cached_version == current_version and os.path.exists(cache_file):
-        logger.info("FingerPrintHub 指纹文件缓存有效（版本匹配）: %s", cache_file)
-        return cache_file
-    
-    # 版本不匹配，重新导出
-    logger.info(
-        "FingerPrintHub 指纹文件需要更新: cached=%s, current=%s",
-        cached_version, current_version
-    )
-    data = service.get_export_data()
-    with open(cache_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False)
-    
-    # 写入版本文件
-    try:
-        with open(version_file, 'w') as f:
-            f.write(current_version)
-    except OSError as e:
-        logger.warning("写入 FingerPrintHub 版本文件失败: %s", e)
-    
-    logger.info("FingerPrintHub 指纹文件已更新: %s", cache_file)
-    return cache_file
+    确保本地缓存最新并加载指纹库内容
 
+    只读 mmap 缓存文件直接交给解析器：JSON 由 orjson 从映射内存解析，
+    ARL 的 YAML 由 C Loader 从 mmap 读取，不再先把整个文件读成 bytes/str。
+
+    Args:
+        lib_name: 指纹库名称，如 'ehole'
 
-def ensure_arl_fingerprint_local() -> str:
-    """
-    确保本地存在最新的 ARL 指纹文件（带缓存）
-    
     Returns:
-        str: 本地指纹文件路径（YAML 格式）
+        解析后的指纹数据（JSON 库为 dict/list，ARL 为 list）
+
+    Raises:
+        ValueError: 不支持的指纹库
     """
-    import yaml
-    from apps.engine.services.fingerprints import ARLFingerprintService
-    
-    service = ARLFingerprintService()
-    current_version = service.get_fingerprint_version()
-    
-    # 缓存目录和文件
-    base_dir = getattr(settings, 'FINGERPRINTS_BASE_PATH', '/opt/xingrin/fingerprints')
-    os.makedirs(base_dir, exist_ok=True)
-    cache_file = os.path.join(base_dir, 'arl.yaml')
-    version_file = os.path.join(base_dir, 'arl.version')
-    
-    # 检查缓存版本
-    cached_version = None
-    if os.path.exists(version_file):
-        try:
-            with open(version_file, 'r') as f:
-                cached_version = f.read().strip()
-        except OSError as e:
-            logger.warning("读取 ARL 版本文件失败: %s", e)
-    
-    # 版本匹配，直接返回缓存
-    if cached_version == current_version and os.path.exists(cache_file):
-        logger.info("ARL 指纹文件缓存有效（版本匹配）: %s", cache_file)
-        return cache_file
-    
-    # 版本不匹配，重新导出
-    logger.info(
-        "ARL 指纹文件需要更新: cached=%s, current=%s",
-        cached_version, current_version
-    )
-    data = service.get_export_data()
-    with open(cache_file, 'w', encoding='utf-8') as f:
-        yaml.dump(data, f, allow_unicode=True, default_flow_style=False)
-    
-    # 写入版本文件
-    try:
-        with open(version_file, 'w') as f:
-            f.write(current_version)
-    except OSError as e:
-        logger.warning("写入 ARL 版本文件失败: %s", e)
-    
-    logger.info("ARL 指纹文件已更新: %s", cache_file)
-    return cache_file
+    ensure = FINGERPRINT_LIB_MAP.get(lib_name)
+    if ensure is None:
+        raise ValueError(f"不支持的指纹库: {lib_name}")
+    path = ensure()
+    is_yaml = FINGERPRINT_LIBS[lib_name].serializer == 'yaml'
+
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # 空文件无法 mmap；JSON 空文件本身不合法，交给 orjson 抛出解析错误
+            return [] if is_yaml else orjson.loads(b'')
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if is_yaml:
+                return yaml.load(mm, Loader=YAML_LOADER) or []
+            with memoryview(mm) as view:
+                return orjson.loads(view)
 
 
 __all__ = [
@@ -389,5 +410,7 @@ __all__ = [
     "ensure_fingerprinthub_fingerprint_local",
     "ensure_arl_fingerprint_local",
     "get_fingerprint_paths",
+    "load_fingerprint",
     "FINGERPRINT_LIB_MAP",
+    "FINGERPRINT_LIBS",
 ]
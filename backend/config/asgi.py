@@ -15,6 +15,9 @@ from channels.auth import AuthMiddlewareStack
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
+# 标记为 Web 服务进程：只有服务进程才启动定时调度器（见 EngineConfig.ready）
+os.environ.setdefault('XINGRIN_START_SCHEDULER', '1')
+
 # 初始化 Django ASGI 应用（必须在导入路由之前）
 django_asgi_app = get_asgi_application()
 
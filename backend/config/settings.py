@@ -200,7 +200,7 @@ REST_FRAMEWORK = {
     
     # JSON 命名格式转换：后端 snake_case ↔ 前端 camelCase
     'DEFAULT_RENDERER_CLASSES': (
-        'djangorestframework_camel_case.render.CamelCaseJSONRenderer',  # 响应数据转换为 camelCase
+        'apps.common.renderers.CamelCaseORJSONRenderer',  # 响应数据转换为 camelCase（orjson 编码）
         'djangorestframework_camel_case.render.CamelCaseBrowsableAPIRenderer',  # 浏览器 API 也使用 camelCase
     ),
     'DEFAULT_PARSER_CLASSES': (
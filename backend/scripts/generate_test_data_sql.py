@@ -22,10 +22,15 @@
 """
 
 import argparse
+import io
+import multiprocessing
 import random
 import json
 import os
+import struct
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from itertools import islice
 from decimal import Decimal
 from pathlib import Path
 
@@ -202,17 +207,307 @@ def generate_raw_response_headers(headers_dict: dict) -> str:
     return '\r\n'.join(lines)
 
 
+# 百万级模式每批生成并提交的行数：行按块惰性生成，内存峰值与总量无关
+MILLION_BATCH_SIZE = 10000
+
+# COPY 每次发送的行数：缓冲区按块写入并清空，内存占用与总行数无关
+COPY_CHUNK_SIZE = 50000
+
+# COPY text 格式需要转义的字符
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def to_copy_field(value) -> str:
+    """
+    把 Python 值转换为 COPY text 格式的字段
+
+    None → \\N，bool → t/f，list → PostgreSQL 数组字面量，其余按 str() 输出后转义
+    """
+    if value is None:
+        return '\\N'
+    if value is True:
+        return 't'
+    if value is False:
+        return 'f'
+    if isinstance(value, list):
+        value = '{' + ','.join(
+            '"' + str(item).replace('\\', '\\\\').replace('"', '\\"') + '"' for item in value
+        ) + '}'
+    else:
+        value = str(value)
+    return value.translate(_COPY_ESCAPES)
+
+
+# COPY binary 格式的文件头：签名 + flags + 头扩展长度
+_COPY_BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+_COPY_BINARY_TRAILER = struct.pack('>h', -1)
+_NULL_FIELD = struct.pack('>i', -1)
+
+
+# 目标列类型 → binary 临时表列类型：整数/浮点/布尔按原生二进制传输，其余一律以 text 传输
+_BINARY_STAGE_TYPES = {
+    'bigint': 'int8',
+    'integer': 'int8',
+    'smallint': 'int8',
+    'double precision': 'float8',
+    'real': 'float8',
+    'boolean': 'bool',
+}
+
+
+def _binary_stage_type(target_type: str) -> str:
+    """按目标表列类型确定 binary 临时表的列类型"""
+    return _BINARY_STAGE_TYPES.get(target_type, 'text')
+
+
+def _binary_encoder(column: str, target_type: str, stage_type: str):
+    """
+    返回把 Python 值编码为 COPY binary 字段（长度 + 数据）的函数
+
+    值类型与列类型不符时抛出 TypeError 并指明列名，不会静默写入错误数据。
+    """
+    def mismatch(value):
+        return TypeError(
+            f"列 {column}（{target_type}）不支持 {type(value).__name__} 类型的值: {value!r}"
+        )
+    
+    if stage_type == 'bool':
+        def encode_bool(value):
+            if type(value) is not bool:
+                raise mismatch(value)
+            return struct.pack('>i?', 1, value)
+        return encode_bool
+    if stage_type in ('int8', 'float8'):
+        packer = struct.Struct('>iq' if stage_type == 'int8' else '>id')
+        
+        def encode_number(value):
+            try:
+                return packer.pack(8, value)
+            except struct.error:
+                raise mismatch(value) from None
+        return encode_number
+    
+    is_json = target_type in ('json', 'jsonb')
+    
+    def encode_text(value):
+        if is_json:
+            if not isinstance(value, str):
+                value = json.dumps(value, ensure_ascii=False)
+        elif isinstance(value, list):
+            value = '{' + ','.join(
+                '"' + str(item).replace('\\', '\\\\').replace('"', '\\"') + '"' for item in value
+            ) + '}'
+        elif isinstance(value, dict):
+            raise mismatch(value)
+        data = str(value).encode()
+        return struct.pack('>i', len(data)) + data
+    return encode_text
+
+
+def _copy_binary(cur, table: str, stage: str, columns: list, rows) -> dict:
+    """
+    以 COPY binary 格式写入临时表
+
+    临时表列类型由目标表列类型决定（整数 → int8、浮点 → float8、布尔 → bool、其余 → text），
+    INSERT ... SELECT 时再显式转换为目标表的列类型。
+
+    Returns:
+        dict: 列名 → 目标表列类型
+    """
+    cur.execute("""
+        SELECT attname, format_type(atttypid, atttypmod) FROM pg_attribute
+        WHERE attrelid = %s::regclass AND attname = ANY(%s)
+    """, (table, columns))
+    target_types = dict(cur.fetchall())
+    stage_types = [_binary_stage_type(target_types[col]) for col in columns]
+    cur.execute(
+        f"CREATE TEMP TABLE {stage} ("
+        + ', '.join(f'{col} {stage_type}' for col, stage_type in zip(columns, stage_types))
+        + ") ON COMMIT DROP"
+    )
+    
+    encoders = [
+        _binary_encoder(col, target_types[col], stage_type)
+        for col, stage_type in zip(columns, stage_types)
+    ]
+    field_count = struct.pack('>h', len(columns))
+    for chunk in chunked(rows, COPY_CHUNK_SIZE):
+        buffer = io.BytesIO()
+        buffer.write(_COPY_BINARY_HEADER)
+        for row in chunk:
+            buffer.write(field_count)
+            for encode, value in zip(encoders, row):
+                buffer.write(_NULL_FIELD if value is None else encode(value))
+        buffer.write(_COPY_BINARY_TRAILER)
+        buffer.seek(0)
+        cur.copy_expert(f"COPY {stage} ({', '.join(columns)}) FROM STDIN WITH (FORMAT binary)", buffer)
+    return target_types
+
+
+def _copy_text(cur, table: str, stage: str, columns: list, rows):
+    """以 COPY text 格式写入与目标表同列类型的临时表"""
+    column_list = ', '.join(columns)
+    cur.execute(
+        f"CREATE TEMP TABLE {stage} ON COMMIT DROP AS "
+        f"SELECT {column_list} FROM {table} WITH NO DATA"
+    )
+    buffer = io.StringIO()
+    for chunk in chunked(rows, COPY_CHUNK_SIZE):
+        for row in chunk:
+            buffer.write('\t'.join(map(to_copy_field, row)))
+            buffer.write('\n')
+        buffer.seek(0)
+        cur.copy_expert(f"COPY {stage} ({column_list}) FROM STDIN", buffer)
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def copy_rows(cur, table: str, columns: list, rows, extra: dict = None,
+              conflict: str = 'ON CONFLICT DO NOTHING', returning: bool = False,
+              binary: bool = False):
+    """
+    使用 COPY 批量写入：rows 分块 COPY 到临时表，再 INSERT ... SELECT 到目标表
+
+    经临时表中转以保留 ON CONFLICT 语义（COPY 本身遇到冲突会整体失败）。
+
+    Args:
+        cur: 游标
+        table: 目标表名
+        columns: rows 中每个元组对应的列
+        rows: 行元组的可迭代对象（可以是生成器，按块消费）
+        extra: 不由 rows 提供的列 → SQL 表达式，默认 {'created_at': 'NOW()'}（rows 已提供 created_at 时忽略）
+        conflict: 冲突处理子句，为空时不加
+        returning: 为 True 时返回插入行的 id 列表，否则返回插入行数
+        binary: 使用 COPY binary 格式，整数/浮点列免去文本格式化和服务端解析，适合数值列多的表
+    """
+    if extra is None:
+        extra = {'created_at': 'NOW()'}
+    extra = {col: expr for col, expr in extra.items() if col not in columns}
+    stage = f'{table}_copy_stage'
+    
+    if binary:
+        target_types = _copy_binary(cur, table, stage, columns, rows)
+        # 临时表列类型与目标表不同，按目标列类型显式转换
+        selected = [f'{col}::{target_types[col]}' for col in columns]
+    else:
+        _copy_text(cur, table, stage, columns, rows)
+        selected = list(columns)
+    
+    target_columns = ', '.join([*columns, *extra])
+    select_list = ', '.join([*selected, *extra.values()])
+    cur.execute(
+        f"INSERT INTO {table} ({target_columns}) "
+        f"SELECT {select_list} FROM {stage} {conflict}"
+        + (" RETURNING id" if returning else "")
+    )
+    result = [row[0] for row in cur.fetchall()] if returning else cur.rowcount
+    cur.execute(f"DROP TABLE {stage}")
+    return result
+
+
+def sql_pick(param: str) -> str:
+    """生成从数组参数 %(param)s 中随机取一个元素的 SQL 表达式（每行独立取值）"""
+    return f"(%({param})s)[1 + floor(random() * cardinality(%({param})s))::int]"
+
+
+def chunked(iterable, size: int):
+    """把可迭代对象按 size 切块，逐块产出列表（惰性消费，内存占用只与块大小有关）"""
+    it = iter(iterable)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
 DB_CONFIG = get_db_config()
 
+# Worker 节点所在区域
+WORKER_REGIONS = ('asia-singapore-1', 'asia-singapore-2', 'asia-tokyo-1', 'asia-tokyo-2', 'asia-hongkong-1',
+                  'asia-mumbai-1', 'asia-seoul-1', 'asia-sydney-1', 'asia-jakarta-1', 'asia-osaka-1',
+                  'europe-frankfurt-1', 'europe-frankfurt-2', 'europe-london-1', 'europe-london-2',
+                  'europe-paris-1', 'europe-ireland-1', 'europe-stockholm-1', 'europe-milan-1',
+                  'us-east-virginia-1', 'us-east-virginia-2', 'us-east-ohio-1', 'us-west-oregon-1',
+                  'us-west-oregon-2', 'us-west-california-1', 'us-central-iowa-1',
+                  'australia-sydney-1', 'australia-melbourne-1', 'brazil-saopaulo-1',
+                  'canada-montreal-1', 'southafrica-capetown-1', 'middleeast-bahrain-1')
+
+# 扫描引擎模板：(名称前缀, 配置模板)
+ENGINE_TEMPLATES = (
+    ('Full-Comprehensive-Security-Assessment-Enterprise-Grade-Vulnerability-Detection-System', 'subdomain_discovery:\n  enabled: true\n  tools: [subfinder, amass, findomain, assetfinder, chaos]\n  timeout: {timeout}\n  resolvers: [8.8.8.8, 1.1.1.1, 9.9.9.9]\nvulnerability_scanning:\n  enabled: true\n  nuclei:\n    severity: critical,high,medium,low,info\n    rate_limit: {rate}\n    concurrency: {conc}\n    templates: [cves, vulnerabilities, exposures, misconfigurations, default-logins]'),
+    ('Quick-Reconnaissance-Fast-Discovery-Lightweight-Asset-Enumeration', 'subdomain_discovery:\n  enabled: true\n  tools: [subfinder, assetfinder]\n  timeout: {timeout}\n  passive_only: true\nport_scanning:\n  enabled: true\n  top_ports: {ports}\n  rate: {rate}'),
+    ('Deep-Vulnerability-Assessment-Extended-Security-Analysis-Framework', 'vulnerability_scanning:\n  enabled: true\n  nuclei:\n    severity: critical,high,medium,low,info\n    templates: [cves, vulnerabilities, exposures, misconfigurations, default-logins, takeovers]\n    rate_limit: {rate}\n    concurrency: {conc}\n  dalfox:\n    enabled: true\n    blind_xss: true\n  sqlmap:\n    enabled: true\n    level: 3\n    risk: 2'),
+    ('Passive-Information-Gathering-OSINT-Intelligence-Collection-Platform', 'subdomain_discovery:\n  enabled: true\n  passive_only: true\n  sources: [crtsh, hackertarget, threatcrowd, virustotal, securitytrails, shodan, censys, binaryedge]\n  timeout: {timeout}\n  dns_bruteforce: false'),
+    ('Web-Application-Security-Scanner-OWASP-Compliance-Testing-Suite', 'web_discovery:\n  enabled: true\n  httpx:\n    threads: {conc}\n    follow_redirects: true\n    screenshot: true\nvulnerability_scanning:\n  enabled: true\n  dalfox:\n    enabled: true\n    blind_xss: true\n  nuclei:\n    templates: [cves, vulnerabilities, exposures]'),
+    ('API-Endpoint-Security-Audit-RESTful-GraphQL-Assessment-Tool', 'endpoint_discovery:\n  enabled: true\n  katana:\n    depth: {depth}\n    concurrency: {conc}\n    js_crawl: true\n    automatic_form_fill: true\nvulnerability_scanning:\n  enabled: true\n  nuclei:\n    templates: [exposures, misconfigurations]'),
+    ('Infrastructure-Port-Scanner-Network-Service-Detection-Engine', 'port_scanning:\n  enabled: true\n  naabu:\n    top_ports: {ports}\n    rate: {rate}\n    scan_all_ips: true\n  service_detection: true\n  version_detection: true\n  os_detection: true'),
+    ('Directory-Bruteforce-Engine-Content-Discovery-Fuzzing-Platform', 'directory_bruteforce:\n  enabled: true\n  ffuf:\n    threads: {conc}\n    wordlist: [common.txt, raft-large-directories.txt, raft-large-files.txt]\n    recursion_depth: {depth}\n    extensions: [php, asp, aspx, jsp, html, js, json, xml]'),
+    ('Cloud-Infrastructure-Security-Assessment-AWS-Azure-GCP-Scanner', 'cloud_scanning:\n  enabled: true\n  providers: [aws, azure, gcp]\n  services: [s3, ec2, rds, lambda, storage, compute, sql]\n  misconfigurations: true\n  public_exposure: true'),
+    ('Container-Security-Scanner-Kubernetes-Docker-Vulnerability-Detector', 'container_scanning:\n  enabled: true\n  kubernetes:\n    enabled: true\n    rbac_audit: true\n    network_policies: true\n  docker:\n    enabled: true\n    image_scanning: true\n    dockerfile_lint: true'),
+    ('Mobile-Application-Security-Testing-iOS-Android-Assessment-Framework', 'mobile_scanning:\n  enabled: true\n  platforms: [ios, android]\n  static_analysis: true\n  dynamic_analysis: true\n  api_testing: true\n  ssl_pinning_bypass: true'),
+    ('Compliance-Audit-Scanner-PCI-DSS-HIPAA-SOC2-Assessment-Tool', 'compliance_scanning:\n  enabled: true\n  frameworks: [pci-dss, hipaa, soc2, gdpr, iso27001]\n  automated_reporting: true\n  evidence_collection: true'),
+)
+
+# 组织模板：(名称前缀, 描述)
+ORG_TEMPLATES = (
+    ('Acme Corporation', '全球领先的技术解决方案提供商，专注于企业级软件开发、云计算服务和网络安全解决方案。公司成立于1995年，总部位于硅谷，在全球50多个国家设有分支机构，员工超过10万人，年营收超过500亿美元。'),
+    ('TechStart Innovation Labs', '专注于人工智能、机器学习和区块链技术研发的创新实验室。拥有超过200名博士级研究人员，与全球顶尖大学建立了深度合作关系，已获得超过500项技术专利。'),
+    ('Global Financial Services', '提供全方位数字银行服务的金融科技公司，包括移动支付、在线贷款、投资理财等服务。服务覆盖全球180个国家和地区，注册用户超过5亿，日均交易额超过100亿美元。'),
+    ('HealthCare Plus Medical', '医疗信息化解决方案提供商，专注于电子病历系统、医院信息管理系统和远程医疗平台开发。产品已部署在全球3000多家医疗机构，服务超过1亿患者。'),
+    ('E-Commerce Mega Platform', '亚太地区最大的电子商务平台之一，提供 B2B、B2C 和 C2C 多种交易模式。平台入驻商家超过500万，SKU数量超过10亿，日均订单量超过5000万单。'),
+    ('Smart City Infrastructure', '智慧城市基础设施解决方案提供商，专注于物联网传感器网络、智能交通系统、城市大脑平台开发。已在全球100多个城市部署智慧城市解决方案，管理超过1000万个IoT设备。'),
+    ('Educational Technology', '在线教育技术联盟，提供 K-12 和高等教育在线学习平台。平台拥有超过10万门课程，注册学员超过1亿人，与全球500多所知名大学建立了合作关系。'),
+    ('Green Energy Solutions', '可再生能源管理系统提供商，专注于太阳能、风能发电站的监控、调度和优化管理。管理的清洁能源装机容量超过100GW，每年减少碳排放超过5000万吨。'),
+    ('CyberSec Defense Corp', '网络安全防御公司，提供渗透测试、漏洞评估和安全咨询服务。拥有超过1000名认证安全专家，服务全球500强企业中的300多家，年处理安全事件超过100万起。'),
+    ('CloudNative Systems', '云原生系统开发商，专注于 Kubernetes、微服务架构和 DevOps 工具链。产品被全球超过10万家企业采用，管理的容器实例超过1亿个，是CNCF的核心贡献者。'),
+    ('DataFlow Analytics', '大数据分析平台，提供实时数据处理、商业智能和预测分析服务。平台日处理数据量超过100PB，支持超过1000种数据源接入，服务全球5000多家企业客户。'),
+    ('MobileFirst Technologies', '移动优先技术公司，专注于 iOS/Android 应用开发和跨平台解决方案。已开发超过5000款移动应用，累计下载量超过50亿次，月活跃用户超过10亿。'),
+    ('Quantum Computing Research', '量子计算研究机构，致力于量子算法、量子纠错和量子网络的前沿研究。拥有全球最先进的量子计算机之一，已实现1000+量子比特的稳定运算。'),
+    ('Autonomous Vehicles Corp', '自动驾驶技术公司，专注于L4/L5级别自动驾驶系统研发。测试车队已累计行驶超过1亿公里，在全球20个城市开展商业化运营。'),
+    ('Biotech Innovations', '生物技术创新企业，专注于基因编辑、细胞治疗和精准医疗。拥有超过100项生物技术专利，多款创新药物已进入临床试验阶段。'),
+    ('Space Technology Systems', '航天技术系统公司，提供卫星通信、遥感数据和太空探索服务。已成功发射超过500颗卫星，建立了覆盖全球的低轨卫星互联网星座。'),
+)
+
+# 定时扫描模板：(名称前缀, cron 模板)
+SCHEDULE_TEMPLATES = (
+    ('Daily-Full-Security-Assessment-Enterprise-Wide-Comprehensive-Vulnerability-Detection', '0 %(hour)s * * *'),
+    ('Weekly-Vulnerability-Scan-Critical-Infrastructure-Protection-Program', '0 %(hour)s * * %(dow)s'),
+    ('Monthly-Penetration-Testing-External-Attack-Surface-Management', '0 %(hour)s %(dom)s * *'),
+    ('Hourly-Quick-Reconnaissance-Real-Time-Threat-Intelligence-Gathering', '%(min)s * * * *'),
+    ('Bi-Weekly-Compliance-Check-Regulatory-Standards-Verification-Audit', '0 %(hour)s 1,15 * *'),
+    ('Quarterly-Infrastructure-Audit-Network-Security-Posture-Assessment', '0 %(hour)s 1 1,4,7,10 *'),
+    ('Daily-API-Security-Scan-RESTful-GraphQL-Endpoint-Protection', '%(min)s %(hour)s * * *'),
+    ('Weekly-Web-Application-Scan-OWASP-Top-10-Vulnerability-Detection', '0 %(hour)s * * %(dow)s'),
+    ('Nightly-Asset-Discovery-Shadow-IT-Detection-Inventory-Management', '0 %(hour)s * * *'),
+    ('Weekend-Deep-Scan-Intensive-Security-Analysis-Full-Coverage', '0 %(hour)s * * 0,6'),
+    ('Business-Hours-Monitor-Real-Time-Security-Event-Detection-Response', '0 9-17 * * 1-5'),
+    ('Off-Hours-Intensive-Scan-Low-Impact-Comprehensive-Assessment', '0 %(hour)s * * *'),
+    ('Continuous-Monitoring-Zero-Day-Vulnerability-Detection-System', '%(min)s * * * *'),
+    ('Cloud-Infrastructure-Security-Assessment-AWS-Azure-GCP-Multi-Cloud', '0 %(hour)s * * *'),
+    ('Container-Security-Scan-Kubernetes-Docker-Image-Vulnerability-Check', '0 %(hour)s * * %(dow)s'),
+    ('Database-Security-Audit-SQL-Injection-Data-Exposure-Prevention', '0 %(hour)s %(dom)s * *'),
+    ('Network-Perimeter-Scan-Firewall-Configuration-Compliance-Check', '0 %(hour)s * * *'),
+    ('SSL-TLS-Certificate-Monitoring-Expiration-Vulnerability-Detection', '0 %(hour)s * * *'),
+    ('DNS-Security-Assessment-Zone-Transfer-Subdomain-Takeover-Check', '0 %(hour)s * * %(dow)s'),
+    ('Email-Security-Scan-SPF-DKIM-DMARC-Configuration-Verification', '0 %(hour)s %(dom)s * *'),
+    ('Mobile-Application-Security-Testing-iOS-Android-API-Assessment', '0 %(hour)s * * *'),
+    ('IoT-Device-Security-Scan-Firmware-Vulnerability-Network-Exposure', '0 %(hour)s * * %(dow)s'),
+    ('Third-Party-Risk-Assessment-Vendor-Security-Posture-Evaluation', '0 %(hour)s 1 * *'),
+    ('Incident-Response-Readiness-Security-Control-Effectiveness-Test', '0 %(hour)s 15 * *'),
+    ('Ransomware-Prevention-Scan-Backup-Integrity-Recovery-Verification', '0 %(hour)s * * *'),
+)
+
 
 class TestDataGenerator:
     def __init__(self, clear: bool = False):
         self.conn = psycopg2.connect(**DB_CONFIG)
         self.conn.autocommit = False
+        # 整个生成过程复用同一个游标
+        self.cur = self.conn.cursor()
         self.clear = clear
         
     def run(self):
         try:
+            # 测试数据可重新生成，关闭同步提交省去每次提交等待 WAL 落盘
+            self.cur.execute("SET synchronous_commit = OFF")
+            
             if self.clear:
                 print("🗑️  清除现有数据...")
                 self.clear_data()
@@ -259,12 +554,7 @@ class TestDataGenerator:
 
     def clear_data(self):
         """清除所有测试数据"""
-        cur = self.conn.cursor()
-        
-        # 先删除 IMMV（避免 pg_ivm 的 anyarray bug）
-        print("  删除 IMMV...")
-        cur.execute("DROP TABLE IF EXISTS asset_search_view CASCADE")
-        self.conn.commit()
+        cur = self.cur
         
         tables = [
             # 指纹表
@@ -279,27 +569,13 @@ class TestDataGenerator:
             'organization_targets', 'target', 'organization',
             'nuclei_template_repo', 'wordlist', 'scan_engine', 'worker_node'
         ]
-        for table in tables:
-            cur.execute(f"DELETE FROM {table}")
-        self.conn.commit()
+        cur.execute(f"TRUNCATE TABLE {', '.join(tables)} RESTART IDENTITY CASCADE")
         
-        # 重建 IMMV
-        print("  重建 IMMV...")
+        # 清空搜索视图及其变更队列（原表已清空，无需再增量刷新）
+        print("  清空搜索视图...")
         cur.execute("""
-            SELECT pgivm.create_immv('asset_search_view', $$
-                SELECT 
-                    w.id,
-                    w.url,
-                    w.host,
-                    w.title,
-                    w.tech,
-                    w.status_code,
-                    w.response_headers,
-                    w.response_body,
-                    w.created_at,
-                    w.target_id
-                FROM website w
-            $$)
+            TRUNCATE asset_search_view, endpoint_search_view,
+                     website_search_changes, endpoint_search_changes
         """)
         self.conn.commit()
         print("  ✓ 数据清除完成\n")
@@ -307,19 +583,11 @@ class TestDataGenerator:
     def create_workers(self) -> list:
         """创建 Worker 节点"""
         print("👷 创建 Worker 节点...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         # 生成随机后缀确保唯一性
         suffix = random.randint(1000, 9999)
         
-        regions = ['asia-singapore-1', 'asia-singapore-2', 'asia-tokyo-1', 'asia-tokyo-2', 'asia-hongkong-1', 
-                   'asia-mumbai-1', 'asia-seoul-1', 'asia-sydney-1', 'asia-jakarta-1', 'asia-osaka-1',
-                   'europe-frankfurt-1', 'europe-frankfurt-2', 'europe-london-1', 'europe-london-2', 
-                   'europe-paris-1', 'europe-ireland-1', 'europe-stockholm-1', 'europe-milan-1',
-                   'us-east-virginia-1', 'us-east-virginia-2', 'us-east-ohio-1', 'us-west-oregon-1', 
-                   'us-west-oregon-2', 'us-west-california-1', 'us-central-iowa-1',
-                   'australia-sydney-1', 'australia-melbourne-1', 'brazil-saopaulo-1', 
-                   'canada-montreal-1', 'southafrica-capetown-1', 'middleeast-bahrain-1']
         statuses = ['online', 'offline', 'pending', 'deploying', 'maintenance', 'error', 'upgrading']
         
         workers = [
@@ -329,23 +597,20 @@ class TestDataGenerator:
         
         # 随机生成 30-50 个远程 worker
         num_remote = random.randint(30, 50)
-        selected_regions = random.sample(regions, min(num_remote, len(regions)))
-        for i, region in enumerate(selected_regions):
+        region_idxs = random.sample(range(len(WORKER_REGIONS)), min(num_remote, len(WORKER_REGIONS)))
+        for i, region_idx in enumerate(region_idxs):
+            region = WORKER_REGIONS[region_idx]
             ip = f'192.168.{random.randint(1, 254)}.{random.randint(1, 254)}'
             status = random.choice(statuses)
             workers.append((f'remote-worker-{region}-{suffix}-{i:02d}', ip, False, status))
         
-        ids = []
-        for name, ip, is_local, status in workers:
-            cur.execute("""
-                INSERT INTO worker_node (name, ip_address, ssh_port, username, password, is_local, status, created_at, updated_at)
-                VALUES (%s, %s, 22, 'root', '', %s, %s, NOW(), NOW())
-                ON CONFLICT (name) DO UPDATE SET updated_at = NOW()
-                RETURNING id
-            """, (name, ip, is_local, status))
-            row = cur.fetchone()
-            if row:
-                ids.append(row[0])
+        rows = execute_values(cur, """
+            INSERT INTO worker_node (name, ip_address, ssh_port, username, password, is_local, status, created_at, updated_at)
+            VALUES %s
+            ON CONFLICT (name) DO UPDATE SET updated_at = NOW()
+            RETURNING id
+        """, workers, template="(%s, %s, 22, 'root', '', %s, %s, NOW(), NOW())", fetch=True)
+        ids = [row[0] for row in rows]
                 
         print(f"  ✓ 创建了 {len(ids)} 个 Worker 节点\n")
         return ids
@@ -353,31 +618,17 @@ class TestDataGenerator:
     def create_engines(self) -> list:
         """创建扫描引擎"""
         print("⚙️  创建扫描引擎...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         suffix = random.randint(1000, 9999)
         
-        engine_templates = [
-            ('Full-Comprehensive-Security-Assessment-Enterprise-Grade-Vulnerability-Detection-System', 'subdomain_discovery:\n  enabled: true\n  tools: [subfinder, amass, findomain, assetfinder, chaos]\n  timeout: {timeout}\n  resolvers: [8.8.8.8, 1.1.1.1, 9.9.9.9]\nvulnerability_scanning:\n  enabled: true\n  nuclei:\n    severity: critical,high,medium,low,info\n    rate_limit: {rate}\n    concurrency: {conc}\n    templates: [cves, vulnerabilities, exposures, misconfigurations, default-logins]'),
-            ('Quick-Reconnaissance-Fast-Discovery-Lightweight-Asset-Enumeration', 'subdomain_discovery:\n  enabled: true\n  tools: [subfinder, assetfinder]\n  timeout: {timeout}\n  passive_only: true\nport_scanning:\n  enabled: true\n  top_ports: {ports}\n  rate: {rate}'),
-            ('Deep-Vulnerability-Assessment-Extended-Security-Analysis-Framework', 'vulnerability_scanning:\n  enabled: true\n  nuclei:\n    severity: critical,high,medium,low,info\n    templates: [cves, vulnerabilities, exposures, misconfigurations, default-logins, takeovers]\n    rate_limit: {rate}\n    concurrency: {conc}\n  dalfox:\n    enabled: true\n    blind_xss: true\n  sqlmap:\n    enabled: true\n    level: 3\n    risk: 2'),
-            ('Passive-Information-Gathering-OSINT-Intelligence-Collection-Platform', 'subdomain_discovery:\n  enabled: true\n  passive_only: true\n  sources: [crtsh, hackertarget, threatcrowd, virustotal, securitytrails, shodan, censys, binaryedge]\n  timeout: {timeout}\n  dns_bruteforce: false'),
-            ('Web-Application-Security-Scanner-OWASP-Compliance-Testing-Suite', 'web_discovery:\n  enabled: true\n  httpx:\n    threads: {conc}\n    follow_redirects: true\n    screenshot: true\nvulnerability_scanning:\n  enabled: true\n  dalfox:\n    enabled: true\n    blind_xss: true\n  nuclei:\n    templates: [cves, vulnerabilities, exposures]'),
-            ('API-Endpoint-Security-Audit-RESTful-GraphQL-Assessment-Tool', 'endpoint_discovery:\n  enabled: true\n  katana:\n    depth: {depth}\n    concurrency: {conc}\n    js_crawl: true\n    automatic_form_fill: true\nvulnerability_scanning:\n  enabled: true\n  nuclei:\n    templates: [exposures, misconfigurations]'),
-            ('Infrastructure-Port-Scanner-Network-Service-Detection-Engine', 'port_scanning:\n  enabled: true\n  naabu:\n    top_ports: {ports}\n    rate: {rate}\n    scan_all_ips: true\n  service_detection: true\n  version_detection: true\n  os_detection: true'),
-            ('Directory-Bruteforce-Engine-Content-Discovery-Fuzzing-Platform', 'directory_bruteforce:\n  enabled: true\n  ffuf:\n    threads: {conc}\n    wordlist: [common.txt, raft-large-directories.txt, raft-large-files.txt]\n    recursion_depth: {depth}\n    extensions: [php, asp, aspx, jsp, html, js, json, xml]'),
-            ('Cloud-Infrastructure-Security-Assessment-AWS-Azure-GCP-Scanner', 'cloud_scanning:\n  enabled: true\n  providers: [aws, azure, gcp]\n  services: [s3, ec2, rds, lambda, storage, compute, sql]\n  misconfigurations: true\n  public_exposure: true'),
-            ('Container-Security-Scanner-Kubernetes-Docker-Vulnerability-Detector', 'container_scanning:\n  enabled: true\n  kubernetes:\n    enabled: true\n    rbac_audit: true\n    network_policies: true\n  docker:\n    enabled: true\n    image_scanning: true\n    dockerfile_lint: true'),
-            ('Mobile-Application-Security-Testing-iOS-Android-Assessment-Framework', 'mobile_scanning:\n  enabled: true\n  platforms: [ios, android]\n  static_analysis: true\n  dynamic_analysis: true\n  api_testing: true\n  ssl_pinning_bypass: true'),
-            ('Compliance-Audit-Scanner-PCI-DSS-HIPAA-SOC2-Assessment-Tool', 'compliance_scanning:\n  enabled: true\n  frameworks: [pci-dss, hipaa, soc2, gdpr, iso27001]\n  automated_reporting: true\n  evidence_collection: true'),
-        ]
-        
         # 随机选择 8-12 个引擎模板
         num_engines = random.randint(8, 12)
-        selected = random.sample(engine_templates, min(num_engines, len(engine_templates)))
+        template_idxs = random.sample(range(len(ENGINE_TEMPLATES)), min(num_engines, len(ENGINE_TEMPLATES)))
         
-        ids = []
-        for name_base, config_template in selected:
+        batch_data = []
+        for template_idx in template_idxs:
+            name_base, config_template = ENGINE_TEMPLATES[template_idx]
             name = f'{name_base}-{suffix}'
             config = config_template.format(
                 rate=random.choice([100, 150, 200, 300]),
@@ -386,15 +637,15 @@ class TestDataGenerator:
                 ports=random.choice([100, 1000, 'full']),
                 depth=random.choice([2, 3, 4, 5])
             )
-            cur.execute("""
-                INSERT INTO scan_engine (name, configuration, created_at, updated_at)
-                VALUES (%s, %s, NOW(), NOW())
-                ON CONFLICT (name) DO UPDATE SET configuration = EXCLUDED.configuration, updated_at = NOW()
-                RETURNING id
-            """, (name, config))
-            row = cur.fetchone()
-            if row:
-                ids.append(row[0])
+            batch_data.append((name, config))
+        
+        rows = execute_values(cur, """
+            INSERT INTO scan_engine (name, configuration, created_at, updated_at)
+            VALUES %s
+            ON CONFLICT (name) DO UPDATE SET configuration = EXCLUDED.configuration, updated_at = NOW()
+            RETURNING id
+        """, batch_data, template="(%s, %s, NOW(), NOW())", fetch=True)
+        ids = [row[0] for row in rows]
                 
         print(f"  ✓ 创建了 {len(ids)} 个扫描引擎\n")
         return ids
@@ -402,52 +653,34 @@ class TestDataGenerator:
     def create_organizations(self) -> list:
         """创建组织"""
         print("🏢 创建组织...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         suffix = random.randint(1000, 9999)
         
-        org_templates = [
-            ('Acme Corporation', '全球领先的技术解决方案提供商，专注于企业级软件开发、云计算服务和网络安全解决方案。公司成立于1995年，总部位于硅谷，在全球50多个国家设有分支机构，员工超过10万人，年营收超过500亿美元。'),
-            ('TechStart Innovation Labs', '专注于人工智能、机器学习和区块链技术研发的创新实验室。拥有超过200名博士级研究人员，与全球顶尖大学建立了深度合作关系，已获得超过500项技术专利。'),
-            ('Global Financial Services', '提供全方位数字银行服务的金融科技公司，包括移动支付、在线贷款、投资理财等服务。服务覆盖全球180个国家和地区，注册用户超过5亿，日均交易额超过100亿美元。'),
-            ('HealthCare Plus Medical', '医疗信息化解决方案提供商，专注于电子病历系统、医院信息管理系统和远程医疗平台开发。产品已部署在全球3000多家医疗机构，服务超过1亿患者。'),
-            ('E-Commerce Mega Platform', '亚太地区最大的电子商务平台之一，提供 B2B、B2C 和 C2C 多种交易模式。平台入驻商家超过500万，SKU数量超过10亿，日均订单量超过5000万单。'),
-            ('Smart City Infrastructure', '智慧城市基础设施解决方案提供商，专注于物联网传感器网络、智能交通系统、城市大脑平台开发。已在全球100多个城市部署智慧城市解决方案，管理超过1000万个IoT设备。'),
-            ('Educational Technology', '在线教育技术联盟，提供 K-12 和高等教育在线学习平台。平台拥有超过10万门课程，注册学员超过1亿人，与全球500多所知名大学建立了合作关系。'),
-            ('Green Energy Solutions', '可再生能源管理系统提供商，专注于太阳能、风能发电站的监控、调度和优化管理。管理的清洁能源装机容量超过100GW，每年减少碳排放超过5000万吨。'),
-            ('CyberSec Defense Corp', '网络安全防御公司，提供渗透测试、漏洞评估和安全咨询服务。拥有超过1000名认证安全专家，服务全球500强企业中的300多家，年处理安全事件超过100万起。'),
-            ('CloudNative Systems', '云原生系统开发商，专注于 Kubernetes、微服务架构和 DevOps 工具链。产品被全球超过10万家企业采用，管理的容器实例超过1亿个，是CNCF的核心贡献者。'),
-            ('DataFlow Analytics', '大数据分析平台，提供实时数据处理、商业智能和预测分析服务。平台日处理数据量超过100PB，支持超过1000种数据源接入，服务全球5000多家企业客户。'),
-            ('MobileFirst Technologies', '移动优先技术公司，专注于 iOS/Android 应用开发和跨平台解决方案。已开发超过5000款移动应用，累计下载量超过50亿次，月活跃用户超过10亿。'),
-            ('Quantum Computing Research', '量子计算研究机构，致力于量子算法、量子纠错和量子网络的前沿研究。拥有全球最先进的量子计算机之一，已实现1000+量子比特的稳定运算。'),
-            ('Autonomous Vehicles Corp', '自动驾驶技术公司，专注于L4/L5级别自动驾驶系统研发。测试车队已累计行驶超过1亿公里，在全球20个城市开展商业化运营。'),
-            ('Biotech Innovations', '生物技术创新企业，专注于基因编辑、细胞治疗和精准医疗。拥有超过100项生物技术专利，多款创新药物已进入临床试验阶段。'),
-            ('Space Technology Systems', '航天技术系统公司，提供卫星通信、遥感数据和太空探索服务。已成功发射超过500颗卫星，建立了覆盖全球的低轨卫星互联网星座。'),
-        ]
-        
         divisions = ['Global Division', 'Asia Pacific', 'EMEA Region', 'Americas', 'R&D Center', 'Digital Platform', 
                      'Cloud Services', 'Security Team', 'Innovation Lab', 'Enterprise Solutions', 'Consumer Products',
                      'Infrastructure Services', 'Data Analytics', 'AI Research', 'Mobile Development', 'DevOps Platform']
         
         # 随机选择 15-20 个组织
         num_orgs = random.randint(15, 20)
-        selected = random.sample(org_templates, min(num_orgs, len(org_templates)))
+        template_idxs = random.sample(range(len(ORG_TEMPLATES)), min(num_orgs, len(ORG_TEMPLATES)))
         
-        ids = []
-        for name_base, _ in selected:
+        batch_data = []
+        for template_idx in template_idxs:
+            name_base, _ = ORG_TEMPLATES[template_idx]
             division = random.choice(divisions)
             name = f'{name_base} - {division} ({suffix})'
             # 生成固定 300 长度的描述
             desc = generate_fixed_length_text(length=300, text_type='organization')
-            cur.execute("""
-                INSERT INTO organization (name, description, created_at, deleted_at)
-                VALUES (%s, %s, NOW() - INTERVAL '%s days', NULL)
-                ON CONFLICT DO NOTHING
-                RETURNING id
-            """, (name, desc, random.randint(0, 365)))
-            row = cur.fetchone()
-            if row:
-                ids.append(row[0])
+            batch_data.append((name, desc, random.randint(0, 365)))
+        
+        rows = execute_values(cur, """
+            INSERT INTO organization (name, description, created_at, deleted_at)
+            VALUES %s
+            ON CONFLICT DO NOTHING
+            RETURNING id
+        """, batch_data, template="(%s, %s, NOW() - INTERVAL '%s days', NULL)", fetch=True)
+        ids = [row[0] for row in rows]
                 
         print(f"  ✓ 创建了 {len(ids)} 个组织\n")
         return ids
@@ -456,7 +689,7 @@ class TestDataGenerator:
     def create_targets(self, org_ids: list) -> list:
         """创建扫描目标"""
         print("🎯 创建扫描目标...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         suffix = random.randint(1000, 9999)
         
@@ -473,83 +706,77 @@ class TestDataGenerator:
         domains = ['enterprise', 'platform', 'services', 'solutions', 'systems']
         tlds = ['.com', '.io', '.net', '.org', '.dev', '.app', '.cloud', '.tech', '.systems']
         
-        ids = []
-        
         # 随机生成 100-150 个域名目标
         num_domains = random.randint(100, 150)
-        used_domains = set()
-        
-        for i in range(num_domains):
-            env = random.choice(envs)
-            region = random.choice(regions)
-            service = random.choice(services)
-            version = random.choice(versions)
-            subdomain = random.choice(subdomains)
-            company = random.choice(companies)
-            project = random.choice(projects)
-            team = random.choice(teams)
-            domain_name = random.choice(domains)
-            tld = random.choice(tlds)
-            # 生成超长域名，约 150-200 字符
-            domain = f'{env}-{region}-{service}-{version}.{subdomain}.{company}-{project}-{team}-{suffix}.{domain_name}{tld}'
-            
-            if domain in used_domains:
-                continue
-            used_domains.add(domain)
-            
-            cur.execute("""
-                INSERT INTO target (name, type, created_at, last_scanned_at, deleted_at)
-                VALUES (%s, 'domain', NOW() - INTERVAL '%s days', NOW() - INTERVAL '%s days', NULL)
+        
+        # 每个字段整列一次抽取，避免逐行 10 次 random.choice 调用
+        def draw(*pools):
+            return zip(*(random.choices(pool, k=num_domains) for pool in pools))
+        
+        # 超长域名的各段用 str.join 整体拼接，约 150-200 字符
+        heads = map('-'.join, draw(envs, regions, services, versions))
+        # 后缀附带序号，保证域名唯一，无需去重
+        owners = (
+            '-'.join((*parts, f'{suffix}{i:03d}')) for i, parts in enumerate(draw(companies, projects, teams))
+        )
+        tails = map(''.join, draw(domains, tlds))
+        names = map('.'.join, zip(heads, random.choices(subdomains, k=num_domains), owners, tails))
+        created_days = random.choices(range(30, 366), k=num_domains)
+        scanned_days = random.choices(range(0, 31), k=num_domains)
+        
+        domain_rows = [
+            (domain, 'domain', created, scanned)
+            for domain, created, scanned in zip(names, created_days, scanned_days)
+        ]
+        
+        target_sql = """
+            INSERT INTO target (name, type, created_at, last_scanned_at, deleted_at)
+            VALUES %s
+            ON CONFLICT DO NOTHING
+            RETURNING id
+        """
+        target_template = "(%s, %s, NOW() - INTERVAL '%s days', NOW() - INTERVAL '%s days', NULL)"
+        
+        ids = []
+        if domain_rows:
+            rows = execute_values(cur, target_sql, domain_rows, template=target_template, fetch=True)
+            ids = [row[0] for row in rows]
+        
+        # 随机关联到组织，收集后一次性插入
+        org_target_pairs = []
+        if org_ids:
+            for target_id in ids:
+                # 20% 概率关联多个组织(3-5个)，50% 概率关联1个组织，30% 不关联
+                rand_val = random.random()
+                if rand_val < 0.2:
+                    # 关联多个组织 (3-5个)
+                    num_orgs = min(random.randint(3, 5), len(org_ids))
+                    for org_id in random.sample(org_ids, num_orgs):
+                        org_target_pairs.append((org_id, target_id))
+                elif rand_val < 0.7:
+                    # 关联1个组织
+                    org_target_pairs.append((random.choice(org_ids), target_id))
+        
+        if org_target_pairs:
+            execute_values(cur, """
+                INSERT INTO organization_targets (organization_id, target_id)
+                VALUES %s
                 ON CONFLICT DO NOTHING
-                RETURNING id
-            """, (domain, random.randint(30, 365), random.randint(0, 30)))
-            row = cur.fetchone()
-            if row:
-                ids.append(row[0])
-                # 随机关联到组织
-                if org_ids:
-                    # 20% 概率关联多个组织(3-5个)，50% 概率关联1个组织，30% 不关联
-                    rand_val = random.random()
-                    if rand_val < 0.2:
-                        # 关联多个组织 (3-5个)
-                        num_orgs = min(random.randint(3, 5), len(org_ids))
-                        selected_orgs = random.sample(org_ids, num_orgs)
-                        for org_id in selected_orgs:
-                            cur.execute("""
-                                INSERT INTO organization_targets (organization_id, target_id)
-                                VALUES (%s, %s)
-                                ON CONFLICT DO NOTHING
-                            """, (org_id, row[0]))
-                    elif rand_val < 0.7:
-                        # 关联1个组织
-                        org_id = random.choice(org_ids)
-                        cur.execute("""
-                            INSERT INTO organization_targets (organization_id, target_id)
-                            VALUES (%s, %s)
-                            ON CONFLICT DO NOTHING
-                        """, (org_id, row[0]))
+            """, org_target_pairs, page_size=5000)
+        
+        other_rows = []
         
         # 随机生成 50-80 个 IP 目标
         num_ips = random.randint(50, 80)
-        for _ in range(num_ips):
-            # 使用文档保留的 IP 范围
-            ip_ranges = [
-                (203, 0, 113),   # TEST-NET-3
-                (198, 51, 100),  # TEST-NET-2
-                (192, 0, 2),     # TEST-NET-1
-            ]
-            base = random.choice(ip_ranges)
-            ip = f'{base[0]}.{base[1]}.{base[2]}.{random.randint(1, 254)}'
-            
-            cur.execute("""
-                INSERT INTO target (name, type, created_at, last_scanned_at, deleted_at)
-                VALUES (%s, 'ip', NOW() - INTERVAL '%s days', NOW() - INTERVAL '%s days', NULL)
-                ON CONFLICT DO NOTHING
-                RETURNING id
-            """, (ip, random.randint(30, 365), random.randint(0, 30)))
-            row = cur.fetchone()
-            if row:
-                ids.append(row[0])
+        # 使用文档保留的 IP 范围
+        ip_ranges = [
+            (203, 0, 113),   # TEST-NET-3
+            (198, 51, 100),  # TEST-NET-2
+            (192, 0, 2),     # TEST-NET-1
+        ]
+        for base, host in zip(random.choices(ip_ranges, k=num_ips), random.choices(range(1, 255), k=num_ips)):
+            ip = f'{base[0]}.{base[1]}.{base[2]}.{host}'
+            other_rows.append((ip, 'ip', random.randint(30, 365), random.randint(0, 30)))
         
         # 随机生成 30-50 个 CIDR 目标
         num_cidrs = random.randint(30, 50)
@@ -559,16 +786,10 @@ class TestDataGenerator:
             third_octet = random.randint(0, 255)
             mask = random.choice([24, 25, 26, 27, 28])
             cidr = f'{base}.{third_octet}.0/{mask}'
-            
-            cur.execute("""
-                INSERT INTO target (name, type, created_at, last_scanned_at, deleted_at)
-                VALUES (%s, 'cidr', NOW() - INTERVAL '%s days', NOW() - INTERVAL '%s days', NULL)
-                ON CONFLICT DO NOTHING
-                RETURNING id
-            """, (cidr, random.randint(30, 365), random.randint(0, 30)))
-            row = cur.fetchone()
-            if row:
-                ids.append(row[0])
+            other_rows.append((cidr, 'cidr', random.randint(30, 365), random.randint(0, 30)))
+        
+        rows = execute_values(cur, target_sql, other_rows, template=target_template, fetch=True)
+        ids.extend(row[0] for row in rows)
                 
         print(f"  ✓ 创建了 {len(ids)} 个扫描目标\n")
         return ids
@@ -576,7 +797,7 @@ class TestDataGenerator:
     def create_scans(self, target_ids: list, engine_ids: list, worker_ids: list) -> list:
         """创建扫描任务"""
         print("🔍 创建扫描任务...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         if not target_ids or not engine_ids:
             print("  ⚠ 缺少目标或引擎，跳过\n")
@@ -600,65 +821,60 @@ class TestDataGenerator:
         cur.execute("SELECT id, name FROM scan_engine WHERE id = ANY(%s)", (engine_ids,))
         engine_name_map = {row[0]: row[1] for row in cur.fetchall()}
         
-        ids = []
+        batch_data = []
         # 随机选择目标数量 - 增加到 80-120 个
         num_targets = min(random.randint(80, 120), len(target_ids))
         selected_targets = random.sample(target_ids, num_targets)
         
-        for target_id in selected_targets:
-            # 每个目标随机 3-15 个扫描任务
-            num_scans = random.randint(3, 15)
-            for _ in range(num_scans):
-                status = random.choices(statuses, weights=status_weights)[0]
-                # 随机选择 1-3 个引擎
-                num_engines = random.randint(1, min(3, len(engine_ids)))
-                selected_engine_ids = random.sample(engine_ids, num_engines)
-                selected_engine_names = [engine_name_map.get(eid, f'Engine-{eid}') for eid in selected_engine_ids]
-                worker_id = random.choice(worker_ids) if worker_ids else None
-                
-                progress = random.randint(10, 95) if status == 'running' else (100 if status == 'completed' else random.randint(0, 50))
-                stage = random.choice(stages) if status == 'running' else ''
-                error_msg = random.choice(error_messages) if status == 'failed' else ''
-                
-                # 随机生成更真实的统计数据
-                subdomains = random.randint(50, 2000)
-                websites = random.randint(10, 500)
-                endpoints = random.randint(100, 5000)
-                ips = random.randint(20, 300)
-                directories = random.randint(200, 8000)
-                vulns_critical = random.randint(0, 20)
-                vulns_high = random.randint(0, 50)
-                vulns_medium = random.randint(0, 100)
-                vulns_low = random.randint(0, 150)
-                vulns_total = vulns_critical + vulns_high + vulns_medium + vulns_low + random.randint(0, 100)  # info
-                
-                days_ago = random.randint(0, 90)
-                
-                cur.execute("""
-                    INSERT INTO scan (
-                        target_id, engine_ids, engine_names, yaml_configuration, status, worker_id, progress, current_stage,
-                        results_dir, error_message, container_ids, stage_progress,
-                        cached_subdomains_count, cached_websites_count, cached_endpoints_count,
-                        cached_ips_count, cached_directories_count, cached_vulns_total,
-                        cached_vulns_critical, cached_vulns_high, cached_vulns_medium, cached_vulns_low,
-                        created_at, stopped_at, deleted_at
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                        NOW() - INTERVAL '%s days', %s, NULL
-                    )
-                    RETURNING id
-                """, (
-                    target_id, selected_engine_ids, json.dumps(selected_engine_names), '', status, worker_id, progress, stage,
-                    f'/app/results/scan_{target_id}_{random.randint(1000, 9999)}', error_msg, '{}', '{}',
-                    subdomains, websites, endpoints, ips, directories, vulns_total,
-                    vulns_critical, vulns_high, vulns_medium, vulns_low,
-                    days_ago,
-                    datetime.now() - timedelta(days=days_ago, hours=random.randint(0, 23)) if status in ['completed', 'failed', 'cancelled'] else None
-                ))
-                row = cur.fetchone()
-                if row:
-                    ids.append(row[0])
+        # 每个目标随机 3-15 个扫描任务，状态按权重一次性抽取
+        scan_targets = [target_id for target_id in selected_targets for _ in range(random.randint(3, 15))]
+        scan_statuses = random.choices(statuses, weights=status_weights, k=len(scan_targets))
+        
+        now = datetime.now()
+        
+        for target_id, status in zip(scan_targets, scan_statuses):
+            # 随机选择 1-3 个引擎
+            num_engines = random.randint(1, min(3, len(engine_ids)))
+            selected_engine_ids = random.sample(engine_ids, num_engines)
+            selected_engine_names = [engine_name_map.get(eid, f'Engine-{eid}') for eid in selected_engine_ids]
+            worker_id = random.choice(worker_ids) if worker_ids else None
+            
+            progress = random.randint(10, 95) if status == 'running' else (100 if status == 'completed' else random.randint(0, 50))
+            stage = random.choice(stages) if status == 'running' else ''
+            error_msg = random.choice(error_messages) if status == 'failed' else ''
+            
+            # 随机生成更真实的统计数据
+            subdomains = random.randint(50, 2000)
+            websites = random.randint(10, 500)
+            endpoints = random.randint(100, 5000)
+            ips = random.randint(20, 300)
+            directories = random.randint(200, 8000)
+            vulns_critical = random.randint(0, 20)
+            vulns_high = random.randint(0, 50)
+            vulns_medium = random.randint(0, 100)
+            vulns_low = random.randint(0, 150)
+            vulns_total = vulns_critical + vulns_high + vulns_medium + vulns_low + random.randint(0, 100)  # info
+            
+            days_ago = random.randint(0, 90)
+            
+            batch_data.append((
+                target_id, selected_engine_ids, json.dumps(selected_engine_names), '', status, worker_id, progress, stage,
+                f'/app/results/scan_{target_id}_{random.randint(1000, 9999)}', error_msg, '{}', '{}',
+                subdomains, websites, endpoints, ips, directories, vulns_total,
+                vulns_critical, vulns_high, vulns_medium, vulns_low,
+                now - timedelta(days=days_ago),
+                now - timedelta(days=days_ago, hours=random.randint(0, 23)) if status in ['completed', 'failed', 'cancelled'] else None
+            ))
+        
+        # 统计列全是整数，用 binary COPY 写入
+        ids = copy_rows(cur, 'scan', [
+            'target_id', 'engine_ids', 'engine_names', 'yaml_configuration', 'status', 'worker_id', 'progress',
+            'current_stage', 'results_dir', 'error_message', 'container_ids', 'stage_progress',
+            'cached_subdomains_count', 'cached_websites_count', 'cached_endpoints_count',
+            'cached_ips_count', 'cached_directories_count', 'cached_vulns_total',
+            'cached_vulns_critical', 'cached_vulns_high', 'cached_vulns_medium', 'cached_vulns_low',
+            'created_at', 'stopped_at'
+        ], batch_data, conflict='', returning=True, binary=True)
                     
         print(f"  ✓ 创建了 {len(ids)} 个扫描任务\n")
         return ids
@@ -666,7 +882,7 @@ class TestDataGenerator:
     def create_scheduled_scans(self, org_ids: list, target_ids: list, engine_ids: list):
         """创建定时扫描任务"""
         print("⏰ 创建定时扫描任务...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         if not engine_ids:
             print("  ⚠ 缺少引擎，跳过\n")
@@ -674,51 +890,25 @@ class TestDataGenerator:
         
         suffix = random.randint(1000, 9999)
         
-        schedule_templates = [
-            ('Daily-Full-Security-Assessment-Enterprise-Wide-Comprehensive-Vulnerability-Detection', '0 {hour} * * *'),
-            ('Weekly-Vulnerability-Scan-Critical-Infrastructure-Protection-Program', '0 {hour} * * {dow}'),
-            ('Monthly-Penetration-Testing-External-Attack-Surface-Management', '0 {hour} {dom} * *'),
-            ('Hourly-Quick-Reconnaissance-Real-Time-Threat-Intelligence-Gathering', '{min} * * * *'),
-            ('Bi-Weekly-Compliance-Check-Regulatory-Standards-Verification-Audit', '0 {hour} 1,15 * *'),
-            ('Quarterly-Infrastructure-Audit-Network-Security-Posture-Assessment', '0 {hour} 1 1,4,7,10 *'),
-            ('Daily-API-Security-Scan-RESTful-GraphQL-Endpoint-Protection', '{min} {hour} * * *'),
-            ('Weekly-Web-Application-Scan-OWASP-Top-10-Vulnerability-Detection', '0 {hour} * * {dow}'),
-            ('Nightly-Asset-Discovery-Shadow-IT-Detection-Inventory-Management', '0 {hour} * * *'),
-            ('Weekend-Deep-Scan-Intensive-Security-Analysis-Full-Coverage', '0 {hour} * * 0,6'),
-            ('Business-Hours-Monitor-Real-Time-Security-Event-Detection-Response', '0 9-17 * * 1-5'),
-            ('Off-Hours-Intensive-Scan-Low-Impact-Comprehensive-Assessment', '0 {hour} * * *'),
-            ('Continuous-Monitoring-Zero-Day-Vulnerability-Detection-System', '{min} * * * *'),
-            ('Cloud-Infrastructure-Security-Assessment-AWS-Azure-GCP-Multi-Cloud', '0 {hour} * * *'),
-            ('Container-Security-Scan-Kubernetes-Docker-Image-Vulnerability-Check', '0 {hour} * * {dow}'),
-            ('Database-Security-Audit-SQL-Injection-Data-Exposure-Prevention', '0 {hour} {dom} * *'),
-            ('Network-Perimeter-Scan-Firewall-Configuration-Compliance-Check', '0 {hour} * * *'),
-            ('SSL-TLS-Certificate-Monitoring-Expiration-Vulnerability-Detection', '0 {hour} * * *'),
-            ('DNS-Security-Assessment-Zone-Transfer-Subdomain-Takeover-Check', '0 {hour} * * {dow}'),
-            ('Email-Security-Scan-SPF-DKIM-DMARC-Configuration-Verification', '0 {hour} {dom} * *'),
-            ('Mobile-Application-Security-Testing-iOS-Android-API-Assessment', '0 {hour} * * *'),
-            ('IoT-Device-Security-Scan-Firmware-Vulnerability-Network-Exposure', '0 {hour} * * {dow}'),
-            ('Third-Party-Risk-Assessment-Vendor-Security-Posture-Evaluation', '0 {hour} 1 * *'),
-            ('Incident-Response-Readiness-Security-Control-Effectiveness-Test', '0 {hour} 15 * *'),
-            ('Ransomware-Prevention-Scan-Backup-Integrity-Recovery-Verification', '0 {hour} * * *'),
-        ]
-        
         # 随机选择 40-50 个定时任务
         num_schedules = random.randint(40, 50)
-        selected = random.sample(schedule_templates, min(num_schedules, len(schedule_templates)))
+        template_idxs = random.sample(range(len(SCHEDULE_TEMPLATES)), min(num_schedules, len(SCHEDULE_TEMPLATES)))
         
         # 获取引擎名称映射
         cur.execute("SELECT id, name FROM scan_engine WHERE id = ANY(%s)", (engine_ids,))
         engine_name_map = {row[0]: row[1] for row in cur.fetchall()}
         
         count = 0
-        for name_base, cron_template in selected:
+        batch_data = []
+        for template_idx in template_idxs:
+            name_base, cron_template = SCHEDULE_TEMPLATES[template_idx]
             name = f'{name_base}-{suffix}-{count:02d}'
-            cron = cron_template.format(
-                hour=random.randint(0, 23),
-                min=random.randint(0, 59),
-                dow=random.randint(0, 6),
-                dom=random.randint(1, 28)
-            )
+            cron = cron_template % {
+                'hour': random.randint(0, 23),
+                'min': random.randint(0, 59),
+                'dow': random.randint(0, 6),
+                'dom': random.randint(1, 28),
+            }
             enabled = random.random() > 0.3  # 70% 启用
             
             # 随机选择 1-3 个引擎
@@ -747,19 +937,21 @@ class TestDataGenerator:
             run_count = random.randint(0, 200)
             has_run = random.random() > 0.2  # 80% 已运行过
             
-            cur.execute("""
-                INSERT INTO scheduled_scan (
-                    name, engine_ids, engine_names, yaml_configuration, organization_id, target_id, cron_expression, is_enabled,
-                    run_count, last_run_time, next_run_time, created_at, updated_at
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW() - INTERVAL '%s days', NOW())
-                ON CONFLICT DO NOTHING
-            """, (
+            batch_data.append((
                 name, selected_engine_ids, json.dumps(selected_engine_names), '', org_id, target_id, cron, enabled,
                 run_count if has_run else 0,
                 datetime.now() - timedelta(days=random.randint(0, 14), hours=random.randint(0, 23)) if has_run else None,
                 datetime.now() + timedelta(hours=random.randint(1, 336))  # 最多 2 周后
             , random.randint(30, 180)))
             count += 1
+        
+        execute_values(cur, """
+            INSERT INTO scheduled_scan (
+                name, engine_ids, engine_names, yaml_configuration, organization_id, target_id, cron_expression, is_enabled,
+                run_count, last_run_time, next_run_time, created_at, updated_at
+            ) VALUES %s
+            ON CONFLICT DO NOTHING
+        """, batch_data, template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW() - INTERVAL '%s days', NOW())")
             
         print(f"  ✓ 创建了 {count} 个定时扫描任务\n")
 
@@ -767,7 +959,7 @@ class TestDataGenerator:
     def create_subdomains(self, target_ids: list):
         """创建子域名"""
         print("🌐 创建子域名...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         prefixes = [
             # 基础服务
@@ -824,24 +1016,22 @@ class TestDataGenerator:
                 # 随机添加二级前缀
                 sec_prefix = random.choice(secondary_prefixes) if random.random() > 0.7 else ''
                 subdomain_name = f'{sec_prefix}{prefix}.{target_name}'
-                days_ago = random.randint(0, 90)
-                batch_data.append((subdomain_name, target_id, days_ago))
+                created_at = datetime.now() - timedelta(days=random.randint(0, 90))
+                batch_data.append((subdomain_name, target_id, created_at))
                 count += 1
         
         # 批量插入
         if batch_data:
-            execute_values(cur, """
-                INSERT INTO subdomain (name, target_id, created_at)
-                VALUES %s
-                ON CONFLICT DO NOTHING
-            """, batch_data, template="(%s, %s, NOW() - INTERVAL '%s days')")
+            copy_rows(cur, 'subdomain', [
+                'name', 'target_id', 'created_at'
+            ], batch_data)
                 
         print(f"  ✓ 创建了 {count} 个子域名\n")
 
     def create_websites(self, target_ids: list) -> list:
         """创建网站"""
         print("🌍 创建网站...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         titles = [
             'Enterprise Resource Planning System - Comprehensive Dashboard | Acme Corporation International Global Operations Management Portal v3.2.1 - Integrated Business Process Automation and Real-time Analytics Platform for Enterprise-wide Resource Optimization',
@@ -932,16 +1122,11 @@ class TestDataGenerator:
         # 批量插入
         ids = []
         if batch_data:
-            execute_values(cur, """
-                INSERT INTO website (
-                    url, target_id, host, title, webserver, tech, status_code,
-                    content_length, content_type, location, response_body, vhost,
-                    response_headers, created_at
-                ) VALUES %s
-                ON CONFLICT DO NOTHING
-                RETURNING id
-            """, batch_data, template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())")
-            ids = [row[0] for row in cur.fetchall()]
+            ids = copy_rows(cur, 'website', [
+                'url', 'target_id', 'host', 'title', 'webserver', 'tech', 'status_code',
+                'content_length', 'content_type', 'location', 'response_body', 'vhost',
+                'response_headers'
+            ], batch_data, returning=True)
                     
         print(f"  ✓ 创建了 {len(batch_data)} 个网站\n")
         return ids
@@ -949,7 +1134,7 @@ class TestDataGenerator:
     def create_endpoints(self, target_ids: list):
         """创建端点"""
         print("🔗 创建端点...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         paths = [
             '/api/v1/users/authentication/login', '/api/v1/users/authentication/logout',
@@ -1119,14 +1304,11 @@ class TestDataGenerator:
         
         # 批量插入
         if batch_data:
-            execute_values(cur, """
-                INSERT INTO endpoint (
-                    url, target_id, host, title, webserver, status_code, content_length,
-                    content_type, tech, location, response_body, vhost, matched_gf_patterns,
-                    response_headers, created_at
-                ) VALUES %s
-                ON CONFLICT DO NOTHING
-            """, batch_data, template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())")
+            copy_rows(cur, 'endpoint', [
+                'url', 'target_id', 'host', 'title', 'webserver', 'status_code',
+                'content_length', 'content_type', 'tech', 'location', 'response_body', 'vhost',
+                'matched_gf_patterns', 'response_headers'
+            ], batch_data)
                 
         print(f"  ✓ 创建了 {count} 个端点\n")
 
@@ -1134,7 +1316,7 @@ class TestDataGenerator:
     def create_directories(self, target_ids: list, website_ids: list):
         """创建目录"""
         print("📁 创建目录...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         dir_paths = [
             '/admin/', '/administrator/', '/wp-admin/', '/wp-content/', '/backup/', '/backups/',
@@ -1194,20 +1376,17 @@ class TestDataGenerator:
         
         # 批量插入
         if batch_data:
-            execute_values(cur, """
-                INSERT INTO directory (
-                    url, target_id, status, content_length, words, lines,
-                    content_type, duration, created_at
-                ) VALUES %s
-                ON CONFLICT DO NOTHING
-            """, batch_data, template="(%s, %s, %s, %s, %s, %s, %s, %s, NOW())")
+            copy_rows(cur, 'directory', [
+                'url', 'target_id', 'status', 'content_length', 'words', 'lines', 'content_type',
+                'duration'
+            ], batch_data)
                 
         print(f"  ✓ 创建了 {count} 个目录\n")
 
     def create_host_port_mappings(self, target_ids: list):
         """创建主机端口映射"""
         print("🔌 创建主机端口映射...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         # 扩展端口列表，包含更多常见端口
         ports = [
@@ -1265,18 +1444,16 @@ class TestDataGenerator:
         
         # 批量插入
         if batch_data:
-            execute_values(cur, """
-                INSERT INTO host_port_mapping (target_id, host, ip, port, created_at)
-                VALUES %s
-                ON CONFLICT DO NOTHING
-            """, batch_data, template="(%s, %s, %s, %s, NOW())")
+            copy_rows(cur, 'host_port_mapping', [
+                'target_id', 'host', 'ip', 'port'
+            ], batch_data, binary=True)
                     
         print(f"  ✓ 创建了 {count} 个主机端口映射\n")
 
     def create_vulnerabilities(self, target_ids: list):
         """创建漏洞（基于 website URL 前缀）"""
         print("🐛 创建漏洞...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         vuln_types = [
             'sql-injection-authentication-bypass-vulnerability-',
@@ -1377,19 +1554,27 @@ class TestDataGenerator:
         
         # 批量插入
         if batch_data:
-            execute_values(cur, """
-                INSERT INTO vulnerability (
-                    target_id, url, vuln_type, severity, source, cvss_score,
-                    description, raw_output, created_at
-                ) VALUES %s
-            """, batch_data, template="(%s, %s, %s, %s, %s, %s, %s, %s, NOW())")
+            copy_rows(cur, 'vulnerability', [
+                'target_id', 'url', 'vuln_type', 'severity', 'source', 'cvss_score',
+                'description', 'raw_output'
+            ], batch_data, conflict='')
                 
         print(f"  ✓ 创建了 {count} 个漏洞\n")
 
+    def _get_scan_domain_names(self, scan_ids: list) -> dict:
+        """一次查询获取扫描对应的域名目标名称: {scan_id: target_name}（非域名目标不包含）"""
+        cur = self.cur
+        cur.execute("""
+            SELECT s.id, t.name FROM scan s 
+            JOIN target t ON s.target_id = t.id 
+            WHERE s.id = ANY(%s) AND t.type = 'domain'
+        """, (scan_ids,))
+        return dict(cur.fetchall())
+
     def create_subdomain_snapshots(self, scan_ids: list):
         """创建子域名快照"""
         print("📸 创建子域名快照...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         if not scan_ids:
             print("  ⚠ 缺少扫描任务，跳过\n")
@@ -1418,17 +1603,12 @@ class TestDataGenerator:
         
         count = 0
         batch_data = []
+        scan_domains = self._get_scan_domain_names(scan_ids)
         for scan_id in scan_ids:  # 为所有扫描创建快照
             # 获取扫描对应的目标域名
-            cur.execute("""
-                SELECT t.name FROM scan s 
-                JOIN target t ON s.target_id = t.id 
-                WHERE s.id = %s AND t.type = 'domain'
-            """, (scan_id,))
-            row = cur.fetchone()
-            if not row:
+            target_name = scan_domains.get(scan_id)
+            if not target_name:
                 continue
-            target_name = row[0]
             
             num = random.randint(60, 100)
             selected = random.sample(prefixes, min(num, len(prefixes)))
@@ -1440,18 +1620,16 @@ class TestDataGenerator:
         
         # 批量插入
         if batch_data:
-            execute_values(cur, """
-                INSERT INTO subdomain_snapshot (scan_id, name, created_at)
-                VALUES %s
-                ON CONFLICT DO NOTHING
-            """, batch_data, template="(%s, %s, NOW())")
+            copy_rows(cur, 'subdomain_snapshot', [
+                'scan_id', 'name'
+            ], batch_data, binary=True)
                 
         print(f"  ✓ 创建了 {count} 个子域名快照\n")
 
     def create_website_snapshots(self, scan_ids: list):
         """创建网站快照"""
         print("📸 创建网站快照...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         if not scan_ids:
             print("  ⚠ 缺少扫描任务，跳过\n")
@@ -1477,16 +1655,11 @@ class TestDataGenerator:
         
         count = 0
         batch_data = []
+        scan_domains = self._get_scan_domain_names(scan_ids)
         for scan_id in scan_ids:  # 为所有扫描创建快照
-            cur.execute("""
-                SELECT t.name FROM scan s 
-                JOIN target t ON s.target_id = t.id 
-                WHERE s.id = %s AND t.type = 'domain'
-            """, (scan_id,))
-            row = cur.fetchone()
-            if not row:
+            target_name = scan_domains.get(scan_id)
+            if not target_name:
                 continue
-            target_name = row[0]
             
             for i in range(random.randint(30, 60)):
                 # 生成固定 245 长度的 URL
@@ -1514,21 +1687,18 @@ class TestDataGenerator:
         
         # 批量插入
         if batch_data:
-            execute_values(cur, """
-                INSERT INTO website_snapshot (
-                    scan_id, url, host, title, webserver, tech, status_code,
-                    content_length, content_type, location, response_body,
-                    response_headers, created_at
-                ) VALUES %s
-                ON CONFLICT DO NOTHING
-            """, batch_data, template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())")
+            copy_rows(cur, 'website_snapshot', [
+                'scan_id', 'url', 'host', 'title', 'webserver', 'tech', 'status_code',
+                'content_length', 'content_type', 'location', 'response_body',
+                'response_headers'
+            ], batch_data, binary=True)
                 
         print(f"  ✓ 创建了 {count} 个网站快照\n")
 
     def create_endpoint_snapshots(self, scan_ids: list):
         """创建端点快照"""
         print("📸 创建端点快照...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         if not scan_ids:
             print("  ⚠ 缺少扫描任务，跳过\n")
@@ -1574,16 +1744,11 @@ class TestDataGenerator:
         
         count = 0
         batch_data = []
+        scan_domains = self._get_scan_domain_names(scan_ids)
         for scan_id in scan_ids:  # 为所有扫描创建快照
-            cur.execute("""
-                SELECT t.name FROM scan s 
-                JOIN target t ON s.target_id = t.id 
-                WHERE s.id = %s AND t.type = 'domain'
-            """, (scan_id,))
-            row = cur.fetchone()
-            if not row:
+            target_name = scan_domains.get(scan_id)
+            if not target_name:
                 continue
-            target_name = row[0]
             
             for idx, path in enumerate(random.sample(paths, min(random.randint(40, 80), len(paths)))):
                 # 生成固定 245 长度的 URL
@@ -1622,21 +1787,18 @@ class TestDataGenerator:
         
         # 批量插入
         if batch_data:
-            execute_values(cur, """
-                INSERT INTO endpoint_snapshot (
-                    scan_id, url, host, title, status_code, content_length,
-                    location, webserver, content_type, tech, response_body,
-                    matched_gf_patterns, response_headers, created_at
-                ) VALUES %s
-                ON CONFLICT DO NOTHING
-            """, batch_data, template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())")
+            copy_rows(cur, 'endpoint_snapshot', [
+                'scan_id', 'url', 'host', 'title', 'status_code', 'content_length', 'location',
+                'webserver', 'content_type', 'tech', 'response_body', 'matched_gf_patterns',
+                'response_headers'
+            ], batch_data, binary=True)
                 
         print(f"  ✓ 创建了 {count} 个端点快照\n")
 
     def create_directory_snapshots(self, scan_ids: list):
         """创建目录快照"""
         print("📸 创建目录快照...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         if not scan_ids:
             print("  ⚠ 缺少扫描任务，跳过\n")
@@ -1660,16 +1822,11 @@ class TestDataGenerator:
         
         count = 0
         batch_data = []
+        scan_domains = self._get_scan_domain_names(scan_ids)
         for scan_id in scan_ids:  # 为所有扫描创建快照
-            cur.execute("""
-                SELECT t.name FROM scan s 
-                JOIN target t ON s.target_id = t.id 
-                WHERE s.id = %s AND t.type = 'domain'
-            """, (scan_id,))
-            row = cur.fetchone()
-            if not row:
+            target_name = scan_domains.get(scan_id)
+            if not target_name:
                 continue
-            target_name = row[0]
             
             for idx, d in enumerate(random.sample(dirs, min(random.randint(50, 80), len(dirs)))):
                 # 生成固定 245 长度的 URL
@@ -1684,20 +1841,17 @@ class TestDataGenerator:
         
         # 批量插入
         if batch_data:
-            execute_values(cur, """
-                INSERT INTO directory_snapshot (
-                    scan_id, url, status, content_length, words, lines,
-                    content_type, duration, created_at
-                ) VALUES %s
-                ON CONFLICT DO NOTHING
-            """, batch_data, template="(%s, %s, %s, %s, %s, %s, %s, %s, NOW())")
+            copy_rows(cur, 'directory_snapshot', [
+                'scan_id', 'url', 'status', 'content_length', 'words', 'lines', 'content_type',
+                'duration'
+            ], batch_data, binary=True)
                 
         print(f"  ✓ 创建了 {count} 个目录快照\n")
 
     def create_host_port_mapping_snapshots(self, scan_ids: list):
         """创建主机端口映射快照"""
         print("📸 创建主机端口映射快照...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         if not scan_ids:
             print("  ⚠ 缺少扫描任务，跳过\n")
@@ -1710,16 +1864,11 @@ class TestDataGenerator:
         
         count = 0
         batch_data = []
+        scan_domains = self._get_scan_domain_names(scan_ids)
         for scan_id in scan_ids:  # 为所有扫描创建快照
-            cur.execute("""
-                SELECT t.name FROM scan s 
-                JOIN target t ON s.target_id = t.id 
-                WHERE s.id = %s AND t.type = 'domain'
-            """, (scan_id,))
-            row = cur.fetchone()
-            if not row:
+            target_name = scan_domains.get(scan_id)
+            if not target_name:
                 continue
-            target_name = row[0]
             
             # 生成多个随机 IP
             for _ in range(random.randint(10, 20)):
@@ -1731,19 +1880,16 @@ class TestDataGenerator:
         
         # 批量插入
         if batch_data:
-            execute_values(cur, """
-                INSERT INTO host_port_mapping_snapshot (
-                    scan_id, host, ip, port, created_at
-                ) VALUES %s
-                ON CONFLICT DO NOTHING
-            """, batch_data, template="(%s, %s, %s, %s, NOW())")
+            copy_rows(cur, 'host_port_mapping_snapshot', [
+                'scan_id', 'host', 'ip', 'port'
+            ], batch_data, binary=True)
                 
         print(f"  ✓ 创建了 {count} 个主机端口映射快照\n")
 
     def create_vulnerability_snapshots(self, scan_ids: list):
         """创建漏洞快照"""
         print("📸 创建漏洞快照...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         if not scan_ids:
             print("  ⚠ 缺少扫描任务，跳过\n")
@@ -1776,16 +1922,11 @@ class TestDataGenerator:
         
         count = 0
         batch_data = []
+        scan_domains = self._get_scan_domain_names(scan_ids)
         for scan_id in scan_ids:  # 为所有扫描创建快照
-            cur.execute("""
-                SELECT t.name FROM scan s 
-                JOIN target t ON s.target_id = t.id 
-                WHERE s.id = %s AND t.type = 'domain'
-            """, (scan_id,))
-            row = cur.fetchone()
-            if not row:
+            target_name = scan_domains.get(scan_id)
+            if not target_name:
                 continue
-            target_name = row[0]
             
             for idx in range(random.randint(30, 60)):
                 severity = random.choice(severities)
@@ -1812,19 +1953,17 @@ class TestDataGenerator:
         
         # 批量插入
         if batch_data:
-            execute_values(cur, """
-                INSERT INTO vulnerability_snapshot (
-                    scan_id, url, vuln_type, severity, source, cvss_score,
-                    description, raw_output, created_at
-                ) VALUES %s
-            """, batch_data, template="(%s, %s, %s, %s, %s, %s, %s, %s, NOW())")
+            copy_rows(cur, 'vulnerability_snapshot', [
+                'scan_id', 'url', 'vuln_type', 'severity', 'source', 'cvss_score', 'description',
+                'raw_output'
+            ], batch_data, conflict='', binary=True)
                 
         print(f"  ✓ 创建了 {count} 个漏洞快照\n")
 
     def create_ehole_fingerprints(self):
         """创建 EHole 指纹数据"""
         print("🔍 创建 EHole 指纹...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         # CMS/产品名称模板（长名称）
         cms_templates = [
@@ -1911,7 +2050,7 @@ class TestDataGenerator:
     def create_goby_fingerprints(self):
         """创建 Goby 指纹数据"""
         print("🔍 创建 Goby 指纹...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         # 产品名称模板（长名称）
         name_templates = [
@@ -1990,7 +2129,7 @@ class TestDataGenerator:
     def create_wappalyzer_fingerprints(self):
         """创建 Wappalyzer 指纹数据"""
         print("🔍 创建 Wappalyzer 指纹...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         # 应用名称模板（长名称）
         name_templates = [
@@ -2107,7 +2246,7 @@ class TestDataGenerator:
     def create_fingers_fingerprints(self):
         """创建 Fingers 指纹数据"""
         print("🔍 创建 Fingers 指纹...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         # 应用名称模板（长名称）
         name_templates = [
@@ -2223,7 +2362,7 @@ class TestDataGenerator:
     def create_fingerprinthub_fingerprints(self):
         """创建 FingerPrintHub 指纹数据"""
         print("🔍 创建 FingerPrintHub 指纹...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         # FP ID 前缀
         fp_id_prefixes = [
@@ -2384,7 +2523,7 @@ class TestDataGenerator:
     def create_arl_fingerprints(self):
         """创建 ARL 指纹数据"""
         print("🔍 创建 ARL 指纹...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         # 应用名称模板
         name_templates = [
@@ -2484,13 +2623,34 @@ class MillionDataGenerator:
     - 历史统计: 7天
     """
     
+    # 批量写入期间临时删除普通索引的资产表
+    BULK_TABLES = ['subdomain', 'website', 'endpoint', 'host_port_mapping', 'vulnerability']
+    
+    # 只依赖 target 的资产生成方法，互不依赖，可并行执行
+    ASSET_CREATORS = [
+        'create_subdomains', 'create_websites', 'create_endpoints',
+        'create_host_port_mappings', 'create_vulnerabilities',
+    ]
+    
+    # 服务端批量生成时的域名目标：base 为该目标在全局序号中的起点，配合 generate_series 控制总数
+    DOMAIN_TARGETS_SQL = """
+        SELECT id, name, (row_number() OVER (ORDER BY id) - 1) * %(per_target)s AS base
+        FROM target WHERE type = 'domain' AND deleted_at IS NULL
+    """
+    
     def __init__(self, clear: bool = False):
         self.conn = psycopg2.connect(**DB_CONFIG)
         self.conn.autocommit = False
+        # 整个生成过程复用同一个游标
+        self.cur = self.conn.cursor()
         self.clear = clear
+        self._saved_indexes = []
         
     def run(self):
         try:
+            # 测试数据可重新生成，关闭同步提交省去每次提交等待 WAL 落盘
+            self.cur.execute("SET synchronous_commit = OFF")
+            
             if self.clear:
                 print("🗑️  清除现有数据...")
                 self.clear_data()
@@ -2498,11 +2658,15 @@ class MillionDataGenerator:
             print("🚀 开始生成百万级测试数据(用于 Dashboard 溢出测试)...\n")
             
             target_ids = self.create_targets()
-            self.create_subdomains(target_ids)
-            self.create_websites(target_ids)
-            self.create_endpoints(target_ids)
-            self.create_host_port_mappings(target_ids)
-            self.create_vulnerabilities(target_ids)
+            self._suspend_indexes(self.BULK_TABLES)
+            try:
+                self._create_assets_parallel(target_ids)
+            except Exception:
+                self.conn.rollback()
+                raise
+            finally:
+                # 已提交的批次不会回滚，失败时同样要把索引建回去
+                self._restore_indexes()
             self.create_statistics_history()  # 生成趋势图数据
             self.update_asset_statistics()
             
@@ -2518,7 +2682,7 @@ class MillionDataGenerator:
 
     def clear_data(self):
         """清除所有测试数据"""
-        cur = self.conn.cursor()
+        cur = self.cur
         tables = [
             'vulnerability_snapshot', 'host_port_mapping_snapshot', 'directory_snapshot',
             'endpoint_snapshot', 'website_snapshot', 'subdomain_snapshot',
@@ -2527,18 +2691,75 @@ class MillionDataGenerator:
             'organization_targets', 'target', 'organization',
             'statistics_history', 'asset_statistics',
         ]
-        for table in tables:
-            try:
-                cur.execute(f"DELETE FROM {table}")
-            except Exception:
-                pass  # 表可能不存在
+        # 表可能不存在，只清空已存在的表
+        cur.execute("SELECT t FROM unnest(%s::text[]) AS t WHERE to_regclass(t) IS NOT NULL", (tables,))
+        existing = [row[0] for row in cur.fetchall()]
+        if existing:
+            cur.execute(f"TRUNCATE TABLE {', '.join(existing)} RESTART IDENTITY CASCADE")
         self.conn.commit()
         print("  ✓ 数据清除完成\n")
 
+    def _create_assets_parallel(self, target_ids: list):
+        """
+        每个资产生成方法在独立进程、独立连接中并行执行
+        
+        子进程只能看到已提交的数据，调用前 target 必须已提交（_suspend_indexes 会提交）
+        """
+        # spawn 启动的子进程不继承父进程的数据库连接
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=len(self.ASSET_CREATORS), mp_context=context) as executor:
+            futures = [
+                executor.submit(_run_million_creator, method_name, target_ids)
+                for method_name in self.ASSET_CREATORS
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+    def _million_per_target(self, total: int) -> int:
+        """把 total 条记录平均分配到所有域名目标时每个目标的数量"""
+        self.cur.execute("SELECT count(*) FROM target WHERE type = 'domain' AND deleted_at IS NULL")
+        return total // self.cur.fetchone()[0] + 1
+
+    def _suspend_indexes(self, tables: list):
+        """
+        删除表上的普通索引，批量写入完成后由 _restore_indexes 重建
+        
+        唯一索引和主键保留：ON CONFLICT 依赖它们判断冲突
+        """
+        cur = self.cur
+        cur.execute("""
+            SELECT ci.relname, pg_get_indexdef(i.indexrelid)
+            FROM pg_index i
+            JOIN pg_class ci ON ci.oid = i.indexrelid
+            JOIN pg_class ct ON ct.oid = i.indrelid
+            WHERE ct.relname = ANY(%s) AND ct.relnamespace = 'public'::regnamespace
+              AND NOT i.indisunique AND NOT i.indisprimary
+        """, (tables,))
+        self._saved_indexes = cur.fetchall()
+        for name, _ in self._saved_indexes:
+            cur.execute(f'DROP INDEX "{name}"')
+        self.conn.commit()
+        print(f"  ✓ 暂时删除 {len(self._saved_indexes)} 个索引\n")
+
+    def _restore_indexes(self):
+        """按保存的定义重建 _suspend_indexes 删除的索引"""
+        if not self._saved_indexes:
+            return
+        print("🔧 重建索引...")
+        cur = self.cur
+        # 加大排序内存并允许并行构建 B-tree
+        cur.execute("SET LOCAL maintenance_work_mem = '1GB'")
+        cur.execute("SET LOCAL max_parallel_maintenance_workers = 4")
+        for _, indexdef in self._saved_indexes:
+            cur.execute(indexdef)
+        self.conn.commit()
+        print(f"  ✓ 重建了 {len(self._saved_indexes)} 个索引\n")
+        self._saved_indexes = []
+
     def create_targets(self) -> list:
         """创建 1000 个扫描目标"""
         print("🎯 创建扫描目标 (1,000 个)...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         suffix = random.randint(1000, 9999)
         domains = [
@@ -2548,18 +2769,17 @@ class MillionDataGenerator:
         ]
         tlds = ['.com', '.io', '.net', '.org', '.dev', '.app', '.cloud', '.tech']
         
-        ids = []
-        for i in range(1000):
-            domain = f'{random.choice(domains)}-{suffix}-{i:04d}{random.choice(tlds)}'
-            cur.execute("""
-                INSERT INTO target (name, type, created_at, deleted_at)
-                VALUES (%s, 'domain', NOW() - INTERVAL '%s days', NULL)
-                ON CONFLICT DO NOTHING
-                RETURNING id
-            """, (domain, random.randint(0, 365)))
-            row = cur.fetchone()
-            if row:
-                ids.append(row[0])
+        batch_data = [
+            (f'{random.choice(domains)}-{suffix}-{i:04d}{random.choice(tlds)}', random.randint(0, 365))
+            for i in range(1000)
+        ]
+        rows = execute_values(cur, """
+            INSERT INTO target (name, type, created_at, deleted_at)
+            VALUES %s
+            ON CONFLICT DO NOTHING
+            RETURNING id
+        """, batch_data, template="(%s, 'domain', NOW() - INTERVAL '%s days', NULL)", page_size=1000, fetch=True)
+        ids = [row[0] for row in rows]
                 
         print(f"  ✓ 创建了 {len(ids)} 个扫描目标\n")
         return ids
@@ -2567,7 +2787,7 @@ class MillionDataGenerator:
     def create_subdomains(self, target_ids: list):
         """创建 200,000 个子域名"""
         print("🌐 创建子域名 (200,000 个)...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         prefixes = [
             'api', 'admin', 'portal', 'dashboard', 'app', 'mobile', 'staging', 'dev',
@@ -2582,102 +2802,68 @@ class MillionDataGenerator:
         ]
         secondary = ['', 'prod-', 'dev-', 'staging-', 'test-', 'us-', 'eu-', 'ap-']
         
-        cur.execute("SELECT id, name FROM target WHERE type = 'domain' AND deleted_at IS NULL")
-        domain_targets = cur.fetchall()
-        
-        count = 0
-        batch_data = []
-        batch_size = 50000  # 增加批量大小
         target_count = 200000
-        per_target = target_count // len(domain_targets) + 1
         
-        for target_id, target_name in domain_targets:
-            for i in range(per_target):
-                if count >= target_count:
-                    break
-                prefix = random.choice(prefixes)
-                sec = random.choice(secondary)
-                subdomain_name = f'{sec}{prefix}-{i:04d}.{target_name}'
-                batch_data.append((subdomain_name, target_id, random.randint(0, 90)))
-                count += 1
-                
-                if len(batch_data) >= batch_size:
-                    execute_values(cur, """
-                        INSERT INTO subdomain (name, target_id, created_at)
-                        VALUES %s ON CONFLICT DO NOTHING
-                    """, batch_data, template="(%s, %s, NOW() - INTERVAL '%s days')")
-                    self.conn.commit()  # 每批次提交
-                    batch_data = []
-                    print(f"    ✓ {count:,} / {target_count:,}")
-            if count >= target_count:
-                break
-        
-        if batch_data:
-            execute_values(cur, """
-                INSERT INTO subdomain (name, target_id, created_at)
-                VALUES %s ON CONFLICT DO NOTHING
-            """, batch_data, template="(%s, %s, NOW() - INTERVAL '%s days')")
-            self.conn.commit()
+        # 由数据库用 generate_series 直接生成，不经过 Python 逐行构造和传输
+        cur.execute(f"""
+            WITH t AS ({self.DOMAIN_TARGETS_SQL})
+            INSERT INTO subdomain (name, target_id, created_at)
+            SELECT {sql_pick('secondary')} || {sql_pick('prefixes')} || '-' || lpad(g::text, 4, '0') || '.' || t.name,
+                   t.id, NOW() - floor(random() * 91)::int * INTERVAL '1 day'
+            FROM t CROSS JOIN generate_series(0, %(per_target)s - 1) AS g
+            WHERE t.base + g < %(total)s
+            ON CONFLICT DO NOTHING
+        """, {
+            'prefixes': prefixes, 'secondary': secondary,
+            'per_target': self._million_per_target(target_count), 'total': target_count,
+        })
+        count = cur.rowcount
+        self.conn.commit()
                 
         print(f"  ✓ 创建了 {count:,} 个子域名\n")
 
     def create_websites(self, target_ids: list):
         """创建 200,000 个网站"""
         print("🌍 创建网站 (200,000 个)...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         cur.execute("SELECT id, name FROM target WHERE type = 'domain' AND deleted_at IS NULL")
         domain_targets = cur.fetchall()
         
-        count = 0
-        batch_data = []
-        batch_size = 50000  # 增加批量大小
         target_count = 200000
         per_target = target_count // len(domain_targets) + 1
         
-        for target_id, target_name in domain_targets:
-            for i in range(per_target):
-                if count >= target_count:
-                    break
-                # 生成固定 245 长度的 URL
-                url = generate_fixed_length_url(target_name, length=245, path_hint=f'million-website/{i:06d}')
-                
-                batch_data.append((
-                    url, target_id, target_name, f'Website Title {count}',
-                    'nginx/1.24.0', ['React', 'Node.js'],
-                    random.choice([200, 301, 403]), random.randint(1000, 50000),
-                    'text/html', '', '<!DOCTYPE html><html></html>'
-                ))
-                count += 1
-                
-                if len(batch_data) >= batch_size:
-                    execute_values(cur, """
-                        INSERT INTO website (url, target_id, host, title, webserver, tech, 
-                            status_code, content_length, content_type, location, response_body, 
-                            vhost, response_headers, created_at)
-                        VALUES %s ON CONFLICT DO NOTHING
-                    """, batch_data, template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NULL, '', NOW())")
-                    self.conn.commit()
-                    batch_data = []
-                    print(f"    ✓ {count:,} / {target_count:,}")
-            if count >= target_count:
-                break
+        def rows():
+            count = 0
+            for target_id, target_name in domain_targets:
+                for i in range(per_target):
+                    # 生成固定 245 长度的 URL
+                    url = generate_fixed_length_url(target_name, length=245, path_hint=f'million-website/{i:06d}')
+                    
+                    yield (
+                        url, target_id, target_name, f'Website Title {count}',
+                        'nginx/1.24.0', ['React', 'Node.js'],
+                        random.choice([200, 301, 403]), random.randint(1000, 50000),
+                        'text/html', '', '<!DOCTYPE html><html></html>'
+                    )
+                    count += 1
         
-        if batch_data:
-            execute_values(cur, """
-                INSERT INTO website (url, target_id, host, title, webserver, tech, 
-                    status_code, content_length, content_type, location, response_body, 
-                    vhost, response_headers, created_at)
-                VALUES %s ON CONFLICT DO NOTHING
-            """, batch_data, template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NULL, '', NOW())")
+        count = 0
+        for batch_data in chunked(islice(rows(), target_count), MILLION_BATCH_SIZE):
+            copy_rows(cur, 'website', [
+                'url', 'target_id', 'host', 'title', 'webserver', 'tech', 'status_code',
+                'content_length', 'content_type', 'location', 'response_body'
+            ], batch_data, extra={'vhost': 'NULL', 'response_headers': "''", 'created_at': 'NOW()'})
             self.conn.commit()
+            count += len(batch_data)
+            print(f"    ✓ {count:,} / {target_count:,}")
                 
         print(f"  ✓ 创建了 {count:,} 个网站\n")
 
     def create_endpoints(self, target_ids: list):
         """创建 200,000 个端点"""
         print("🔗 创建端点 (200,000 个)...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         paths = ['/api/v1/', '/api/v2/', '/admin/', '/portal/', '/graphql/', '/health/', '/metrics/']
         
@@ -2708,112 +2894,74 @@ class MillionDataGenerator:
         cur.execute("SELECT id, name FROM target WHERE type = 'domain' AND deleted_at IS NULL")
         domain_targets = cur.fetchall()
         
-        count = 0
-        batch_data = []
-        batch_size = 50000  # 增加批量大小
         target_count = 200000
         per_target = target_count // len(domain_targets) + 1
         
-        for target_id, target_name in domain_targets:
-            for i in range(per_target):
-                if count >= target_count:
-                    break
-                # 生成固定 245 长度的 URL
-                url = generate_fixed_length_url(target_name, length=245, path_hint=f'million-endpoint/{i:06d}')
-                
-                # 生成 100 字符的标题
-                title = random.choice(titles)
-                
-                # 生成 10-20 个技术
-                num_techs = random.randint(10, 20)
-                tech_list = random.sample(all_techs, min(num_techs, len(all_techs)))
-                
-                # 生成 10-20 个 tags
-                num_tags = random.randint(10, 20)
-                tags = random.sample(all_tags, min(num_tags, len(all_tags)))
-                
-                batch_data.append((
-                    url, target_id, target_name, title,
-                    'nginx/1.24.0', random.choice([200, 201, 401, 403]),
-                    random.randint(100, 5000), 'application/json',
-                    tech_list, '', '{"status":"ok"}', None, tags
-                ))
-                count += 1
-                
-                if len(batch_data) >= batch_size:
-                    execute_values(cur, """
-                        INSERT INTO endpoint (url, target_id, host, title, webserver, status_code,
-                            content_length, content_type, tech, location, response_body, vhost, 
-                            matched_gf_patterns, response_headers, created_at)
-                        VALUES %s ON CONFLICT DO NOTHING
-                    """, batch_data, template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, '', NOW())")
-                    self.conn.commit()
-                    batch_data = []
-                    print(f"    ✓ {count:,} / {target_count:,}")
-            if count >= target_count:
-                break
+        def rows():
+            for target_id, target_name in domain_targets:
+                for i in range(per_target):
+                    # 生成固定 245 长度的 URL
+                    url = generate_fixed_length_url(target_name, length=245, path_hint=f'million-endpoint/{i:06d}')
+                    
+                    # 生成 100 字符的标题
+                    title = random.choice(titles)
+                    
+                    # 生成 10-20 个技术
+                    num_techs = random.randint(10, 20)
+                    tech_list = random.sample(all_techs, min(num_techs, len(all_techs)))
+                    
+                    # 生成 10-20 个 tags
+                    num_tags = random.randint(10, 20)
+                    tags = random.sample(all_tags, min(num_tags, len(all_tags)))
+                    
+                    yield (
+                        url, target_id, target_name, title,
+                        'nginx/1.24.0', random.choice([200, 201, 401, 403]),
+                        random.randint(100, 5000), 'application/json',
+                        tech_list, '', '{"status":"ok"}', None, tags
+                    )
         
-        if batch_data:
-            execute_values(cur, """
-                INSERT INTO endpoint (url, target_id, host, title, webserver, status_code,
-                    content_length, content_type, tech, location, response_body, vhost, 
-                    matched_gf_patterns, response_headers, created_at)
-                VALUES %s ON CONFLICT DO NOTHING
-            """, batch_data, template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, '', NOW())")
+        count = 0
+        for batch_data in chunked(islice(rows(), target_count), MILLION_BATCH_SIZE):
+            copy_rows(cur, 'endpoint', [
+                'url', 'target_id', 'host', 'title', 'webserver', 'status_code',
+                'content_length', 'content_type', 'tech', 'location', 'response_body',
+                'vhost', 'matched_gf_patterns'
+            ], batch_data, extra={'response_headers': "''", 'created_at': 'NOW()'})
             self.conn.commit()
+            count += len(batch_data)
+            print(f"    ✓ {count:,} / {target_count:,}")
                 
         print(f"  ✓ 创建了 {count:,} 个端点\n")
 
     def create_host_port_mappings(self, target_ids: list):
         """创建 200,000 个主机端口映射(用于 IP 统计)"""
         print("🔌 创建主机端口映射 (200,000 个)...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         ports = [22, 80, 443, 3306, 5432, 6379, 8080, 8443, 9000, 9200, 27017]
         
-        cur.execute("SELECT id, name FROM target WHERE type = 'domain' AND deleted_at IS NULL")
-        domain_targets = cur.fetchall()
-        
-        count = 0
-        batch_data = []
-        batch_size = 50000  # 增加批量大小
         target_count = 200000
-        per_target = target_count // len(domain_targets) + 1
         
-        for target_id, target_name in domain_targets:
-            for i in range(per_target):
-                if count >= target_count:
-                    break
-                ip = f'192.168.{random.randint(1, 254)}.{random.randint(1, 254)}'
-                port = random.choice(ports)
-                
-                batch_data.append((target_id, target_name, ip, port))
-                count += 1
-                
-                if len(batch_data) >= batch_size:
-                    execute_values(cur, """
-                        INSERT INTO host_port_mapping (target_id, host, ip, port, created_at)
-                        VALUES %s ON CONFLICT DO NOTHING
-                    """, batch_data, template="(%s, %s, %s, %s, NOW())")
-                    self.conn.commit()
-                    batch_data = []
-                    print(f"    ✓ {count:,} / {target_count:,}")
-            if count >= target_count:
-                break
-        
-        if batch_data:
-            execute_values(cur, """
-                INSERT INTO host_port_mapping (target_id, host, ip, port, created_at)
-                VALUES %s ON CONFLICT DO NOTHING
-            """, batch_data, template="(%s, %s, %s, %s, NOW())")
-            self.conn.commit()
+        cur.execute(f"""
+            WITH t AS ({self.DOMAIN_TARGETS_SQL})
+            INSERT INTO host_port_mapping (target_id, host, ip, port, created_at)
+            SELECT t.id, t.name,
+                   ('192.168.' || (1 + floor(random() * 254))::int || '.' || (1 + floor(random() * 254))::int)::inet,
+                   {sql_pick('ports')}, NOW()
+            FROM t CROSS JOIN generate_series(0, %(per_target)s - 1) AS g
+            WHERE t.base + g < %(total)s
+            ON CONFLICT DO NOTHING
+        """, {'ports': ports, 'per_target': self._million_per_target(target_count), 'total': target_count})
+        count = cur.rowcount
+        self.conn.commit()
                 
         print(f"  ✓ 创建了 {count:,} 个主机端口映射\n")
 
     def create_vulnerabilities(self, target_ids: list):
         """创建 200,000 个漏洞 (critical: 50k, high: 50k, medium: 50k, low: 30k, info: 20k)"""
         print("🐛 创建漏洞 (200,000 个)...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         vuln_types = [
             'sql-injection-authentication-bypass-vulnerability-',
@@ -2842,71 +2990,48 @@ class MillionDataGenerator:
             'info': 20000,
         }
         
-        cur.execute("SELECT id, name FROM target WHERE type = 'domain' AND deleted_at IS NULL")
-        domain_targets = cur.fetchall()
+        cvss_ranges = {
+            'critical': (9.0, 10.0), 'high': (7.0, 8.9), 'medium': (4.0, 6.9),
+            'low': (0.1, 3.9), 'info': (0.0, 0.0)
+        }
+        # 描述取自 Python 生成的固定 300 长度文本，由数据库随机挑选
+        descriptions = list({generate_fixed_length_text(length=300, text_type='description') for _ in range(20)})
         
         count = 0
-        batch_data = []
-        batch_size = 50000  # 增加批量大小
-        
         for severity, target_count in severity_counts.items():
             print(f"    创建 {severity} 级别漏洞: {target_count:,} 个")
-            cvss_ranges = {
-                'critical': (9.0, 10.0), 'high': (7.0, 8.9), 'medium': (4.0, 6.9),
-                'low': (0.1, 3.9), 'info': (0.0, 0.0)
-            }
-            cvss_range = cvss_ranges.get(severity, (0.0, 10.0))
+            low, high = cvss_ranges.get(severity, (0.0, 10.0))
             
-            severity_count = 0
-            per_target = target_count // len(domain_targets) + 1
-            
-            for target_id, target_name in domain_targets:
-                for i in range(per_target):
-                    if severity_count >= target_count:
-                        break
-                    
-                    cvss_score = round(random.uniform(*cvss_range), 1)
-                    # 生成固定 245 长度的 URL
-                    url = generate_fixed_length_url(target_name, length=245, path_hint=f'million-vuln/{severity_count:06d}')
-                    
-                    # 生成固定 300 长度的描述
-                    description = generate_fixed_length_text(length=300, text_type='description')
-                    
-                    batch_data.append((
-                        target_id, url, random.choice(vuln_types), severity,
-                        random.choice(sources), cvss_score,
-                        description,
-                        json.dumps({'template': f'CVE-2024-{random.randint(10000, 99999)}'})
-                    ))
-                    severity_count += 1
-                    count += 1
-                    
-                    if len(batch_data) >= batch_size:
-                        execute_values(cur, """
-                            INSERT INTO vulnerability (target_id, url, vuln_type, severity, source,
-                                cvss_score, description, raw_output, created_at)
-                            VALUES %s
-                        """, batch_data, template="(%s, %s, %s, %s, %s, %s, %s, %s, NOW())")
-                        self.conn.commit()
-                        batch_data = []
-                        print(f"      ✓ {severity_count:,} / {target_count:,}")
-                if severity_count >= target_count:
-                    break
-        
-        if batch_data:
-            execute_values(cur, """
+            # URL 固定 245 长度：路径带序号保证唯一，不足部分用 x 填充
+            cur.execute(f"""
+                WITH t AS ({self.DOMAIN_TARGETS_SQL})
                 INSERT INTO vulnerability (target_id, url, vuln_type, severity, source,
                     cvss_score, description, raw_output, created_at)
-                VALUES %s
-            """, batch_data, template="(%s, %s, %s, %s, %s, %s, %s, %s, NOW())")
+                SELECT t.id,
+                       rpad('https://' || t.name || '/million-vuln/' || lpad((t.base + g)::text, 6, '0')
+                            || '?p1=' || (10000000 + floor(random() * 90000000))::int || '&', 245, 'x'),
+                       {sql_pick('vuln_types')}, %(severity)s, {sql_pick('sources')},
+                       round((%(low)s + random() * (%(high)s - %(low)s))::numeric, 1),
+                       {sql_pick('descriptions')},
+                       jsonb_build_object('template', 'CVE-2024-' || (10000 + floor(random() * 90000))::int),
+                       NOW()
+                FROM t CROSS JOIN generate_series(0, %(per_target)s - 1) AS g
+                WHERE t.base + g < %(total)s
+            """, {
+                'vuln_types': vuln_types, 'sources': sources, 'descriptions': descriptions,
+                'severity': severity, 'low': low, 'high': high,
+                'per_target': self._million_per_target(target_count), 'total': target_count,
+            })
             self.conn.commit()
+            count += cur.rowcount
+            print(f"      ✓ {cur.rowcount:,} / {target_count:,}")
                 
         print(f"  ✓ 创建了 {count:,} 个漏洞\n")
 
     def create_statistics_history(self):
         """创建 7 天的统计历史数据(用于趋势图)"""
         print("📈 创建统计历史数据 (7 天)...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
         # 先清除旧的历史数据
         cur.execute("DELETE FROM statistics_history")
@@ -2955,26 +3080,20 @@ class MillionDataGenerator:
     def update_asset_statistics(self):
         """更新资产统计表(Dashboard 卡片使用)"""
         print("📊 更新资产统计表...")
-        cur = self.conn.cursor()
+        cur = self.cur
         
-        # 统计实际数据
-        cur.execute("SELECT COUNT(*) FROM target WHERE deleted_at IS NULL")
-        total_targets = cur.fetchone()[0]
-        
-        cur.execute("SELECT COUNT(*) FROM subdomain")
-        total_subdomains = cur.fetchone()[0]
-        
-        cur.execute("SELECT COUNT(DISTINCT ip) FROM host_port_mapping")
-        total_ips = cur.fetchone()[0]
-        
-        cur.execute("SELECT COUNT(*) FROM endpoint")
-        total_endpoints = cur.fetchone()[0]
-        
-        cur.execute("SELECT COUNT(*) FROM website")
-        total_websites = cur.fetchone()[0]
-        
-        cur.execute("SELECT COUNT(*) FROM vulnerability")
-        total_vulns = cur.fetchone()[0]
+        # 统计实际数据（一次查询取回全部计数）
+        cur.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM target WHERE deleted_at IS NULL),
+                (SELECT COUNT(*) FROM subdomain),
+                (SELECT COUNT(DISTINCT ip) FROM host_port_mapping),
+                (SELECT COUNT(*) FROM endpoint),
+                (SELECT COUNT(*) FROM website),
+                (SELECT COUNT(*) FROM vulnerability)
+        """)
+        (total_targets, total_subdomains, total_ips,
+         total_endpoints, total_websites, total_vulns) = cur.fetchone()
         
         total_assets = total_subdomains + total_ips + total_endpoints + total_websites
         
@@ -3022,6 +3141,18 @@ class MillionDataGenerator:
         print(f"    - 总资产: {total_assets:,}\n")
 
 
+def _run_million_creator(method_name: str, target_ids: list) -> str:
+    """子进程入口：用独立连接执行 MillionDataGenerator 的一个 create_* 方法"""
+    generator = MillionDataGenerator()
+    try:
+        generator.cur.execute("SET synchronous_commit = OFF")
+        getattr(generator, method_name)(target_ids)
+        generator.conn.commit()
+    finally:
+        generator.conn.close()
+    return method_name
+
+
 def main():
     parser = argparse.ArgumentParser(description="直接通过 SQL 生成测试数据")
     parser.add_argument('--clear', action='store_true', help='清除现有数据后重新生成')